@@ -0,0 +1,79 @@
+"""
+출력 형식별 저장 벤치마크
+
+같은 데이터를 그룹별로 xlsx, csv, parquet, feather 형식으로 저장하는 시간과
+출력 크기를 비교합니다. 읽기와 그룹 분할 시간은 포함하지 않습니다.
+
+사용 예:
+    python benchmarks/bench_formats.py --rows 200000 --groups 100
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.columnar_writer import COLUMNAR_FORMATS, write_hive_dataset
+from services.parallel_writer import save_frame
+from services.partitioner import partition_frame
+
+
+def make_frame(rows, groups, seed=0):
+    """벤치마크용 DataFrame 생성 (첫 번째 열이 그룹 키)"""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(0, groups, size=rows)
+    return pd.DataFrame({
+        "cost_center": pd.Series(keys).map(lambda k: f"CC{k:05d}"),
+        "employee": rng.integers(0, 1_000_000, size=rows),
+        "name": pd.Series(rng.integers(0, 5000, size=rows)).map(lambda k: f"직원{k}"),
+        "amount": rng.random(rows) * 10000,
+    })
+
+
+def folder_size(folder):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(folder) for name in names)
+
+
+def measure(output_format, df, folder):
+    start = time.perf_counter()
+    if output_format in COLUMNAR_FORMATS:
+        write_hive_dataset(df, 0, folder, output_format)
+    else:
+        ext = ".xlsx" if output_format == "xlsx" else ".csv"
+        for i, (_, part) in enumerate(partition_frame(df, 0)):
+            save_frame(part, os.path.join(folder, f"part_{i}{ext}"))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="출력 형식별 저장 벤치마크")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--formats", nargs="+", default=["xlsx", "csv", "parquet", "feather"])
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.groups)
+    print(f"{'format':>8} {'seconds':>9} {'rows/s':>12} {'MB':>8}")
+    for output_format in args.formats:
+        folder = tempfile.mkdtemp(prefix=f"bench-{output_format}-")
+        try:
+            elapsed = measure(output_format, df, folder)
+            size = folder_size(folder) / 1024 ** 2
+            print(f"{output_format:>8} {elapsed:>9.3f} {args.rows / elapsed:>12,.0f} {size:>8.1f}")
+        except ValueError as e:
+            print(f"{output_format:>8} 건너뜀: {e}")
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
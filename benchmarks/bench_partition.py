@@ -0,0 +1,72 @@
+"""
+그룹 분할 벤치마크
+
+기존 방식(고유 값마다 불리언 마스크)과 단일 패스 분할(partition_frame)의
+소요 시간을 그룹 수별로 비교합니다. 파일 저장은 포함하지 않습니다.
+
+사용 예:
+    python benchmarks/bench_partition.py --rows 400000 --groups 10 100 1000 3000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.partitioner import partition_frame
+
+
+def make_frame(rows, groups, seed=0):
+    """벤치마크용 DataFrame 생성 (첫 번째 열이 그룹 키)"""
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(0, groups, size=rows)
+    return pd.DataFrame({
+        "cost_center": pd.Series(keys).map(lambda k: f"CC{k:05d}"),
+        "employee": rng.integers(0, 1_000_000, size=rows),
+        "amount": rng.random(rows) * 10000,
+    })
+
+
+def legacy_partition(df, column_idx):
+    """기존 parse_data의 분할 방식"""
+    for value in df.iloc[:, column_idx].unique():
+        yield value, df[df.iloc[:, column_idx] == value]
+
+
+def measure(func, df):
+    start = time.perf_counter()
+    rows = 0
+    for _, part in func(df, 0):
+        rows += len(part)
+    elapsed = time.perf_counter() - start
+    assert rows == len(df)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="그룹 분할 벤치마크")
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--groups", type=int, nargs="+", default=[10, 100, 1000, 3000])
+    parser.add_argument("--skip-legacy-above", type=int, default=5000,
+                        help="이 그룹 수를 넘으면 기존 방식 측정을 건너뜀")
+    args = parser.parse_args()
+
+    print(f"{'groups':>8} {'legacy(s)':>12} {'single-pass(s)':>15} {'speedup':>9}")
+    for groups in args.groups:
+        df = make_frame(args.rows, groups)
+        fast = measure(partition_frame, df)
+        if groups <= args.skip_legacy_above:
+            legacy = measure(legacy_partition, df)
+            print(f"{groups:>8} {legacy:>12.3f} {fast:>15.3f} {legacy / fast:>8.1f}x")
+        else:
+            print(f"{groups:>8} {'-':>12} {fast:>15.3f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
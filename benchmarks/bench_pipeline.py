@@ -0,0 +1,196 @@
+"""
+분할 파이프라인 단계별 벤치마크
+
+합성 엑셀 파일(synthetic.py)로 읽기(read_excel), 그룹 분할, 그룹별 저장(write_excel),
+전체 처리(parse_data) 단계의 소요 시간과 최대 메모리(tracemalloc)를 측정해 JSON으로 저장합니다.
+--baseline으로 이전 결과 파일을 지정하면 단계별로 비교하고, 기준보다 threshold 이상 느려진
+단계가 있으면 종료 코드 1을 반환합니다.
+
+사용 예:
+    python benchmarks/bench_pipeline.py --scenarios small medium --output bench.json
+    python benchmarks/bench_pipeline.py --output new.json --baseline bench.json --threshold 0.2
+    python benchmarks/bench_pipeline.py --scenarios medium --rows 500000 --skew 1.5
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.excel_parse_service import ExcelParseService
+from services.partitioner import partition_frame
+from synthetic import make_workbook
+
+# 시나리오 이름 -> 합성 파일 인자
+SCENARIOS = {
+    "small": {"rows": 20_000, "cols": 5, "groups": 20, "skew": 0.0, "string_width": 8},
+    "medium": {"rows": 200_000, "cols": 8, "groups": 300, "skew": 0.0, "string_width": 12},
+    "many-groups": {"rows": 200_000, "cols": 5, "groups": 5_000, "skew": 0.0, "string_width": 8},
+    "skewed": {"rows": 200_000, "cols": 5, "groups": 1_000, "skew": 1.5, "string_width": 8},
+    "wide": {"rows": 20_000, "cols": 100, "groups": 50, "skew": 0.0, "string_width": 16},
+}
+
+STAGES = ("read", "partition", "write", "parse_data")
+
+
+def run_stages(input_path, work_dir, reader, workers, trace_memory=False):
+    """
+    단계별로 한 번 실행
+
+    Returns:
+        dict: 단계 이름 -> {"seconds", "peak_bytes"(trace_memory일 때)}
+    """
+    input_folder, file_name = os.path.split(input_path)
+    output_folder = os.path.join(work_dir, "output")
+    shutil.rmtree(output_folder, ignore_errors=True)
+    service = ExcelParseService(input_folder, output_folder, workers=workers, reader=reader)
+    results = {}
+    state = {}
+
+    def read():
+        state["df"] = service.read_excel(input_path)
+
+    def partition():
+        state["partitions"] = list(partition_frame(state["df"], 0))
+
+    def write():
+        for i, (_, part) in enumerate(state["partitions"]):
+            service.write_excel(part, f"part_{i}.xlsx")
+
+    def parse_data():
+        shutil.rmtree(output_folder, ignore_errors=True)
+        os.makedirs(output_folder)
+        service.parse_data(file_name, 1)
+
+    for stage, func in zip(STAGES, (read, partition, write, parse_data)):
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        func()
+        result = {"seconds": time.perf_counter() - started}
+        if trace_memory:
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        results[stage] = result
+    return results
+
+
+def run_scenario(params, reader, workers, repeat, trace_memory):
+    """
+    시나리오 하나 측정 (시간은 repeat회 중 최솟값, 메모리는 별도 1회 실행)
+    """
+    with tempfile.TemporaryDirectory(prefix="excel-parser-bench-") as work_dir:
+        input_path = make_workbook(os.path.join(work_dir, "input.xlsx"), **params)
+        stages = None
+        for _ in range(repeat):
+            run = run_stages(input_path, work_dir, reader, workers)
+            if stages is None:
+                stages = run
+            else:
+                for stage, result in run.items():
+                    stages[stage]["seconds"] = min(stages[stage]["seconds"], result["seconds"])
+        # tracemalloc은 실행을 느리게 하므로 시간 측정과 따로 실행
+        if trace_memory:
+            traced = run_stages(input_path, work_dir, reader, workers, trace_memory=True)
+            for stage, result in traced.items():
+                stages[stage]["peak_bytes"] = result["peak_bytes"]
+        for result in stages.values():
+            result["rows_per_second"] = params["rows"] / result["seconds"] if result["seconds"] > 0 else 0.0
+        return {"params": params, "input_bytes": os.path.getsize(input_path), "stages": stages}
+
+
+def compare(results, baseline, threshold):
+    """
+    기준 결과와 단계별 소요 시간 비교 출력
+
+    Returns:
+        list: 기준보다 threshold 이상 느려진 (시나리오, 단계)
+    """
+    regressions = []
+    print(f"\n{'scenario':>12} {'stage':>11} {'baseline(s)':>12} {'current(s)':>11} {'ratio':>7}")
+    for name, scenario in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None or base.get("params") != scenario["params"]:
+            print(f"{name:>12} {'-':>11} 기준 결과에 같은 조건의 시나리오가 없음")
+            continue
+        for stage, result in scenario["stages"].items():
+            base_seconds = base["stages"].get(stage, {}).get("seconds")
+            if not base_seconds:
+                continue
+            ratio = result["seconds"] / base_seconds
+            mark = " 느려짐" if ratio > 1 + threshold else ""
+            print(f"{name:>12} {stage:>11} {base_seconds:>12.3f} {result['seconds']:>11.3f} {ratio:>6.2f}x{mark}")
+            if mark:
+                regressions.append((name, stage))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분할 파이프라인 단계별 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", default=["small", "medium"], choices=list(SCENARIOS))
+    parser.add_argument("--rows", type=int, help="모든 시나리오의 행 수 변경")
+    parser.add_argument("--cols", type=int, help="모든 시나리오의 열 수 변경")
+    parser.add_argument("--groups", type=int, help="모든 시나리오의 그룹 수 변경")
+    parser.add_argument("--skew", type=float, help="모든 시나리오의 그룹 키 쏠림 정도 변경")
+    parser.add_argument("--string-width", type=int, help="모든 시나리오의 문자열 길이 변경")
+    parser.add_argument("--reader", default="auto", help="엑셀 읽기 엔진")
+    parser.add_argument("--workers", type=int, default=1, help="파일 저장 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=1, help="시간 측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--output", default="bench_pipeline.json", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="느려짐으로 판단할 비율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    overrides = {key: getattr(args, key) for key in ("rows", "cols", "groups", "skew", "string_width")
+                 if getattr(args, key) is not None}
+    reader = ExcelParseService(output_folder=tempfile.gettempdir(), reader=args.reader).reader.name
+    results = {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "reader": reader,
+            "workers": args.workers,
+        },
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':>12} {'stage':>11} {'seconds':>9} {'rows/s':>12} {'peak MB':>9}")
+    for name in args.scenarios:
+        params = {**SCENARIOS[name], **overrides}
+        scenario = run_scenario(params, reader, args.workers, args.repeat, not args.no_memory)
+        results["scenarios"][name] = scenario
+        for stage, result in scenario["stages"].items():
+            peak = f"{result['peak_bytes'] / 1024 ** 2:>9.1f}" if "peak_bytes" in result else f"{'-':>9}"
+            print(f"{name:>12} {stage:>11} {result['seconds']:>9.3f} {result['rows_per_second']:>12,.0f} {peak}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n기준보다 {args.threshold:.0%} 이상 느려진 단계: "
+                  + ", ".join(f"{name}/{stage}" for name, stage in regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
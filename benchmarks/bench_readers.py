@@ -0,0 +1,71 @@
+"""
+엑셀 읽기 엔진 벤치마크
+
+설치된 읽기 엔진(openpyxl, calamine, arrow)으로 넓은 시트와 긴 시트를 읽는
+시간을 비교합니다.
+
+사용 예:
+    python benchmarks/bench_readers.py --tall-rows 200000 --wide-cols 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.excel_writers import XlsxWorkbookWriter
+from services.readers import available_readers, get_reader
+
+
+def make_workbook(path, rows, cols, seed=0):
+    """숫자/문자열 열이 번갈아 있는 벤치마크용 xlsx 생성"""
+    rng = np.random.default_rng(seed)
+    with XlsxWorkbookWriter(path) as writer:
+        sheet = writer.add_sheet(header=[f"col{i}" for i in range(cols)])
+        for _ in range(rows):
+            values = rng.integers(0, 1000, size=cols).tolist()
+            sheet.append([f"S{v}" if i % 2 else v for i, v in enumerate(values)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엑셀 읽기 엔진 벤치마크")
+    parser.add_argument("--tall-rows", type=int, default=200_000)
+    parser.add_argument("--tall-cols", type=int, default=5)
+    parser.add_argument("--wide-rows", type=int, default=5_000)
+    parser.add_argument("--wide-cols", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    readers = available_readers()
+    print(f"사용 가능한 엔진: {', '.join(readers)}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        shapes = {
+            "tall": (args.tall_rows, args.tall_cols),
+            "wide": (args.wide_rows, args.wide_cols),
+        }
+        print(f"{'sheet':>6} {'shape':>14} " + " ".join(f"{name:>10}" for name in readers))
+        for label, (rows, cols) in shapes.items():
+            path = os.path.join(temp_dir, f"{label}.xlsx")
+            make_workbook(path, rows, cols)
+            timings = []
+            for name in readers:
+                reader = get_reader(name)
+                best = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    df = reader.read(path)
+                    best = min(best, time.perf_counter() - start)
+                    assert df.shape == (rows, cols)
+                timings.append(best)
+            print(f"{label:>6} {f'{rows}x{cols}':>14} " + " ".join(f"{t:>9.2f}s" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+작업 프로세스로 파티션을 보내는 방식 벤치마크
+
+parallel_writer가 파티션을 프로세스 풀로 보낼 때 드는 직렬화(부모 프로세스)/역직렬화(작업 프로세스)
+시간과 전송 크기를 방식별로 비교합니다. 파일 저장은 포함하지 않습니다.
+
+- pickle: DataFrame을 executor에 그대로 넘김 (ARROW_MIN_ROWS행 미만 파티션)
+- pickle5: pickle 프로토콜 5로 미리 직렬화한 bytes를 넘김
+- arrow: pack_partition으로 열을 Arrow IPC 스트림으로 변환해 넘김 (ARROW_MIN_ROWS행 이상 파티션, pyarrow 필요)
+- initializer: 원본 프레임 전체를 작업 프로세스마다 한 번 보내고 행 위치만 넘김 (spawn 기준, 작업 프로세스 수만큼 직렬화)
+
+사용 예:
+    python benchmarks/bench_transfer.py --rows 200000 --groups 100 --workers 4
+    python benchmarks/bench_transfer.py --rows 200000 --groups 5
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import time
+from multiprocessing.reduction import ForkingPickler
+
+import numpy as np
+import pandas as pd
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.parallel_writer import PackedPartition, pack_partition
+from services.partitioner import partition_frame
+
+
+def make_frame(rows, groups, seed=0):
+    """벤치마크용 DataFrame 생성 (엑셀에서 읽은 데이터처럼 문자열 object 열 위주, 첫 번째 열이 그룹 키)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "cost_center": pd.Series(rng.integers(0, groups, size=rows)).map(lambda k: f"CC{k:05d}"),
+        "employee": rng.integers(0, 1_000_000, size=rows),
+        "name": pd.Series(rng.integers(0, 5000, size=rows)).map(lambda k: f"직원{k}"),
+        "dept": pd.Series(rng.integers(0, 50, size=rows)).map(lambda k: f"부서{k}"),
+        "amount": rng.random(rows) * 10000,
+        "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows) % 365, unit="D"),
+    })
+
+
+def arrow_unpack(partition):
+    return partition.to_frame() if isinstance(partition, PackedPartition) else partition
+
+
+# 방식 이름 -> (부모 프로세스에서 보낼 객체로 변환, 작업 프로세스에서 DataFrame으로 복원)
+METHODS = {
+    "pickle": (lambda df: df, lambda obj: obj),
+    "pickle5": (lambda df: pickle.dumps(df, protocol=5), pickle.loads),
+    "arrow": (lambda df: pack_partition(df, min_rows=0), arrow_unpack),
+}
+
+
+def measure(parts, pack, unpack, repeat):
+    """파티션 전체의 (부모 시간, 작업 프로세스 시간, 전송 크기), 시간은 repeat번 측정한 중앙값"""
+    parent, worker = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payloads = [ForkingPickler.dumps(pack(part)) for part in parts]
+        middle = time.perf_counter()
+        for payload in payloads:
+            unpack(pickle.loads(payload))
+        parent.append(middle - start)
+        worker.append(time.perf_counter() - middle)
+    return statistics.median(parent), statistics.median(worker), sum(len(payload) for payload in payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작업 프로세스로 파티션을 보내는 방식 벤치마크")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4, help="initializer 방식에서 원본을 보낼 작업 프로세스 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.groups)
+    parts = [part for _, part in partition_frame(df, 0)]
+    methods = dict(METHODS)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        del methods["arrow"]
+
+    print(f"{'method':>12} {'parent(s)':>10} {'worker(s)':>10} {'payload(MiB)':>13}")
+    for name, (pack, unpack) in methods.items():
+        parent, worker, size = measure(parts, pack, unpack, args.repeat)
+        print(f"{name:>12} {parent:>10.3f} {worker:>10.3f} {size / 2 ** 20:>13.1f}")
+
+    # 원본 전체를 작업 프로세스마다 보내면 파티션 대신 원본 전체를 workers번 직렬화
+    parent, worker, size = measure([df], *METHODS["pickle"], args.repeat)
+    print(f"{'initializer':>12} {parent * args.workers:>10.3f} {worker:>10.3f} {size * args.workers / 2 ** 20:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+시작 시 import 시간 예산 검사
+
+`python -X importtime`으로 UI/CLI 진입 모듈을 새 프로세스에서 import하고,
+전체 import 시간이 예산을 넘거나 시작 시점에 불러오면 안 되는 무거운 모듈
+(pandas, numpy, openpyxl, pyarrow 등)이 import되면 종료 코드 1을 반환합니다.
+무거운 모듈은 첫 작업을 실행할 때 import되어야 창이 바로 뜹니다.
+무거운 모듈 검사는 tests/test_import_time.py에서 pytest로도 실행됩니다.
+
+사용 예:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 300 --top 20
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 진입 모듈 이름 -> import 문 (ROOT를 sys.path에 넣고 실행)
+ENTRY_POINTS = {
+    "ui": "import src.ui.excel_parser_ui",
+    "cli": "import cli",
+}
+
+# 시작 시점에 import되면 안 되는 모듈
+DEFERRED_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow", "python_calamine", "xlrd")
+
+
+def measure(statement):
+    """
+    새 프로세스에서 import하고 -X importtime 출력 파싱
+
+    Returns:
+        list: (모듈 이름, 자체 시간(us), 누적 시간(us), 중첩 깊이)
+    """
+    code = f"import sys; sys.path.insert(0, {ROOT!r}); {statement}"
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                             capture_output=True, text=True, encoding="utf-8", errors="replace")
+    if process.returncode != 0:
+        raise RuntimeError(f"import 실패: {statement}\n{process.stderr}")
+
+    entries = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시 import 시간 예산 검사")
+    parser.add_argument("--entries", nargs="+", default=list(ENTRY_POINTS), choices=list(ENTRY_POINTS))
+    parser.add_argument("--budget-ms", type=float, default=400.0, help="진입 모듈별 전체 import 시간 예산 (ms)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 느린 모듈 수")
+    args = parser.parse_args()
+
+    failed = False
+    for entry in args.entries:
+        entries = measure(ENTRY_POINTS[entry])
+        # 최상위 import의 누적 시간 합계가 전체 import 시간
+        total_ms = sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000
+        imported = {name.split(".")[0] for name, _, _, _ in entries}
+        deferred = [module for module in DEFERRED_MODULES if module in imported]
+        over_budget = total_ms > args.budget_ms
+
+        print(f"[{entry}] 전체 import 시간 {total_ms:.1f}ms (예산 {args.budget_ms:.0f}ms)"
+              + (" 초과" if over_budget else ""))
+        for name, self_us, cumulative_us, _ in sorted(entries, key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"  {self_us / 1000:>8.1f}ms (누적 {cumulative_us / 1000:>8.1f}ms)  {name}")
+        if deferred:
+            print(f"  시작 시 import되면 안 되는 모듈: {', '.join(deferred)}")
+        failed = failed or over_budget or bool(deferred)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+벤치마크용 합성 엑셀 파일 생성기
+
+같은 인자와 seed로 만들면 항상 같은 내용의 파일이 생성됩니다.
+첫 번째 열이 그룹 키이고, 나머지 열은 정수/실수/문자열 열이 번갈아 옵니다.
+
+사용 예:
+    python benchmarks/synthetic.py out.xlsx --rows 100000 --cols 10 --groups 500 --skew 1.2
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# src 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.excel_writers import XlsxWorkbookWriter
+
+
+def group_keys(rows, groups, skew=0.0, seed=0):
+    """
+    그룹 키 코드 생성
+
+    skew가 0이면 모든 그룹이 같은 확률로 나오고, 클수록 앞쪽 그룹에 행이 몰린다
+    (k번째 그룹의 확률이 1 / k^skew에 비례하는 Zipf 분포).
+
+    Args:
+        rows (int): 행 수
+        groups (int): 그룹 수
+        skew (float): 쏠림 정도 (0 이상)
+        seed (int): 난수 seed
+
+    Returns:
+        numpy.ndarray: 행별 그룹 코드 (0 ~ groups-1)
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, groups + 1) ** skew
+    return rng.choice(groups, size=rows, p=weights / weights.sum())
+
+
+def make_rows(rows, cols, groups, skew=0.0, string_width=8, seed=0):
+    """
+    합성 데이터 행 생성
+
+    Args:
+        rows (int): 데이터 행 수
+        cols (int): 열 수 (그룹 키 열 포함, 1 이상)
+        groups (int): 그룹 수
+        skew (float): 그룹 키 쏠림 정도
+        string_width (int): 문자열 열 값의 길이
+        seed (int): 난수 seed
+
+    Yields:
+        list: 행 (첫 번째 값이 그룹 키)
+    """
+    rng = np.random.default_rng(seed + 1)
+    keys = group_keys(rows, groups, skew, seed)
+    alphabet = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"))
+    # 문자열 값은 미리 만든 후보에서 골라 생성 시간을 줄임
+    pool = ["".join(rng.choice(alphabet, size=string_width)) for _ in range(1024)]
+
+    chunk = 10000
+    for start in range(0, rows, chunk):
+        size = min(chunk, rows - start)
+        columns = [[f"G{k:06d}" for k in keys[start:start + size]]]
+        for i in range(1, cols):
+            kind = i % 3
+            if kind == 1:
+                columns.append(rng.integers(0, 1_000_000, size=size).tolist())
+            elif kind == 2:
+                columns.append(np.round(rng.random(size) * 10000, 2).tolist())
+            else:
+                columns.append([pool[j] for j in rng.integers(0, len(pool), size=size)])
+        yield from (list(row) for row in zip(*columns))
+
+
+def make_workbook(path, rows, cols=5, groups=100, skew=0.0, string_width=8, seed=0):
+    """
+    합성 xlsx 파일 생성
+
+    Args:
+        path (str): 저장할 파일 경로
+        rows (int): 데이터 행 수
+        cols (int): 열 수 (그룹 키 열 포함)
+        groups (int): 그룹 수
+        skew (float): 그룹 키 쏠림 정도
+        string_width (int): 문자열 열 값의 길이
+        seed (int): 난수 seed
+
+    Returns:
+        str: 저장된 파일 경로
+    """
+    if cols < 1:
+        raise ValueError(f"cols는 1 이상이어야 합니다: {cols}")
+    with XlsxWorkbookWriter(path) as writer:
+        sheet = writer.add_sheet(header=["group"] + [f"col{i}" for i in range(1, cols)])
+        sheet.append_rows(make_rows(rows, cols, groups, skew, string_width, seed))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 엑셀 파일 생성")
+    parser.add_argument("path", help="저장할 xlsx 파일 경로")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=5)
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--skew", type=float, default=0.0)
+    parser.add_argument("--string-width", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    make_workbook(args.path, args.rows, args.cols, args.groups, args.skew, args.string_width, args.seed)
+    print(f"{args.path} ({os.path.getsize(args.path) / 1024 ** 2:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,25 @@
+import argparse
 import os
 import subprocess
 import sys
 
+# 번들에서 제외할 모듈 (이 앱에서 쓰지 않지만 pandas/PyQt5 등의 선택 의존성으로 딸려 오는 모듈)
+# excel-parser.spec에서도 이 목록을 사용
+EXCLUDES = [
+    # 개발/노트북/테스트 도구
+    "IPython", "jupyter_client", "jupyter_core", "notebook", "pytest", "sphinx", "docutils",
+    "setuptools", "pip", "pydoc_data",
+    # pandas 선택 의존성 중 사용하지 않는 것
+    "matplotlib", "scipy", "sqlalchemy", "tables", "bs4", "html5lib", "jinja2", "numba",
+    "pandas.tests", "numpy.tests", "pyarrow.tests",
+    # 사용하지 않는 GUI 툴킷과 Qt 모듈 (QtCore, QtGui, QtWidgets만 사용)
+    "tkinter", "PyQt5.QtWebEngine", "PyQt5.QtWebEngineCore", "PyQt5.QtWebEngineWidgets", "PyQt5.QtWebChannel",
+    "PyQt5.QtQml", "PyQt5.QtQuick", "PyQt5.QtQuickWidgets", "PyQt5.QtMultimedia", "PyQt5.QtMultimediaWidgets",
+    "PyQt5.QtNetwork", "PyQt5.QtSql", "PyQt5.QtTest", "PyQt5.QtBluetooth", "PyQt5.QtNfc", "PyQt5.QtPositioning",
+    "PyQt5.QtLocation", "PyQt5.QtSensors", "PyQt5.QtSerialPort", "PyQt5.QtDesigner", "PyQt5.QtHelp",
+    "PyQt5.QtOpenGL", "PyQt5.QtSvg", "PyQt5.QtXmlPatterns", "PyQt5.Qt3DCore", "PyQt5.QtDBus",
+]
+
 # Window CP1252 환경 stdout 인코딩 설정
 try:
     sys.stdout.reconfigure(encoding="utf-8")
@@ -9,6 +27,11 @@ except AttributeError:
     pass
 
 def main():
+    parser = argparse.ArgumentParser(description="Excel Parser 실행 파일 빌드")
+    parser.add_argument("--onedir", action="store_true",
+                        help="단일 exe 대신 폴더로 빌드 (실행할 때마다 압축을 풀지 않아 시작이 빠름)")
+    args = parser.parse_args()
+
     print("Excel Parser EXE 빌드 시작")
 
     # PyInstaller 설치 확인
@@ -23,20 +46,25 @@ def main():
     # macOS와 Windows에서 다른 옵션을 사용
     import platform
     
+    exclude_options = [option for module in EXCLUDES for option in ("--exclude-module", module)]
     if platform.system() == "Darwin":  # macOS
         build_command = [
             "pyinstaller",
             "--windowed",  # macOS에서는 GUI 애플리케이션을 위한 .app 번들 생성
             "--name", "excel-parser",  # 출력 파일 이름
             "--clean",     # 기존 빌드 파일 정리
+            "--paths", "src",  # UI가 src 기준으로 import하는 services 패키지 포함
+            *exclude_options,
             "main.py"      # 메인 스크립트 파일
         ]
     else:  # Windows 등 다른 OS
         build_command = [
             "pyinstaller",
-            "--onefile",   # 단일 exe 파일로 빌드
+            "--onedir" if args.onedir else "--onefile",  # 폴더 또는 단일 exe 파일로 빌드
             "--windowed",  # 콘솔 창 없이 실행
             "--name", "excel-parser", # 출력 파일 이름
+            "--paths", "src",  # UI가 src 기준으로 import하는 services 패키지 포함
+            *exclude_options,
             "main.py"      # 메인 스크립트 파일
         ]
     print(f"빌드 명령 실행: {' '.join(build_command)}")
@@ -47,6 +75,8 @@ def main():
     
     if platform.system() == "Darwin":  # macOS
         dist_path = os.path.join(os.getcwd(), "dist", "excel-parser.app")
+    elif args.onedir:  # Windows 폴더 빌드
+        dist_path = os.path.join(os.getcwd(), "dist", "excel-parser", "excel-parser.exe")
     else:  # Windows
         dist_path = os.path.join(os.getcwd(), "dist", "excel-parser.exe")
         
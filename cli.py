@@ -0,0 +1,271 @@
+"""
+Excel Parser 명령줄 실행 (UI 없이 사용)
+
+사용 예:
+    python cli.py split input/급여.xlsx --column 1
+    python cli.py batch --input input --output output --column 1 --file-workers 4
+    python cli.py summarize input/급여.xlsx --column 1 --values 3 4 --agg sum mean
+    python cli.py serve --port 8765 --workers 4
+    python cli.py submit input/급여.xlsx --column 1 --wait
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+
+# 상위 디렉토리의 모듈을 import 하기 위한 경로 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_parser():
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(description="엑셀 파일을 지정한 열 값 기준으로 분할합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--output", help="출력 폴더 (기본: ./output)")
+    common.add_argument("--column", type=int, nargs="+", required=True,
+                        help="기준 열 번호 (1부터 시작, 여러 개면 열 값 조합 기준으로 분할)")
+    common.add_argument("--reader", default="auto", help="엑셀 읽기 엔진 (auto, calamine, arrow, openpyxl)")
+    common.add_argument("--cache-dir", help="읽은 데이터 캐시 폴더")
+    common.add_argument("--output-mode", default="files", choices=("files", "sheets", "zip"),
+                        help="출력 방식 (그룹별 파일, 워크북 하나에 그룹별 시트, ZIP 묶음)")
+    common.add_argument("--output-format", default="excel", choices=("excel", "csv", "parquet", "feather"),
+                        help="출력 형식 (parquet/feather는 기준열=값 폴더 구조로 저장, pyarrow 필요)")
+    common.add_argument("--sheets", nargs="+",
+                        help="처리할 시트 이름 (all이면 전체 시트, 지정하지 않으면 첫 번째 시트만)")
+    common.add_argument("--sheet-mode", default="merge", choices=("merge", "separate"),
+                        help="여러 시트 처리 방식 (시트를 합쳐 분할, 시트마다 따로 분할)")
+    common.add_argument("--where", nargs="+", metavar="CONDITION",
+                        help='행 조건 (모두 만족하는 행만 분할, 예: "3>=100" "2 in 서울,부산" "5 contains 완료")')
+    common.add_argument("--output-columns", type=int, nargs="+",
+                        help="출력 파일에 저장할 열 번호 (지정한 순서, 기준 열은 포함하지 않아도 됨)")
+    common.add_argument("--io-threads", type=int, default=0,
+                        help="읽기/분할과 파일 저장을 겹쳐 실행할 저장 스레드 수 (0이면 차례로 실행)")
+    common.add_argument("--streaming", action="store_true", help="행 묶음 단위 스트리밍 처리 (.xlsx/.xlsm)")
+    common.add_argument("--batch-size", type=int, default=10000, help="스트리밍 모드에서 한 번에 읽을 행 수")
+    common.add_argument("--memory-budget", type=int, help="스트리밍 모드 메모리 상한 (MB)")
+    common.add_argument("--incremental", action="store_true", help="내용이 바뀐 그룹만 다시 저장")
+    common.add_argument("--profile", choices=("cprofile", "sampling"),
+                        help="작업을 프로파일링해 출력 폴더에 <파일명>_profile.* 저장")
+    common.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+
+    split = subparsers.add_parser("split", parents=[common], help="엑셀 파일 하나 분할")
+    split.add_argument("file", help="입력 엑셀 파일 경로")
+    split.add_argument("--workers", type=int, default=1, help="파일 저장 프로세스 수")
+    split.add_argument("--metrics", action="store_true", help="단계별 처리 시간/처리량 표 출력")
+    split.add_argument("--trace", help="단계별 실행 구간을 기록할 trace 파일 경로 (chrome://tracing, Perfetto)")
+    split.add_argument("--trace-memory", action="store_true", help="단계별 최대 메모리 측정 (실행이 느려짐)")
+
+    batch = subparsers.add_parser("batch", parents=[common], help="입력 폴더의 모든 엑셀 파일 분할")
+    batch.add_argument("--input", help="입력 폴더 (기본: ./input)")
+    batch.add_argument("--workers", type=int, default=1, help="파일 저장 프로세스 수")
+    batch.add_argument("--file-workers", type=int, default=2, help="동시에 처리할 파일 수")
+    batch.add_argument("--report", default="batch_report.json", help="출력 폴더에 저장할 보고서 파일 이름")
+
+    summarize = subparsers.add_parser("summarize", help="파일을 나누지 않고 그룹별 행 수와 값 열 집계만 저장")
+    summarize.add_argument("file", help="입력 엑셀 파일 경로")
+    summarize.add_argument("--output", help="출력 폴더 (기본: ./output)")
+    summarize.add_argument("--column", type=int, nargs="+", required=True,
+                           help="기준 열 번호 (1부터 시작, 여러 개면 열 값 조합 기준)")
+    summarize.add_argument("--values", type=int, nargs="+",
+                           help="집계할 값 열 번호 (지정하지 않으면 기준 열을 제외한 숫자 열 전체)")
+    summarize.add_argument("--agg", nargs="+", default=["sum", "min", "max"],
+                           choices=("count", "sum", "mean", "min", "max"), help="값 열마다 계산할 집계")
+    summarize.add_argument("--reader", default="auto", help="엑셀 읽기 엔진 (auto, calamine, arrow, openpyxl)")
+    summarize.add_argument("--cache-dir", help="읽은 데이터 캐시 폴더")
+    summarize.add_argument("--output-format", default="excel", choices=("excel", "csv"),
+                           help="요약표 형식 (<파일명>_summary.xlsx 또는 .csv)")
+    summarize.add_argument("--streaming", action="store_true", help="행 묶음 단위 스트리밍 처리 (.xlsx/.xlsm)")
+    summarize.add_argument("--batch-size", type=int, default=10000, help="스트리밍 모드에서 한 번에 읽을 행 수")
+    summarize.add_argument("--io-threads", type=int, default=0,
+                           help="1 이상이면 스트리밍 모드에서 다음 행 묶음을 미리 읽으며 집계")
+    summarize.add_argument("--metrics", action="store_true", help="단계별 처리 시간/처리량 표 출력")
+    summarize.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+
+    serve = subparsers.add_parser("serve", help="작업 서버 실행 (상주 작업 프로세스, 로컬 HTTP로 작업 등록)")
+    serve.add_argument("--host", default="127.0.0.1", help="바인딩할 주소")
+    serve.add_argument("--port", type=int, default=8765, help="포트")
+    serve.add_argument("--workers", type=int, default=2, help="동시에 처리할 작업 수 (작업 프로세스 수)")
+    serve.add_argument("--output", help="작업에 출력 폴더가 없을 때 사용할 폴더 (기본: ./output)")
+    serve.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+
+    submit = subparsers.add_parser("submit", parents=[common], help="작업 서버에 엑셀 파일 분할 작업 등록")
+    submit.add_argument("file", help="입력 엑셀 파일 경로")
+    submit.add_argument("--server", default="http://127.0.0.1:8765", help="작업 서버 주소")
+    submit.add_argument("--wait", action="store_true", help="작업이 끝날 때까지 진행률을 출력하며 대기")
+
+    return parser
+
+
+def parse_options(args):
+    """parse_data에 넘길 옵션"""
+    return {
+        "streaming": args.streaming,
+        "batch_size": args.batch_size,
+        "incremental": args.incremental,
+        "memory_budget": args.memory_budget * 1024 ** 2 if args.memory_budget else None,
+        "profile": args.profile,
+        "sheets": "all" if args.sheets == ["all"] else args.sheets,
+        "sheet_mode": args.sheet_mode,
+        "filters": args.where,
+        "columns": args.output_columns,
+    }
+
+
+def key_columns(args):
+    """기준 열 번호 (하나면 int, 여러 개면 list)"""
+    return args.column[0] if len(args.column) == 1 else args.column
+
+
+def run_split(args):
+    from src.services.excel_parse_service import ExcelParseService
+
+    file_path = os.path.abspath(args.file)
+    service = ExcelParseService(
+        input_folder=os.path.dirname(file_path),
+        output_folder=args.output,
+        workers=args.workers,
+        reader=args.reader,
+        cache_dir=args.cache_dir,
+        output_mode=args.output_mode,
+        output_format=args.output_format,
+        io_threads=args.io_threads,
+    )
+    output_files = service.parse_data(os.path.basename(file_path), key_columns(args), trace_file=args.trace,
+                                      trace_memory=args.trace_memory, **parse_options(args))
+    for output_file in output_files:
+        print(output_file)
+    if args.metrics or args.trace_memory:
+        print(output_files.metrics.summary(), file=sys.stderr)
+    for profile_file in output_files.profile_files:
+        print(f"프로파일: {profile_file}", file=sys.stderr)
+    return 0
+
+
+def run_summarize(args):
+    from src.services.excel_parse_service import ExcelParseService
+
+    file_path = os.path.abspath(args.file)
+    service = ExcelParseService(
+        input_folder=os.path.dirname(file_path),
+        output_folder=args.output,
+        reader=args.reader,
+        cache_dir=args.cache_dir,
+        output_format=args.output_format,
+        io_threads=args.io_threads,
+    )
+    result = service.aggregate(os.path.basename(file_path), key_columns(args), value_columns=args.values,
+                               aggregations=args.agg, streaming=args.streaming, batch_size=args.batch_size)
+    print(result.output_file)
+    print(result.summary.to_string(index=False, max_rows=50))
+    for column, count in result.invalid_values.items():
+        print(f"{column}: 숫자가 아닌 값 {count}개 제외", file=sys.stderr)
+    if args.metrics:
+        print(result.metrics.summary(), file=sys.stderr)
+    return 0
+
+
+def request_json(url, method="GET", body=None):
+    """작업 서버에 JSON 요청을 보내고 응답 반환 (오류 응답이면 ValueError)"""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        raise ValueError(json.loads(e.read()).get("error", str(e))) from e
+
+
+def run_submit(args):
+    options = parse_options(args)
+    body = {
+        "file": os.path.abspath(args.file),
+        "column": key_columns(args),
+        "output": os.path.abspath(args.output) if args.output else None,
+        "reader": args.reader,
+        "cache_dir": args.cache_dir,
+        "output_mode": args.output_mode,
+        "output_format": args.output_format,
+        "io_threads": args.io_threads,
+        **{key: value for key, value in options.items() if value is not None},
+    }
+    job = request_json(f"{args.server}/jobs", "POST", body)
+    print(job["id"])
+    if not args.wait:
+        return 0
+
+    while job["status"] in ("queued", "running"):
+        time.sleep(0.5)
+        job = request_json(f"{args.server}/jobs/{job['id']}")
+        if job["progress"]:
+            print(f"{job['status']} {job['progress']['stage']} {job['progress']['percent']}%", file=sys.stderr)
+    for output_file in job["output_files"]:
+        print(output_file)
+    if job["status"] != "done":
+        print(f"작업 {job['status']}: {job['error'] or ''}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_batch(args):
+    from src.services.excel_parse_service import ExcelParseService
+
+    service = ExcelParseService(
+        input_folder=args.input,
+        output_folder=args.output,
+        workers=args.workers,
+        reader=args.reader,
+        cache_dir=args.cache_dir,
+        output_mode=args.output_mode,
+        output_format=args.output_format,
+        io_threads=args.io_threads,
+    )
+    results = service.parse_folder(key_columns(args), file_workers=args.file_workers, report_file=args.report,
+                                   **parse_options(args))
+    for result in results:
+        if result.status == "ok":
+            parts = f" (그룹 {result.parts_written}개)" if result.parts_written else ""
+            print(f"{result.file_name}: {result.files_written}개 파일{parts}, {result.rows}행, "
+                  f"{result.seconds:.2f}초 ({result.rows_per_second:,.0f}행/초)")
+        else:
+            print(f"{result.file_name}: 오류 - {result.error}")
+    return 1 if any(result.status != "ok" for result in results) else 0
+
+
+def main(argv=None):
+    """
+    명령줄 실행 함수
+
+    Returns:
+        int: 종료 코드 (실패한 파일이 있으면 1)
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.command == "split":
+        return run_split(args)
+    if args.command == "summarize":
+        return run_summarize(args)
+    if args.command == "serve":
+        from src.services.job_server import serve
+
+        serve(args.host, args.port, args.workers, args.output)
+        return 0
+    if args.command == "submit":
+        return run_submit(args)
+    return run_batch(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,16 +1,21 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+# 제외 모듈 목록은 build.py와 공유
+sys.path.insert(0, SPECPATH)
+from build import EXCLUDES
 
 
 a = Analysis(
     ['main.py'],
-    pathex=[],
+    pathex=['src'],
     binaries=[],
     datas=[],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=EXCLUDES,
     noarchive=False,
     optimize=0,
 )
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import os
 
@@ -17,4 +18,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # PyInstaller 빌드에서 프로세스 풀 작업 프로세스가 UI를 다시 띄우지 않도록 처리
+    multiprocessing.freeze_support()
     main()
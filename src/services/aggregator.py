@@ -0,0 +1,222 @@
+"""
+그룹별 요약 통계 (파일을 나누지 않고 행 수와 값 열의 합계, 최솟값/최댓값 등만 계산)
+
+행 묶음마다 그룹별 부분 집계(개수, 합계, 최솟값, 최댓값)를 구해 누적하므로, 시트 전체를
+묶음 하나로 넘겨도(한 번에 벡터 연산) 스트리밍으로 나누어 넘겨도 같은 결과가 나온다.
+평균은 마지막에 합계와 개수로 계산한다. 그룹 순서는 분할과 같이 처음 등장한 순서다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 집계 -> 요약표 열 이름에 붙일 이름
+AGGREGATIONS = {
+    "count": "개수",
+    "sum": "합계",
+    "mean": "평균",
+    "min": "최솟값",
+    "max": "최댓값",
+}
+
+DEFAULT_AGGREGATIONS = ("sum", "min", "max")
+
+# 그룹별 행 수 열 이름 (GroupIndex.summary와 같음)
+ROW_COUNT_COLUMN = "행 수"
+
+# 분할했을 때의 출력 파일 이름 열
+OUTPUT_FILE_COLUMN = "출력 파일"
+
+# 부분 집계 -> 묶음끼리 합칠 때 사용할 함수
+_COMBINE = {"count": "sum", "sum": "sum", "min": "min", "max": "max"}
+
+_ROWS = ("", "rows")
+
+# 부분 집계를 이 개수만큼 모은 뒤 한 번에 합침 (묶음마다 누적 결과와 합치면 그룹이 많을 때 느림)
+MERGE_EVERY = 16
+
+
+def check_aggregations(aggregations):
+    """
+    집계 이름 검사 (중복은 제거하고 순서 유지)
+
+    Returns:
+        list[str]: 집계 이름 목록
+    """
+    aggregations = list(dict.fromkeys(aggregations))
+    unknown = [name for name in aggregations if name not in AGGREGATIONS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 집계입니다: {', '.join(unknown)} (사용 가능: {', '.join(AGGREGATIONS)})")
+    return aggregations
+
+
+def is_numeric_column(column):
+    """
+    값 열로 집계할 수 있는 열인지 확인 (숫자 타입이거나 비어 있지 않은 값이 모두 숫자인 열, 불리언/날짜 제외)
+
+    Args:
+        column (pandas.Series): 확인할 열
+    """
+    if pd.api.types.is_bool_dtype(column.dtype) or pd.api.types.is_datetime64_any_dtype(column.dtype):
+        return False
+    if pd.api.types.is_numeric_dtype(column.dtype):
+        return True
+    values = column.dropna()
+    if values.empty:
+        return False
+    return all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values)
+
+
+def _numeric(column):
+    """
+    열을 숫자로 변환 (숫자가 아닌 값은 NaN)
+
+    Returns:
+        tuple: (숫자 열, 숫자로 바꿀 수 없어 제외한 값 수)
+    """
+    if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+        return column, 0
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        numeric = pd.Series(float("nan"), index=column.index)
+    else:
+        # Arrow 문자열 열은 변환 결과가 NA가 아닌 NaN이 되어 빈 값으로 세지 못하므로 object로 변환
+        numeric = pd.to_numeric(column.astype(object), errors="coerce")
+    return numeric, int((numeric.isna() & column.notna()).sum())
+
+
+class GroupAggregator:
+    """
+    행 묶음을 받아 그룹별 집계 값을 누적
+    """
+
+    def __init__(self, key_names, value_names, aggregations=DEFAULT_AGGREGATIONS):
+        """
+        GroupAggregator 초기화
+
+        Args:
+            key_names (list[str]): 기준 열 이름 (요약표 열 이름)
+            value_names (list[str]): 값 열 이름 (요약표 열 이름 앞부분)
+            aggregations (Iterable[str]): 값 열마다 계산할 집계 (AGGREGATIONS 중)
+        """
+        aggregations = check_aggregations(aggregations)
+        self.key_names = list(key_names)
+        self.value_names = list(value_names)
+        self.aggregations = aggregations
+        # 값 열 이름 -> 숫자로 바꿀 수 없어 제외한 값 수
+        self.invalid_values = {name: 0 for name in self.value_names}
+
+        # 평균은 합계와 개수로 계산
+        partials = set(aggregations) - {"mean"}
+        if "mean" in aggregations:
+            partials |= {"sum", "count"}
+        self._partials = [name for name in _COMBINE if name in partials]
+        self._state = None
+        self._pending = []
+
+    def update(self, keys, values):
+        """
+        행 묶음 하나의 부분 집계를 누적
+
+        Args:
+            keys (pandas.DataFrame): 기준 열 (열 조합이면 여러 열)
+            values (pandas.DataFrame): 값 열 (keys와 같은 행, value_names 순서)
+        """
+        numeric = {}
+        for i, name in enumerate(self.value_names):
+            numeric[i], invalid = _numeric(values.iloc[:, i])
+            self.invalid_values[name] += invalid
+        numeric = pd.DataFrame(numeric, index=keys.index)
+
+        grouped = numeric.groupby([keys.iloc[:, i] for i in range(keys.shape[1])], sort=False, dropna=False)
+        sizes = grouped.size()
+        if self.value_names and self._partials:
+            # 집계마다 모든 값 열을 한 번에 계산 (열 이름은 (값 열 순서, 집계))
+            partial = pd.concat({name: getattr(grouped, name)() for name in self._partials}, axis=1)
+            partial.columns = partial.columns.swaplevel()
+        else:
+            partial = pd.DataFrame(index=sizes.index)
+        partial[_ROWS] = sizes
+
+        self._pending.append(partial)
+        if len(self._pending) >= MERGE_EVERY:
+            self._merge()
+
+    def _merge(self):
+        """모아 둔 부분 집계를 누적 결과에 합침"""
+        frames = [self._state] if self._state is not None else []
+        frames += self._pending
+        self._pending = []
+        if not frames:
+            return
+        if len(frames) == 1:
+            self._state = frames[0]
+            return
+        combine = {column: "sum" if column == _ROWS else _COMBINE[column[1]] for column in frames[0].columns}
+        levels = list(range(frames[0].index.nlevels))
+        self._state = pd.concat(frames).groupby(level=levels, sort=False, dropna=False).agg(combine)
+
+    @property
+    def group_count(self):
+        """지금까지 합친 그룹 수 (아직 합치지 않은 부분 집계의 새 그룹은 포함하지 않음)"""
+        return 0 if self._state is None else len(self._state)
+
+    @property
+    def group_values(self):
+        """지금까지 발견한 그룹 값 (처음 등장한 순서, 열 조합 기준이면 튜플)"""
+        self._merge()
+        if self._state is None:
+            return []
+        return list(self._state.index)
+
+    def result(self):
+        """
+        그룹별 요약표
+
+        Returns:
+            pandas.DataFrame: 기준 열마다 한 열(빈 값은 "NA"), 행 수, 값 열마다 "<열> <집계>" 열
+        """
+        self._merge()
+        state = self._state
+        if state is None:
+            return pd.DataFrame(columns=[*self.key_names, ROW_COUNT_COLUMN])
+
+        index = state.index
+        levels = [index.get_level_values(i) for i in range(index.nlevels)] if index.nlevels > 1 else [index]
+        summary = pd.DataFrame({
+            name: level.astype(object).where(~level.isna(), "NA") for name, level in zip(self.key_names, levels)
+        })
+        summary[ROW_COUNT_COLUMN] = state[_ROWS].to_numpy()
+        for i, name in enumerate(self.value_names):
+            for aggregation in self.aggregations:
+                if aggregation == "mean":
+                    count = state[(i, "count")].to_numpy()
+                    values = state[(i, "sum")].to_numpy() / count.clip(min=1)
+                    values[count == 0] = float("nan")
+                else:
+                    values = state[(i, aggregation)].to_numpy()
+                summary[f"{name} {AGGREGATIONS[aggregation]}"] = values
+
+        for name, invalid in self.invalid_values.items():
+            if invalid:
+                logger.warning(f"값 열 '{name}'에서 숫자가 아닌 값 {invalid}개를 집계에서 제외했습니다.")
+        return summary
+
+
+@dataclass
+class AggregateResult:
+    """
+    aggregate()의 반환 값
+
+    Attributes:
+        summary (pandas.DataFrame): 그룹별 요약표
+        output_file (str): 요약표를 저장한 파일 경로
+        metrics (JobMetrics): 단계별 계측 값
+        invalid_values (dict): 값 열 이름 -> 숫자가 아니어서 집계에서 제외한 값 수
+    """
+    summary: pd.DataFrame
+    output_file: str
+    metrics: object = None
+    invalid_values: dict = field(default_factory=dict)
@@ -0,0 +1,193 @@
+"""
+입력 폴더 일괄 처리
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+
+logger = logging.getLogger(__name__)
+
+# 일괄 처리 대상 확장자
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+
+@dataclass
+class BatchFileResult:
+    """
+    파일 하나의 일괄 처리 결과
+
+    Attributes:
+        file_name (str): 입력 파일 이름
+        status (str): "ok" 또는 "error"
+        rows (int): 읽은 행 수
+        groups (int): 그룹 수
+        files_written (int): 저장한 출력 파일 수 (묶음 출력은 워크북/ZIP 파일 수)
+        parts_written (int): 묶음 출력에 시트/ZIP 항목으로 저장한 그룹 수
+        bytes_written (int): 저장한 출력 파일 크기 합계
+        seconds (float): 처리 시간 (초)
+        rows_per_second (float): 초당 처리 행 수
+        error (str): 오류 메시지
+        output_files (list): 출력 파일 경로
+        metrics (dict): 단계별 계측 값 (JobMetrics.to_dict())
+    """
+    file_name: str
+    status: str = "ok"
+    rows: int = 0
+    groups: int = 0
+    files_written: int = 0
+    parts_written: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+    rows_per_second: float = 0.0
+    error: str = None
+    output_files: list = field(default_factory=list)
+    metrics: dict = field(default_factory=dict)
+
+
+def discover_excel_files(folder):
+    """
+    폴더 안의 엑셀 파일 이름 목록 (이름 순, 엑셀 임시 파일 제외)
+
+    Args:
+        folder (str): 입력 폴더 경로
+
+    Returns:
+        list: 파일 이름
+    """
+    if not os.path.isdir(folder):
+        raise ValueError(f"입력 폴더가 없습니다: {folder}")
+    return sorted(
+        name for name in os.listdir(folder)
+        if os.path.splitext(name)[1].lower() in EXCEL_EXTENSIONS
+        and not name.startswith("~$")
+        and os.path.isfile(os.path.join(folder, name))
+    )
+
+
+def process_file(service_options, file_name, column_num, parse_options):
+    """
+    파일 하나 처리 (작업 프로세스에서 실행)
+
+    작업 프로세스마다 서비스를 새로 만들며, 마지막 진행 이벤트로 처리 통계를 얻는다.
+
+    Args:
+        service_options (dict): ExcelParseService 생성 인자
+        file_name (str): 입력 파일 이름
+        column_num (int | list[int]): 기준 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+        parse_options (dict): parse_data 추가 인자
+
+    Returns:
+        BatchFileResult: 처리 결과
+    """
+    from .excel_parse_service import ExcelParseService
+
+    events = []
+    result = BatchFileResult(file_name)
+    started = time.perf_counter()
+    try:
+        service = ExcelParseService(**service_options)
+        output_files = service.parse_data(file_name, column_num, progress_callback=events.append, **parse_options)
+        result.output_files = list(output_files)
+        result.metrics = output_files.metrics.to_dict()
+    except Exception as e:
+        result.status = "error"
+        result.error = str(e) or type(e).__name__
+    result.seconds = time.perf_counter() - started
+
+    if events:
+        last = events[-1]
+        result.rows = last.rows_read
+        result.groups = last.groups_discovered
+        result.files_written = last.files_written
+        result.parts_written = last.parts_written
+        result.bytes_written = last.bytes_written
+    if result.seconds > 0:
+        result.rows_per_second = result.rows / result.seconds
+    return result
+
+
+def run_batch(service_options, file_names, column_num, parse_options, file_workers):
+    """
+    여러 파일을 프로세스 풀에서 처리
+
+    파일 단위로 작업 프로세스에 나누어 주므로 한 파일을 읽는 동안 다른 파일을 저장하는 식으로
+    읽기와 쓰기가 겹쳐 진행된다. 동시에 처리하는 파일 수는 file_workers로 제한된다.
+
+    Args:
+        service_options (dict): ExcelParseService 생성 인자
+        file_names (list): 입력 파일 이름
+        column_num (int | list[int]): 기준 열 번호
+        parse_options (dict): parse_data 추가 인자
+        file_workers (int): 동시에 처리할 파일 수
+
+    Returns:
+        list[BatchFileResult]: 파일별 결과 (file_names 순서)
+    """
+    if file_workers <= 1:
+        return [process_file(service_options, name, column_num, parse_options) for name in file_names]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=file_workers) as executor:
+        futures = {
+            executor.submit(process_file, service_options, name, column_num, parse_options): name
+            for name in file_names
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                # 작업 프로세스 자체가 비정상 종료된 경우
+                results[name] = BatchFileResult(name, status="error", error=str(e) or type(e).__name__)
+            result = results[name]
+            logger.info(f"[{len(results)}/{len(file_names)}] {name}: {result.status} ({result.seconds:.2f}초)")
+    return [results[name] for name in file_names]
+
+
+def write_batch_report(results, report_path, total_seconds):
+    """
+    일괄 처리 요약 보고서 저장 (JSON + 같은 이름의 CSV)
+
+    Args:
+        results (list[BatchFileResult]): 파일별 결과
+        report_path (str): JSON 보고서 경로
+        total_seconds (float): 전체 처리 시간
+
+    Returns:
+        dict: 보고서 내용
+    """
+    total_rows = sum(result.rows for result in results)
+    report = {
+        "files": len(results),
+        "succeeded": sum(result.status == "ok" for result in results),
+        "failed": sum(result.status != "ok" for result in results),
+        "rows": total_rows,
+        "files_written": sum(result.files_written for result in results),
+        "parts_written": sum(result.parts_written for result in results),
+        "bytes_written": sum(result.bytes_written for result in results),
+        "seconds": total_seconds,
+        "rows_per_second": total_rows / total_seconds if total_seconds > 0 else 0.0,
+        "results": [asdict(result) for result in results],
+    }
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    columns = ["file_name", "status", "rows", "groups", "files_written", "parts_written",
+               "bytes_written", "seconds", "rows_per_second", "error"]
+    csv_path = os.path.splitext(report_path)[0] + ".csv"
+    # 엑셀에서 바로 열 수 있도록 BOM 포함 UTF-8로 저장
+    with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for result in results:
+            row = asdict(result)
+            writer.writerow([row[column] for column in columns])
+
+    logger.info(f"일괄 처리 보고서 저장: {report_path}")
+    return report
@@ -0,0 +1,146 @@
+"""
+그룹들을 하나의 출력물로 묶어 저장 (워크북 하나에 그룹별 시트, ZIP 묶음)
+
+그룹마다 파일을 만들면 파일 생성/zip 컨테이너/공유 문자열 비용이 그룹 수만큼 들기 때문에,
+그룹이 많을 때는 묶음 출력이 훨씬 빠르다.
+"""
+
+import logging
+import os
+import re
+import zipfile
+
+from .excel_writers import MAX_ROWS, XlsxWorkbookWriter
+
+logger = logging.getLogger(__name__)
+
+# 시트 이름 최대 길이
+SHEET_NAME_MAX = 31
+
+# 워크북 하나에 담을 최대 시트 수 (엑셀 자체 제한은 메모리뿐이지만 실사용 한계로 제한)
+MAX_SHEETS_PER_WORKBOOK = 1000
+
+# 워크북 하나의 최대 시트 XML 크기 (압축 전, bytes)
+MAX_WORKBOOK_BYTES = 1024 ** 3
+
+# 시트 이름에 사용할 수 없는 문자
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def sheet_name(label, used):
+    """
+    엑셀 규칙에 맞는 고유한 시트 이름 생성
+
+    사용할 수 없는 문자를 제거하고 31자로 자르며, 대소문자 구분 없이 겹치면
+    " (2)", " (3)" ... 을 붙인다.
+
+    Args:
+        label (str): 원하는 이름
+        used (set): 이미 사용한 시트 이름 (소문자). 생성된 이름이 추가된다.
+
+    Returns:
+        str: 시트 이름
+    """
+    base = _INVALID_SHEET_CHARS.sub("", label).strip("'")
+    # "History"는 엑셀 예약 시트 이름
+    if not base or base.lower() == "history":
+        base = f"_{base}" if base else "NA"
+
+    name = base[:SHEET_NAME_MAX]
+    count = 1
+    while name.lower() in used:
+        count += 1
+        suffix = f" ({count})"
+        name = base[:SHEET_NAME_MAX - len(suffix)] + suffix
+    used.add(name.lower())
+    return name
+
+
+def write_sheet_bundles(parts, workbook_path, on_part=None, on_written=None,
+                        max_sheets=MAX_SHEETS_PER_WORKBOOK, max_bytes=MAX_WORKBOOK_BYTES):
+    """
+    그룹마다 시트 하나씩 워크북에 저장
+
+    시트 수나 크기가 제한을 넘으면 다음 워크북(_2, _3 ...)으로 넘어가고,
+    시트 최대 행 수를 넘는 그룹은 여러 시트로 나누어 저장한다.
+
+    Args:
+        parts (Iterable[tuple]): (시트 이름 후보, DataFrame) 목록
+        workbook_path (str): 첫 번째 워크북 경로 (이후 워크북은 이름 뒤에 _2, _3 ...)
+        on_part (Callable[[], None]): 그룹 하나를 시트로 저장할 때마다 호출
+        on_written (Callable[[int], None]): 워크북 하나의 저장을 마칠 때마다 호출 (인자: 파일 크기)
+        max_sheets (int): 워크북당 최대 시트 수
+        max_bytes (int): 워크북당 최대 시트 XML 크기
+
+    Returns:
+        list: 저장된 워크북 경로
+    """
+    base, ext = os.path.splitext(workbook_path)
+    output_files = []
+    writer = None
+    used = set()
+
+    def finish():
+        writer.close()
+        output_files.append(writer.output_path)
+        logger.info(f"{os.path.basename(writer.output_path)} 엑셀 파일 저장 완료 (시트 {len(writer.sheets)}개)")
+        if on_written is not None:
+            on_written(writer.bytes_written)
+
+    def next_writer():
+        nonlocal writer, used
+        if writer is not None:
+            finish()
+        index = len(output_files) + 1
+        path = workbook_path if index == 1 else f"{base}_{index}{ext}"
+        writer = XlsxWorkbookWriter(path)
+        used = set()
+
+    try:
+        for label, df in parts:
+            header = list(df.columns)
+            rows_per_sheet = MAX_ROWS - 1
+            chunks = [df.iloc[start:start + rows_per_sheet] for start in range(0, max(len(df), 1), rows_per_sheet)]
+            for i, chunk in enumerate(chunks):
+                if writer is None or len(writer.sheets) >= max_sheets or writer.bytes_flushed >= max_bytes:
+                    next_writer()
+                name = sheet_name(label if i == 0 else f"{label} ({i + 1})", used)
+                sheet = writer.add_sheet(name, header=header)
+                sheet.append_rows(chunk.itertuples(index=False, name=None))
+                sheet.flush()
+            if on_part is not None:
+                on_part()
+
+        if writer is None:
+            next_writer()
+        finish()
+    except BaseException:
+        if writer is not None:
+            writer.discard()
+        raise
+    return output_files
+
+
+def write_zip_bundle(file_paths, zip_path, remove_sources=True):
+    """
+    여러 출력 파일을 ZIP 하나로 묶기
+
+    xlsx는 이미 압축되어 있으므로 다시 압축하지 않고 저장(STORED)만 한다.
+
+    Args:
+        file_paths (Iterable[str]): 묶을 파일 경로
+        zip_path (str): 저장할 ZIP 경로
+        remove_sources (bool): 묶은 뒤 원본 파일 삭제 여부
+
+    Returns:
+        int: ZIP 파일 크기 (bytes)
+    """
+    file_paths = list(file_paths)
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for path in file_paths:
+            zf.write(path, arcname=os.path.basename(path))
+    if remove_sources:
+        for path in file_paths:
+            os.remove(path)
+    logger.info(f"{os.path.basename(zip_path)} 묶음 저장 완료 (파일 {len(file_paths)}개)")
+    return os.path.getsize(zip_path)
@@ -0,0 +1,207 @@
+"""
+Parquet/Feather 출력 (hive 방식 파티션 폴더 구조)
+
+프레임을 그룹 순으로 한 번만 재배열해 Arrow 테이블로 바꾼 뒤, 그룹마다 테이블 구간을
+복사 없이 잘라(slice) 저장한다. 출력 구조는 다음과 같다.
+
+    <출력 폴더>/<입력 파일명>/<기준 열>=<값>/part-0.parquet
+
+기준 열이 여러 개면 열 순서대로 폴더가 중첩된다 (<열1>=<값1>/<열2>=<값2>/part-0.parquet).
+서로 다른 값이 같은 폴더가 되지 않도록 폴더 이름은 HivePlan으로 저장 전에 정한다.
+기준 열은 폴더 이름에 들어가므로 파일에서는 제외한다 (pyarrow.dataset 등에서
+partitioning="hive"로 읽으면 다시 복원된다).
+"""
+
+import logging
+import os
+import pandas as pd
+
+from .partitioner import partition_indices
+
+logger = logging.getLogger(__name__)
+
+# 출력 형식 -> 파일 확장자
+COLUMNAR_FORMATS = {"parquet": ".parquet", "feather": ".feather"}
+
+# hive 규칙의 결측 값 폴더 이름
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+# 폴더 이름에 쓸 수 없거나 hive 규칙에서 의미가 있는 문자 (%XX로 인코딩, 한글 등은 그대로 둠)
+_ESCAPED_CHARS = '%\\/:*?"<>|=\n\r\t'
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ValueError("Parquet/Feather 출력에는 pyarrow 패키지가 필요합니다.") from e
+    return pyarrow
+
+
+def hive_directory(column_name, value):
+    """
+    hive 규칙의 파티션 폴더 이름 ("열=값", 특수 문자는 %XX로 인코딩)
+
+    Args:
+        column_name: 기준 열 이름
+        value: 그룹 값
+    """
+    value_str = HIVE_NULL if pd.isna(value) else _escape(str(value))
+    return f"{_escape(str(column_name))}={value_str}"
+
+
+def _escape(text):
+    return "".join(f"%{ord(c):02X}" if c in _ESCAPED_CHARS else c for c in text)
+
+
+class HivePlan:
+    """
+    그룹 값 -> hive 파티션 폴더 계획
+
+    서로 다른 그룹 값이 같은 폴더가 되는 경우(대소문자만 다른 값, 숫자 1과 문자열 "1",
+    Windows가 끝의 점/공백을 지워 "a."와 "a"가 같아지는 경우)를 찾아 폴더 이름을 구분한다.
+    폴더 이름은 hive_directory()로 만들어 끝의 점과 공백을 지우고, 같은 상위 폴더 안에서
+    대소문자 구분 없이 겹치면 " (2)", " (3)" ... 을 붙인다 (먼저 계획한 값이 원래 이름 사용).
+    기준 열이 여러 개면 폴더 단계마다 계획하므로 앞 열의 값이 같은 그룹은 상위 폴더를 공유한다.
+    같은 값으로 다시 요청하면 처음 정한 폴더를 그대로 반환한다.
+
+    Attributes:
+        column_names (list): 기준 열 이름 (폴더 단계 순서)
+        renamed (list): (그룹 값, 원래 폴더 이름, 바뀐 폴더 이름) 목록
+    """
+
+    def __init__(self, column_names):
+        self.column_names = list(column_names)
+        self.renamed = []
+        # (상위 폴더의 값들 + 값) -> 폴더 이름
+        self._names = {}
+        # 상위 폴더의 값들 -> 그 안에서 사용한 폴더 이름 (소문자)
+        self._used = {}
+
+    def assign(self, values):
+        """
+        여러 그룹 값의 파티션 폴더를 한 번에 계획
+
+        Args:
+            values (Iterable): 그룹 값 (열 조합 기준이면 튜플)
+
+        Returns:
+            list[str]: 값마다 데이터셋 폴더 기준 상대 경로
+        """
+        return [self.directory(value) for value in values]
+
+    def directory(self, value):
+        """
+        그룹 값 하나의 파티션 폴더 상대 경로 (처음 요청하면 계획에 추가)
+        """
+        values = value if isinstance(value, tuple) else (value,)
+        folders = []
+        key = ()
+        for column_name, item in zip(self.column_names, values):
+            # NaN은 자기 자신과 같지 않으므로 None으로 바꿔 조회
+            if not isinstance(item, str) and pd.isna(item):
+                item = None
+            parent, key = key, key + (item,)
+            folder = self._names.get(key)
+            if folder is None:
+                folder = self._names[key] = self._plan(parent, column_name, item)
+            folders.append(folder)
+        return os.path.join(*folders)
+
+    def _plan(self, parent, column_name, value):
+        """상위 폴더 안에서 겹치지 않는 폴더 이름을 정함"""
+        raw = hive_directory(column_name, value)
+        # Windows는 폴더 이름 끝의 점과 공백을 지우고 저장함
+        base = folder = raw.rstrip(". ")
+        used = self._used.setdefault(parent, set())
+        count = 1
+        while folder.lower() in used:
+            count += 1
+            folder = f"{base} ({count})"
+        used.add(folder.lower())
+
+        if folder != raw:
+            self.renamed.append((value, raw, folder))
+            logger.warning(f"파티션 폴더 이름 변경: {raw!r} -> {folder!r} (그룹 값 {value!r})")
+        return folder
+
+
+def to_arrow_table(df):
+    """
+    DataFrame을 Arrow 테이블로 변환
+
+    엑셀에서 읽은 object 열에 숫자와 문자열이 섞여 있으면 Arrow 타입을 정할 수 없으므로
+    그런 열만 문자열로 바꾸어 변환한다.
+    """
+    pa = _require_pyarrow()
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy(deep=False)
+        for i in range(len(df.columns)):
+            column = df.iloc[:, i]
+            if column.dtype == object:
+                df.isetitem(i, column.map(lambda v: v if v is None or pd.isna(v) else str(v)))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_hive_dataset(df, column_idx, dataset_dir, output_format, group_index=None, plan=None, on_written=None,
+                       check_cancelled=None):
+    """
+    그룹별로 hive 파티션 폴더에 Parquet/Feather 파일 저장
+
+    Args:
+        df (pandas.DataFrame): 분할할 데이터
+        column_idx (int | list[int]): 기준 열 인덱스 (0부터 시작, 목록이면 열 조합 기준)
+        dataset_dir (str): 데이터셋 폴더 경로
+        output_format (str): "parquet" 또는 "feather"
+        group_index (GroupIndex): 미리 계산한 그룹 색인 (행 배치가 같을 때만 재사용)
+        plan (HivePlan): 파티션 폴더 계획 (None이면 새로 만듦)
+        on_written (Callable[[int], None]): 파일 하나를 저장할 때마다 호출 (인자: 파일 크기)
+        check_cancelled (Callable[[], None]): 파일 저장 전마다 호출되는 취소 확인 함수
+
+    Returns:
+        list: 저장된 파일 경로 (그룹 순서)
+    """
+    _require_pyarrow()
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+
+    ext = COLUMNAR_FORMATS[output_format]
+    key_columns = column_idx if isinstance(column_idx, list) else [column_idx]
+    column_names = [df.columns[i] for i in key_columns]
+    keys = df.iloc[:, column_idx]
+    if group_index is not None and group_index.matches(keys):
+        uniques, order, bounds = group_index.uniques, group_index.order, group_index.bounds
+    else:
+        uniques, order, bounds = partition_indices(keys)
+
+    # 폴더 이름이 겹치지 않도록 저장 전에 모든 그룹의 폴더를 정함
+    if plan is None:
+        plan = HivePlan(column_names)
+    part_dirs = plan.assign(uniques)
+
+    # 기준 열은 폴더 이름으로 표현하므로 파일에서는 제외
+    data = df.take(order)
+    data = data.iloc[:, [i for i in range(len(df.columns)) if i not in key_columns]]
+    table = to_arrow_table(data)
+
+    output_files = []
+    for i, part_dir in enumerate(part_dirs):
+        if check_cancelled is not None:
+            check_cancelled()
+        part_dir = os.path.join(dataset_dir, part_dir)
+        os.makedirs(part_dir, exist_ok=True)
+        output_path = os.path.join(part_dir, f"part-0{ext}")
+
+        part = table.slice(bounds[i], bounds[i + 1] - bounds[i])
+        if output_format == "parquet":
+            parquet.write_table(part, output_path)
+        else:
+            feather.write_feather(part, output_path)
+
+        output_files.append(output_path)
+        if on_written is not None:
+            on_written(os.path.getsize(output_path))
+    logger.info(f"{dataset_dir} 저장 완료 (파티션 {len(output_files)}개)")
+    return output_files
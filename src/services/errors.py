@@ -0,0 +1,26 @@
+"""
+Excel 파싱 서비스 예외 정의
+"""
+
+
+class PartitionWriteError(Exception):
+    """
+    일부 그룹의 출력 파일 저장에 실패했을 때 발생하는 예외
+
+    실패한 그룹이 있어도 나머지 그룹은 모두 저장을 시도한 뒤 발생한다.
+
+    Attributes:
+        errors (dict): 출력 파일 이름 -> 오류 메시지
+        output_files (list): 저장에 성공한 출력 파일 경로
+    """
+
+    def __init__(self, errors, output_files):
+        self.errors = errors
+        self.output_files = output_files
+        super().__init__(f"{len(errors)}개 파일 저장 실패: {', '.join(errors)}")
+
+
+class JobCancelledError(Exception):
+    """
+    작업이 취소 요청에 의해 중단되었을 때 발생하는 예외
+    """
@@ -2,122 +2,1273 @@
 Excel 파일 파싱 서비스 로직
 """
 
+import contextlib
 import logging
 import os
+import tempfile
+import time
 
 import pandas as pd
 
-logging = logging.getLogger(__name__)
+from .excel_stream_reader import ExcelStreamReader
+from .aggregator import (DEFAULT_AGGREGATIONS, OUTPUT_FILE_COLUMN, AggregateResult, GroupAggregator,
+                         check_aggregations, is_numeric_column)
+from .batch import discover_excel_files, run_batch, write_batch_report
+from .bundle_writer import write_sheet_bundles, write_zip_bundle
+from .columnar_writer import COLUMNAR_FORMATS, HivePlan, write_hive_dataset
+from .errors import PartitionWriteError
+from .filenames import FilenamePlan, group_label
+from .frame_cache import DEFAULT_MAX_BYTES, FrameCache
+from .incremental import SplitManifest, frame_fingerprint
+from .metrics import JobMetrics, SplitResult
+from .parallel_writer import save_frame, write_partitions_parallel
+from .partitioner import GroupIndex, partition_frame
+from .pipeline import PREFETCH_DEPTH, map_bounded, prefetch
+from .profiling import PROFILE_MODES, profile_job
+from .progress import PARTITION_DONE_PERCENT, READ_DONE_PERCENT, STREAM_READ_PERCENT, ProgressTracker
+from .readers import compact_dtypes, get_reader
+from .selection import ColumnSelection, RowFilter
+from .spill import ArrowSpillWriter, CsvSpillWriter, XlsxSpillWriter, estimate_row_bytes
+
+logger = logging.getLogger(__name__)
+
+# 출력 방식
+# files: 그룹마다 엑셀 파일 하나 (기본)
+# sheets: 워크북 하나에 그룹마다 시트 하나 (제한을 넘으면 다음 워크북으로)
+# zip: 그룹별 엑셀 파일을 ZIP 하나로 묶음
+OUTPUT_MODES = ("files", "sheets", "zip")
+
+# 출력 형식
+# excel: 입력 파일과 같은 엑셀 형식 (기본)
+# csv: 그룹마다 CSV 파일 하나
+# parquet, feather: 입력 파일 이름의 폴더 아래 hive 방식(기준열=값) 파티션 폴더 (pyarrow 필요)
+OUTPUT_FORMATS = ("excel", "csv", "parquet", "feather")
+
+# 여러 시트 입력 처리 방식
+# merge: 시트를 모두 이어 붙인 뒤 분할 (그룹마다 파일 하나에 모든 시트의 행)
+# separate: 시트마다 따로 분할 (출력 파일 이름에 시트 이름 포함)
+SHEET_MODES = ("merge", "separate")
+
 
 class ExcelParseService:
     """
     Excel 파일 파싱 서비스
     """
 
-    def __init__(self, input_folder=None, output_folder=None):
+    def __init__(self, input_folder=None, output_folder=None, workers=1, reader="auto",
+                 cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES, output_mode="files",
+                 output_format="excel", io_threads=0):
         """
         ExcelParseService 초기화
         
         Args:
             input_folder (str): 입력 엑셀 파일 폴더 경로
             output_folder (str): 출력 엑셀 파일 폴더 경로
+            workers (int): 그룹별 파일 저장에 사용할 프로세스 수 (1이면 현재 프로세스에서 순차 저장)
+            reader (str | ExcelReader): 엑셀 읽기 엔진 ("auto", "calamine", "arrow", "openpyxl")
+            cache_dir (str): 읽은 데이터를 저장할 캐시 폴더 (None이면 캐시 사용 안 함)
+            cache_max_bytes (int): 캐시 폴더 최대 크기
+            output_mode (str): 출력 방식 ("files", "sheets", "zip")
+            output_format (str): 출력 형식 ("excel", "csv", "parquet", "feather")
+            io_threads (int): 파이프라인 저장 스레드 수. 1 이상이면 읽기/분할과 파일 저장을 겹쳐 실행하고
+                (크기가 제한된 큐로 연결), 0이면 단계를 차례로 실행한다. workers가 2 이상이면 저장은 프로세스 풀이 맡는다.
         """
+        if workers < 1:
+            raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+        if io_threads < 0:
+            raise ValueError(f"io_threads는 0 이상이어야 합니다: {io_threads}")
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"지원하지 않는 출력 방식입니다: {output_mode} (사용 가능: {', '.join(OUTPUT_MODES)})")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format} (사용 가능: {', '.join(OUTPUT_FORMATS)})")
+        if output_mode == "sheets" and output_format != "excel":
+            raise ValueError("출력 방식 sheets는 엑셀 형식에서만 지원합니다.")
+        if output_mode == "zip" and output_format in COLUMNAR_FORMATS:
+            raise ValueError(f"{output_format} 형식은 폴더 구조로 저장되므로 출력 방식 zip을 지원하지 않습니다.")
+        
         self.input_folder = input_folder or os.path.join(os.getcwd(), "input")
         self.output_folder = output_folder or os.path.join(os.getcwd(), "output")
+        self.workers = workers
+        self.reader = get_reader(reader)
+        self.cache = FrameCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.cache_max_bytes = cache_max_bytes
+        self.output_mode = output_mode
+        self.output_format = output_format
+        self.io_threads = io_threads
         
         # 출력 폴더가 없으면 생성
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder, exist_ok=True)
         
-    def read_excel(self, file_path):
+    def read_excel(self, file_path, usecols=None):
         """
         Excel 파일을 읽어 DataFrame으로 변환
         
         Args:
             file_path(str): 엑셀 파일 경로
+            usecols (list[int]): 읽을 열 인덱스 (시트 열 순서, None이면 전체).
+                캐시를 사용하면 다른 작업도 쓸 수 있도록 전체 열을 읽어 캐시에 저장한 뒤 선택한다.
             
         Returns:
             pandas.DataFrame: 엑셀 데이터
         """
+        if self.cache is not None:
+            df = self.cache.load(file_path, reader_name=self.reader.name)
+            if df is not None:
+                return self._select_columns(df, usecols)
+        
         try:
-            logging.info(f"엑셀 파일 읽기 시작: {file_path}")
-            return pd.read_excel(file_path)
+            logger.info(f"엑셀 파일 읽기 시작: {file_path} ({self.reader.name})")
+            df = self.reader.read(file_path, usecols=usecols if self.cache is None else None)
         except Exception as e:
-            logging.error(f"엑셀 파일 읽기 오류: {str(e)}")
-            raise
+            logger.error(f"엑셀 파일 읽기 오류: {str(e)}")
+            raise self._read_error(e, usecols)
+        
+        if self.cache is not None:
+            self.cache.store(file_path, df, reader_name=self.reader.name)
+            return self._select_columns(df, usecols)
+        return df
+    
+    def read_sheets(self, file_path, sheets="all", tracker=None):
+        """
+        여러 시트를 읽어 시트별 DataFrame으로 변환 (워크북은 한 번만 연다)
+        
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheets (str | list[str]): "all"이면 전체 시트, 목록이면 해당 이름의 시트
+            tracker (ProgressTracker): 시트마다 읽은 행 수와 읽기 진행률을 기록 (취소 확인 포함)
+            
+        Returns:
+            dict: 시트 이름 -> DataFrame (워크북 또는 요청 순서)
+        """
+        return dict(self.iter_sheets(file_path, sheets, tracker))
+    
+    def iter_sheets(self, file_path, sheets="all", tracker=None, usecols=None):
+        """
+        여러 시트를 하나씩 읽어 반환 (캐시에 있는 시트는 캐시에서, 나머지는 워크북을 한 번만 열어 읽음)
+        
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheets (str | list[str]): "all"이면 전체 시트, 목록이면 해당 이름의 시트
+            tracker (ProgressTracker): 시트마다 읽은 행 수와 읽기 진행률을 기록 (취소 확인 포함)
+            usecols (list[int]): 시트마다 읽을 열 인덱스 (None이면 전체, 캐시를 사용하면 전체 열을 읽어 저장한 뒤 선택)
+            
+        Yields:
+            tuple: (시트 이름, DataFrame) (워크북 또는 요청 순서)
+        """
+        sheet_names = None if sheets == "all" else list(sheets)
+        if sheet_names is not None and not sheet_names:
+            raise ValueError("읽을 시트를 하나 이상 지정해야 합니다.")
+        
+        cached = {}
+        if self.cache is not None:
+            # 캐시에 있는 시트는 엑셀에서 다시 읽지 않음
+            if sheet_names is None:
+                sheet_names = self.reader.sheet_names(file_path)
+            for name in sheet_names:
+                df = self.cache.load(file_path, sheet_name=name, reader_name=self.reader.name)
+                if df is not None:
+                    cached[name] = df
         
-    def write_excel(self, df, output_file):
+        missing = None if sheet_names is None else [name for name in sheet_names if name not in cached]
+        if missing is None or missing:
+            logger.info(f"엑셀 파일 시트 읽기 시작: {file_path} ({self.reader.name}, "
+                        f"{'전체 시트' if missing is None else ', '.join(missing)})")
+            sheet_frames = self.reader.iter_sheets(file_path, missing,
+                                                   usecols=usecols if self.cache is None else None)
+        else:
+            sheet_frames = iter(())
+        
+        done = 0
         try:
-            logging.info(f"엑셀 파일 저장 시작; {output_file}")
-            output_path = os.path.join(self.output_folder, output_file)
-            df.to_excel(output_path, index=False)
-            logging.info(f"{output_file} 엑셀 파일 저장 완료")
+            while True:
+                # 요청 순서대로: 캐시에 있으면 캐시에서, 없으면 워크북에서 다음 시트 (missing도 요청 순서)
+                if sheet_names is not None and done < len(sheet_names) and sheet_names[done] in cached:
+                    name, df, total = sheet_names[done], cached[sheet_names[done]], len(sheet_names)
+                else:
+                    try:
+                        name, df, total = next(sheet_frames)
+                    except StopIteration:
+                        break
+                    except Exception as e:
+                        logger.error(f"엑셀 파일 읽기 오류: {str(e)}")
+                        raise self._read_error(e, usecols)
+                    if self.cache is not None:
+                        self.cache.store(file_path, df, sheet_name=name, reader_name=self.reader.name)
+                    total = len(sheet_names) if sheet_names is not None else total
+                if self.cache is not None:
+                    df = self._select_columns(df, usecols)
+                done += 1
+                logger.info(f"시트 읽기 완료: {name} ({len(df)}행, {done}/{total})")
+                if tracker is not None:
+                    tracker.rows_read += len(df)
+                    tracker.emit("read", READ_DONE_PERCENT * done / total)
+                    tracker.check_cancelled()
+                yield name, df
+        finally:
+            if hasattr(sheet_frames, "close"):
+                sheet_frames.close()
+        
+    def write_excel(self, df, output_file, output_folder=None):
+        """
+        DataFrame을 출력 폴더에 엑셀 파일로 저장
+
+        xlsx/xlsm은 셀 객체를 만들지 않는 스트리밍 작성기로 저장한다.
+
+        Args:
+            df (pandas.DataFrame): 저장할 데이터
+            output_file (str): 출력 파일 이름
+            output_folder (str): 저장할 폴더 (None이면 서비스 출력 폴더)
+            
+        Returns:
+            int: 저장된 파일 크기 (bytes)
+        """
+        try:
+            logger.info(f"엑셀 파일 저장 시작; {output_file}")
+            output_path = os.path.join(output_folder or self.output_folder, output_file)
+            size = save_frame(df, output_path)
+            logger.info(f"{output_file} 엑셀 파일 저장 완료")
+            return size
         except Exception as e:
-            logging.error(f"엑셀 파일 저장 오류: {str(e)}")
+            logger.error(f"엑셀 파일 저장 오류: {str(e)}")
             raise
         
-    def parse_data(self, file_name, column_num):
+    def preview_groups(self, file_name, column_num):
+        """
+        기준 열만 읽어 그룹 구성을 미리 확인 (2단계 처리의 1단계)
+
+        나머지 열은 읽지 않으므로 열이 많은 시트에서도 빠르다. 반환된 색인을
+        parse_data(groups=...)에 넘기면 그룹 계산을 다시 하지 않는다.
+
+        Args:
+            file_name (str): 처리할 파일 이름
+            column_num (int | list[int]): 처리할 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+
+        Returns:
+            GroupIndex: 그룹 색인 (summary()로 그룹별 행 수 확인)
+        """
+        input_path = os.path.join(self.input_folder, file_name)
+        
+        keys = self._read_columns(input_path, lambda column_count: self._key_column_list(column_num, column_count))
+        groups = GroupIndex(keys if len(keys.columns) > 1 else keys.iloc[:, 0])
+        logger.info(f"그룹 {len(groups)}개, {groups.row_count}행")
+        return groups
+    
+    def aggregate(self, file_name, column_num, value_columns=None, aggregations=DEFAULT_AGGREGATIONS,
+                  streaming=False, batch_size=10000, progress_callback=None, cancel_token=None):
+        """
+        그룹별 파일을 만들지 않고 그룹별 요약 통계만 계산해 요약표 파일 하나로 저장
+
+        기준 열과 값 열만 읽어 그룹별 행 수와 값 열의 집계(개수, 합계, 평균, 최솟값, 최댓값)를 계산한다.
+        값 열에서 숫자가 아닌 셀은 집계에서 제외하고 열별 개수를 경고로 남긴다.
+        요약표는 출력 폴더에 <파일명>_summary.xlsx(출력 형식이 csv이면 .csv)로 저장한다.
+
+        Args:
+            file_name (str): 처리할 파일 이름
+            column_num (int | list[int]): 기준 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+            value_columns (list[int]): 집계할 값 열 번호 (1부터 시작). None이면 기준 열을 제외한 숫자 열 전체
+                (스트리밍 모드에서는 첫 행 묶음으로 판단)
+            aggregations (Iterable[str]): 값 열마다 계산할 집계 ("count", "sum", "mean", "min", "max")
+            streaming (bool): True이면 시트를 행 묶음 단위로 읽으면서 누적한다 (.xlsx/.xlsm, 메모리보다 큰 시트용)
+            batch_size (int): 스트리밍 모드에서 한 번에 읽을 최대 행 수
+            progress_callback (Callable[[ProgressEvent], None]): 진행 상황 이벤트를 받을 함수
+            cancel_token (CancellationToken): 작업 취소 토큰 (취소 시 JobCancelledError 발생)
+
+        Returns:
+            AggregateResult: 요약표(기준 열 값, 행 수, "<열> <집계>" 열, 출력 방식이 files이고 엑셀/CSV 형식이면
+                분할했을 때의 출력 파일 이름 "출력 파일" 열), 요약표 파일 경로, 단계별 계측 값
+        """
+        input_path = os.path.join(self.input_folder, file_name)
+        file_base, file_ext = os.path.splitext(file_name)
+        aggregations = check_aggregations(aggregations)
+        
+        metrics = JobMetrics(file_name)
+        tracker = ProgressTracker(progress_callback, cancel_token, metrics)
+        try:
+            tracker.emit("read", 0)
+            if streaming:
+                aggregator = self._aggregate_streaming(input_path, column_num, value_columns, aggregations,
+                                                       batch_size, tracker)
+            else:
+                aggregator = self._aggregate_frame(input_path, column_num, value_columns, aggregations, tracker)
+            tracker.check_cancelled()
+            
+            summary = aggregator.result()
+            tracker.groups_discovered = len(summary)
+            logger.info(f"그룹 {len(summary)}개, {tracker.rows_read}행 집계")
+            
+            # 같은 설정으로 분할했을 때의 출력 파일 이름
+            if self.output_mode == "files" and self.output_format not in COLUMNAR_FORMATS:
+                with metrics.stage("filenames"):
+                    plan = FilenamePlan(".csv" if self.output_format == "csv" else file_ext)
+                    names = plan.assign(aggregator.group_values, prefix=f"{file_base}_")
+                    summary[OUTPUT_FILE_COLUMN] = [output_file for _, output_file in names]
+            tracker.emit("partition", tracker.write_start_percent)
+            
+            # 요약표 저장
+            summary_file = f"{file_base}_summary{'.csv' if self.output_format == 'csv' else '.xlsx'}"
+            tracker.total_files = 1
+            with metrics.stage("write", rows=len(summary), file=summary_file) as stage:
+                stage.bytes_written = size = self.write_excel(summary, summary_file)
+            tracker.file_written(size)
+        finally:
+            metrics.close()
+        
+        tracker.emit("done", 100)
+        logger.info(f"{file_name} 단계별 처리 시간\n{metrics.summary()}")
+        return AggregateResult(summary, os.path.join(self.output_folder, summary_file), metrics,
+                               {name: count for name, count in aggregator.invalid_values.items() if count})
+    
+    def parse_data(self, file_name, column_num, streaming=False, batch_size=10000,
+                   progress_callback=None, cancel_token=None, groups=None, incremental=False,
+                   memory_budget=None, trace_file=None, trace_memory=False, profile=None,
+                   sheets=None, sheet_mode="merge", filters=None, columns=None):
         """
         입력된 엑셀 파일 처리
 
         Args:
             file_name (str): 처리할 파일 이름
-            column_num (int): 처리할 열 번호 (1부터 시작))
+            column_num (int | list[int]): 처리할 열 번호 (1부터 시작)).
+                목록이면 열 값 조합마다 한 그룹으로 나누고, 출력 파일 이름에 값을 "_"로 이어 붙인다.
+            streaming (bool): True이면 시트를 행 묶음 단위로 읽어 그룹별 임시 파일에 나누어 쓴 뒤
+                출력 파일을 만든다 (.xlsx/.xlsm, 메모리보다 큰 시트용)
+            batch_size (int): 스트리밍 모드에서 한 번에 읽을 최대 행 수
+            progress_callback (Callable[[ProgressEvent], None]): 진행 상황 이벤트를 받을 함수
+            cancel_token (CancellationToken): 작업 취소 토큰 (취소 시 JobCancelledError 발생)
+            groups (GroupIndex): preview_groups()로 미리 계산한 그룹 색인.
+                지정하면 나머지 열을 메모리를 덜 쓰는 타입으로 변환해 읽고 그룹 계산을 재사용한다.
+            incremental (bool): True이면 출력 폴더의 매니페스트와 비교해 내용이 바뀐 그룹만 다시 저장하고,
+                사라진 그룹의 출력 파일은 삭제한다.
+            memory_budget (int): 스트리밍 모드에서 읽기 묶음과 그룹 버퍼가 사용할 메모리 상한 (bytes, 추정치).
+                None이면 batch_size만큼 읽을 때마다 그룹 버퍼를 디스크로 내보낸다.
+            trace_file (str): 단계별 실행 구간을 기록할 trace 파일 경로 (chrome://tracing, Perfetto에서 열람)
+            trace_memory (bool): True이면 tracemalloc으로 단계별 최대 메모리 측정 (실행이 느려짐)
+            profile (str): 프로파일링 방식 ("cprofile", "sampling", None이면 사용 안 함).
+                출력 폴더에 <파일명>_profile.prof(.folded)와 상위 함수 요약 <파일명>_profile.txt를 저장한다.
+                workers가 2 이상일 때 작업 프로세스에서의 저장은 포함되지 않는다. io_threads의 저장/미리 읽기
+                스레드는 cprofile에서는 합쳐 기록되고, sampling에서는 작업 스레드가 기다린 시간으로만 나타난다.
+            sheets (str | list[str]): 처리할 시트 ("all"이면 전체 시트, 목록이면 해당 이름의 시트,
+                None이면 첫 번째 시트만). 워크북은 한 번만 열어 시트들이 공유 문자열 파싱 결과를 함께 쓴다.
+            sheet_mode (str): 여러 시트 처리 방식 ("merge": 시트를 이어 붙여 분할,
+                "separate": 시트마다 분할하고 출력 파일 이름을 <파일명>_<시트>_<값>으로 저장)
+            filters (list[str | Condition]): 행 조건 ("<열 번호><연산자><값>", 예: "3>=100", "2 in 서울,부산").
+                모든 조건을 만족하는 행만 분할하며, 읽은 직후(스트리밍이면 행마다) 적용한다.
+            columns (list[int]): 출력 파일에 저장할 열 번호 (1부터 시작, 지정한 순서, None이면 전체).
+                지정하면 출력 열, 기준 열, 조건 열만 읽는다. 기준 열을 포함하지 않아도 기준 열로 분할한다.
+            
+        Returns:
+            SplitResult: 생성된 출력 파일 경로 목록 (list). metrics 속성으로 단계별 계측 값(JobMetrics),
+                profile_files 속성으로 프로파일 결과 파일 경로, filename_plan 속성으로 그룹 값별 출력 파일 이름
+                (FilenamePlan, 이름이 겹쳐 바뀐 그룹은 renamed) 확인
         """
         input_path = os.path.join(self.input_folder, file_name)
         
-        # 엑셀 파일 읽기
-        df = self.read_excel(input_path)
+        if incremental and self.output_mode != "files":
+            raise ValueError("증분 처리는 출력 방식이 files일 때만 지원합니다.")
+        if incremental and self.output_format in COLUMNAR_FORMATS:
+            raise ValueError(f"증분 처리는 {self.output_format} 형식에서 지원하지 않습니다.")
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 프로파일링 방식입니다: {profile} (사용 가능: {', '.join(PROFILE_MODES)})")
+        if sheet_mode not in SHEET_MODES:
+            raise ValueError(f"지원하지 않는 시트 처리 방식입니다: {sheet_mode} (사용 가능: {', '.join(SHEET_MODES)})")
+        if sheets is not None and groups is not None:
+            raise ValueError("미리 계산한 그룹 색인(groups)은 첫 번째 시트만 처리할 때 사용할 수 있습니다.")
+        
+        if streaming:
+            if sheets is not None:
+                raise ValueError("스트리밍 모드는 여러 시트 입력을 지원하지 않습니다.")
+            if incremental:
+                raise ValueError("증분 처리는 스트리밍 모드에서 지원하지 않습니다.")
+            if self.output_mode != "files":
+                raise ValueError("스트리밍 모드는 출력 방식이 files일 때만 지원합니다.")
+        
+        row_filter = RowFilter(filters or ())
+        selection = ColumnSelection(column_num, columns, row_filter) if row_filter or columns is not None else None
+        
+        metrics = JobMetrics(file_name, trace_memory=trace_memory, trace_file=trace_file)
+        tracker = ProgressTracker(progress_callback, cancel_token, metrics)
+        profile_files = []
+        try:
+            with contextlib.ExitStack() as stack:
+                if profile is not None:
+                    profile_base = os.path.join(self.output_folder, os.path.splitext(file_name)[0])
+                    profile_files = stack.enter_context(profile_job(profile, profile_base))
+                if streaming:
+                    output_files, filename_plan = self._parse_data_streaming(
+                        input_path, file_name, column_num, batch_size, tracker, memory_budget, selection)
+                else:
+                    output_files, filename_plan = self._parse_data(
+                        input_path, file_name, column_num, tracker, groups, incremental, sheets, sheet_mode,
+                        selection)
+        finally:
+            metrics.close()
+        logger.info(f"{file_name} 단계별 처리 시간\n{metrics.summary()}")
+        return SplitResult(output_files, metrics, profile_files, filename_plan)
+    
+    def parse_excel(self, file_path, column_num=1, progress_callback=None, cancel_token=None, **options):
+        """
+        경로로 지정한 엑셀 파일 처리 (UI 작업 스레드용)
+
+        Args:
+            file_path (str): 처리할 엑셀 파일 경로
+            column_num (int | list[int]): 처리할 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+            progress_callback (Callable[[ProgressEvent], None]): 진행 상황 이벤트를 받을 함수
+            cancel_token (CancellationToken): 작업 취소 토큰
+            **options: parse_data의 나머지 옵션 (streaming, batch_size, groups, incremental, memory_budget, profile 등)
+
+        Returns:
+            dict: 출력 파일 이름 -> 출력 파일 경로 (프로파일링했으면 프로파일 결과 파일 포함)
+        """
+        folder, file_name = os.path.split(os.path.abspath(file_path))
+        input_folder = self.input_folder
+        self.input_folder = folder
+        try:
+            output_files = self.parse_data(file_name, column_num, progress_callback=progress_callback,
+                                           cancel_token=cancel_token, **options)
+        finally:
+            self.input_folder = input_folder
+        return {os.path.basename(path): path for path in [*output_files, *output_files.profile_files]}
+    
+    def parse_folder(self, column_num, file_workers=2, report_file="batch_report.json", **options):
+        """
+        입력 폴더의 모든 엑셀 파일을 일괄 처리
+
+        파일 단위로 프로세스 풀에서 처리하여 파일 간 읽기와 쓰기가 겹치도록 하고,
+        파일별 처리 시간과 처리량을 출력 폴더의 보고서(JSON, CSV)로 저장한다.
+        한 파일이 실패해도 나머지 파일은 계속 처리한다.
+
+        Args:
+            column_num (int | list[int]): 처리할 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+            file_workers (int): 동시에 처리할 파일 수
+            report_file (str): 출력 폴더에 저장할 보고서 파일 이름 (None이면 저장 안 함)
+            **options: parse_data의 나머지 옵션 (streaming, batch_size, incremental, memory_budget, profile, sheets, sheet_mode,
+                filters, columns)
+
+        Returns:
+            list[BatchFileResult]: 파일별 처리 결과
+        """
+        file_names = discover_excel_files(self.input_folder)
+        logger.info(f"일괄 처리 시작: {self.input_folder} ({len(file_names)}개 파일, 동시 {file_workers}개)")
+        
+        service_options = {
+            "input_folder": self.input_folder,
+            "output_folder": self.output_folder,
+            # 파일 단위로 병렬 처리할 때는 파일 안의 저장은 순차로
+            "workers": self.workers if file_workers <= 1 else 1,
+            "reader": self.reader,
+            "cache_dir": self.cache.cache_dir if self.cache is not None else None,
+            "cache_max_bytes": self.cache_max_bytes,
+            "output_mode": self.output_mode,
+            "output_format": self.output_format,
+            "io_threads": self.io_threads,
+        }
+        
+        started = time.perf_counter()
+        results = run_batch(service_options, file_names, column_num, options, file_workers)
+        total_seconds = time.perf_counter() - started
+        
+        failed = [result.file_name for result in results if result.status != "ok"]
+        logger.info(f"일괄 처리 완료: {len(results) - len(failed)}개 성공, {len(failed)}개 실패 ({total_seconds:.2f}초)")
         
-        # 사용자 입력 값 -> 인덱스로 변환
+        if report_file:
+            write_batch_report(results, os.path.join(self.output_folder, report_file), total_seconds)
+        return results
+    
+    def _column_index(self, column_num, column_count):
+        """
+        사용자 입력 열 번호(1부터 시작)를 검사하고 인덱스로 변환
+        """
         column_idx = column_num - 1
+        if column_idx < 0 or column_idx >= column_count:
+            raise ValueError(f"요청된 열 번호 {column_num}이 유효하지 않습니다. 열 범위는 1-{column_count} 입니다.")
+        return column_idx
+    
+    def _select_columns(self, df, usecols):
+        """
+        읽은 전체 열에서 usecols 열만 선택 (캐시에서 읽은 데이터용, 열 번호 검사 포함)
+        """
+        if usecols is None:
+            return df
+        self._column_index(max(usecols) + 1, len(df.columns))
+        return df.iloc[:, usecols]
+    
+    def _read_error(self, error, usecols):
+        """
+        usecols로 읽다가 열 범위를 벗어나 실패한 오류를 열 번호 오류로 변환 (그 외 오류는 그대로)
+        """
+        if usecols is None or not isinstance(error, pd.errors.ParserError):
+            return error
+        columns = ", ".join(str(i + 1) for i in usecols)
+        return ValueError(f"요청된 열 번호({columns}) 중 시트에 없는 열이 있습니다: {error}")
+    
+    def _key_columns(self, column_num, column_count):
+        """
+        기준 열 번호(하나 또는 목록)를 검사하고 인덱스로 변환
+
+        Returns:
+            int | list[int]: 열이 하나면 인덱스, 여러 개면 인덱스 목록
+        """
+        if not isinstance(column_num, (list, tuple)):
+            return self._column_index(column_num, column_count)
+        if not column_num:
+            raise ValueError("기준 열 번호를 하나 이상 지정해야 합니다.")
+        if len(set(column_num)) != len(column_num):
+            raise ValueError(f"기준 열 번호가 중복되었습니다: {list(column_num)}")
+        column_idx = [self._column_index(num, column_count) for num in column_num]
+        return column_idx if len(column_idx) > 1 else column_idx[0]
+    
+    def _key_column_list(self, column_num, column_count):
+        """
+        기준 열 번호(하나 또는 목록)를 검사하고 인덱스 목록으로 변환
+        """
+        column_idx = self._key_columns(column_num, column_count)
+        return column_idx if isinstance(column_idx, list) else [column_idx]
+    
+    def _value_column_list(self, value_columns, key_columns, column_count):
+        """
+        값 열 번호 목록을 검사하고 인덱스 목록으로 변환 (기준 열과 겹치거나 중복되면 ValueError)
+        """
+        if not value_columns:
+            raise ValueError("값 열 번호를 하나 이상 지정해야 합니다.")
+        if len(set(value_columns)) != len(value_columns):
+            raise ValueError(f"값 열 번호가 중복되었습니다: {list(value_columns)}")
+        value_idx = [self._column_index(num, column_count) for num in value_columns]
+        overlap = [i + 1 for i in value_idx if i in key_columns]
+        if overlap:
+            raise ValueError(f"기준 열은 값 열로 지정할 수 없습니다: {overlap}")
+        return value_idx
+    
+    def _read_columns(self, input_path, select):
+        """
+        필요한 열만 읽기 (캐시에 전체 데이터가 있으면 엑셀을 다시 읽지 않고 캐시에서 선택)
+
+        Args:
+            input_path (str): 엑셀 파일 경로
+            select (Callable[[int], list[int]]): 시트의 열 수 -> 읽을 열 인덱스 목록 (열 번호 검사 포함)
+
+        Returns:
+            pandas.DataFrame: select가 반환한 순서의 열
+        """
+        cached = self.cache.load(input_path, reader_name=self.reader.name) if self.cache is not None else None
+        if cached is not None:
+            return cached.iloc[:, select(len(cached.columns))]
         
-        # 열 번호 유효성 검사
-        if column_idx < 0 or column_idx >= len(df.columns):
-            raise ValueError(f"요청된 열 번호 {column_num}이 유효하지 않습니다. 열 범위는 1-{len(df.columns)} 입니다.")
+        def select_logged(column_count):
+            column_idx = select(column_count)
+            logger.info(f"열 읽기 시작: {input_path} ({', '.join(str(i + 1) for i in column_idx)}열)")
+            return column_idx
         
-        # 해당 열의 고유 값 추출
-        unique_values = df.iloc[:, column_idx].unique()
-        logging.info(f"고유 값 {len(unique_values)}개 추출: {unique_values}")
+        return self.reader.read_selected(input_path, select_logged)
+    
+    def _aggregate_frame(self, input_path, column_num, value_columns, aggregations, tracker):
+        """
+        기준 열과 값 열만 한 번에 읽어 그룹별 집계 (벡터 연산 한 번)
+
+        값 열을 지정하지 않으면 숫자 열을 찾기 위해 시트 전체를 읽는다.
+
+        Returns:
+            GroupAggregator: 집계를 마친 누적기
+        """
+        metrics = tracker.metrics
+        with metrics.stage("read") as stage:
+            if value_columns is None:
+                df = self.read_excel(input_path)
+                key_idx = self._key_column_list(column_num, len(df.columns))
+                value_idx = [i for i in range(len(df.columns))
+                             if i not in key_idx and is_numeric_column(df.iloc[:, i])]
+                df = df.iloc[:, key_idx + value_idx]
+            else:
+                def select(column_count):
+                    key_idx = self._key_column_list(column_num, column_count)
+                    return key_idx + self._value_column_list(value_columns, key_idx, column_count)
+                df = self._read_columns(input_path, select)
+            stage.rows = tracker.rows_read = len(df)
+        tracker.emit("read", READ_DONE_PERCENT)
+        tracker.check_cancelled()
+        
+        # df는 기준 열, 값 열 순서로 선택한 열만 남아 있으므로 열 번호가 아닌 기준 열 개수로 나눔
+        key_count = len(column_num) if isinstance(column_num, (list, tuple)) else 1
+        with metrics.stage("aggregate", rows=len(df)):
+            aggregator = GroupAggregator([str(name) for name in df.columns[:key_count]],
+                                         [str(name) for name in df.columns[key_count:]], aggregations)
+            aggregator.update(df.iloc[:, :key_count], df.iloc[:, key_count:])
+        return aggregator
+    
+    def _aggregate_streaming(self, input_path, column_num, value_columns, aggregations, batch_size, tracker):
+        """
+        시트를 행 묶음 단위로 읽으면서 그룹별 집계를 누적 (메모리 사용량은 batch_size에 비례)
+
+        io_threads가 1 이상이면 읽기 스레드가 다음 행 묶음을 미리 읽는 동안 읽은 묶음을 집계한다.
+
+        Returns:
+            GroupAggregator: 집계를 마친 누적기
+        """
+        metrics = tracker.metrics
+        tracker.write_start_percent = STREAM_READ_PERCENT
+        aggregator = None
+        
+        with ExcelStreamReader(input_path, batch_size=batch_size) as reader:
+            header = reader.header
+            key_idx = self._key_column_list(column_num, len(header))
+            value_idx = None
+            if value_columns is not None:
+                value_idx = self._value_column_list(value_columns, key_idx, len(header))
+            
+            batches = self._read_batches(reader, metrics)
+            if self.io_threads:
+                batches = prefetch(batches, metrics.queue("read", PREFETCH_DEPTH))
+            with contextlib.closing(batches):
+                for batch in batches:
+                    tracker.check_cancelled()
+                    with metrics.stage("aggregate", rows=len(batch)):
+                        frame = pd.DataFrame(batch)
+                        if value_idx is None:
+                            # 값 열을 지정하지 않으면 첫 행 묶음에서 숫자 열을 찾음
+                            value_idx = [i for i in range(len(header))
+                                         if i not in key_idx and is_numeric_column(frame.iloc[:, i])]
+                        if aggregator is None:
+                            aggregator = GroupAggregator([str(header[i]) for i in key_idx],
+                                                         [str(header[i]) for i in value_idx], aggregations)
+                        aggregator.update(frame.iloc[:, key_idx], frame.iloc[:, value_idx])
+                    
+                    tracker.rows_read += len(batch)
+                    tracker.groups_discovered = aggregator.group_count
+                    logger.info(f"{tracker.rows_read}행 집계, 그룹 {aggregator.group_count}개")
+                    if reader.total_rows:
+                        tracker.emit("read", STREAM_READ_PERCENT * min(tracker.rows_read / reader.total_rows, 1))
+                    else:
+                        tracker.emit("read", 0)
+        
+        if aggregator is None:
+            # 데이터 행이 없는 시트
+            aggregator = GroupAggregator([str(header[i]) for i in key_idx],
+                                         [str(header[i]) for i in value_idx or []], aggregations)
+        return aggregator
+    
+    def _parse_data(self, input_path, file_name, column_num, tracker, groups=None, incremental=False,
+                    sheets=None, sheet_mode="merge", selection=None):
+        """
+        시트 전체를 DataFrame으로 읽은 뒤 그룹별로 분할하여 저장
+
+        여러 시트를 시트마다 분할(separate)하면 모든 시트의 그룹을 한 번에 모아 저장하므로
+        workers가 2 이상이면 시트와 상관없이 병렬로 저장된다.
+
+        Returns:
+            tuple: (출력 파일 경로 목록, FilenamePlan (Parquet/Feather 출력이면 None))
+        """
+        if (self.io_threads and self.output_mode == "files" and not incremental
+                and self.output_format not in COLUMNAR_FORMATS):
+            return self._parse_data_pipelined(input_path, file_name, column_num, tracker, groups, sheets, sheet_mode,
+                                              selection)
+        
+        metrics = tracker.metrics
+        tracker.emit("read", 0)
+        
+        # 엑셀 파일 읽기
+        # frames: (시트 이름, DataFrame) 목록 (시트를 구분하지 않으면 시트 이름은 None)
+        frames = list(self._read_frames(input_path, tracker, sheets, sheet_mode, selection))
+        tracker.emit("read", READ_DONE_PERCENT)
+        tracker.check_cancelled()
         
         # 원본 파일명에서 확장자 추출
         # file_base: 파일명
         # file_ext: 확장자
         file_base, file_ext = os.path.splitext(file_name)
+        if self.output_format == "csv":
+            file_ext = ".csv"
         
-        # 각 고유 값에 대해 별도의 엑셀 파일 생성
-        for value in unique_values:
-            # 값이 NaN인 경우
-            if pd.isna(value):
-                value_str = "NA"
-            else:
-                value_str = str(value)
+        # 모든 시트/그룹의 출력 파일 이름을 저장 전에 한 번에 정해 이름 겹침으로 덮어쓰는 일이 없도록 함
+        plan = FilenamePlan(file_ext)
+        jobs = []
+        labels = []
+        columnar_files = []
+        for sheet_name, df in frames:
+            df, column_idx = self._key_frame(df, column_num, tracker, groups, selection)
             
-            # 파일명에 포함할 수 없는 문자 제거
-            safe_value = "".join(c for c in value_str if c not in r'\/:*?"<>|')
+            # Parquet/Feather: 파티션 폴더 구조로 저장
+            if self.output_format in COLUMNAR_FORMATS:
+                frame_base = f"{file_base}_{group_label(sheet_name)}" if sheet_name is not None else file_base
+                columnar_files += self._write_columnar(df, column_idx, frame_base + file_ext, tracker, groups)
+                continue
             
-            # 해당 값을 가진 데이터만 필터링
-            filtered_df = df[df.iloc[:, column_idx] == value]
+            for filtered_df, output_file, label in self._split_frame(sheet_name, df, column_idx, file_base,
+                                                                     plan, tracker, groups, selection):
+                jobs.append((filtered_df, output_file))
+                labels.append(label)
+        
+        if self.output_format in COLUMNAR_FORMATS:
+            tracker.emit("done", 100)
+            return columnar_files, None
+        tracker.emit("partition", PARTITION_DONE_PERCENT)
+        
+        # 묶음 출력: 워크북 하나(그룹별 시트) 또는 ZIP 하나
+        if self.output_mode == "sheets":
+            output_files = self._write_sheet_bundle(jobs, labels, file_base, tracker)
+            tracker.emit("done", 100)
+            return output_files, plan
+        if self.output_mode == "zip":
+            output_files = self._write_zip_bundle(jobs, file_base, tracker)
+            tracker.emit("done", 100)
+            return output_files, plan
+        
+        # 증분 처리: 매니페스트와 비교해 바뀐 그룹만 저장
+        manifest = None
+        if incremental:
+            with metrics.stage("incremental_plan", rows=tracker.rows_read):
+                jobs, manifest, split_key, fingerprints = self._plan_incremental(file_name, column_num, jobs)
+            tracker.total_files = len(jobs)
+            rows = {output_file: len(part) for part, output_file in jobs}
+        
+        # 엑셀 파일 저장
+        try:
+            written = self._write_partitions(jobs, tracker)
+        except PartitionWriteError as e:
+            if manifest is not None:
+                manifest.update(split_key, fingerprints, rows, [os.path.basename(p) for p in e.output_files])
+            raise
+        if manifest is not None:
+            manifest.update(split_key, fingerprints, rows, [os.path.basename(p) for p in written])
+        
+        # 생성된 파일 경로 반환 (증분 처리로 건너뛴 그룹 포함)
+        tracker.emit("done", 100)
+        return [os.path.join(self.output_folder, file_name) for _, _, _, file_name in plan.entries], plan
+    
+    def _parse_data_pipelined(self, input_path, file_name, column_num, tracker, groups=None, sheets=None,
+                              sheet_mode="merge", selection=None):
+        """
+        읽기, 분할, 저장 단계를 겹쳐 실행하는 처리 (io_threads가 1 이상이고 출력 방식이 files일 때)
+
+        읽기 스레드가 다음 시트를 미리 읽는 동안 읽은 시트를 분할하고, 그룹마다 파일 이름을 정하는
+        즉시 저장 스레드 풀(workers가 2 이상이면 프로세스 풀)로 보낸다. 모든 그룹을 모은 뒤 저장하지
+        않으므로 첫 파일 저장이 분할 직후 시작되고, 저장이 밀리면 분할을 잠시 멈춘다.
+        저장할 전체 파일 수는 시트를 분할할 때마다 늘어난다.
+
+        Returns:
+            tuple: (출력 파일 경로 목록, FilenamePlan)
+        """
+        metrics = tracker.metrics
+        tracker.emit("read", 0)
+        
+        file_base, file_ext = os.path.splitext(file_name)
+        if self.output_format == "csv":
+            file_ext = ".csv"
+        plan = FilenamePlan(file_ext)
+        frames = prefetch(self._read_frames(input_path, tracker, sheets, sheet_mode, selection),
+                          metrics.queue("read", PREFETCH_DEPTH))
+        
+        def jobs():
+            for sheet_name, df in frames:
+                tracker.check_cancelled()
+                df, column_idx = self._key_frame(df, column_num, tracker, groups, selection)
+                for filtered_df, output_file, _ in self._split_frame(sheet_name, df, column_idx, file_base,
+                                                                     plan, tracker, groups, selection):
+                    yield filtered_df, output_file
+        
+        try:
+            self._write_partitions(jobs(), tracker)
+        finally:
+            frames.close()
+        
+        tracker.emit("done", 100)
+        return [os.path.join(self.output_folder, file_name) for _, _, _, file_name in plan.entries], plan
+    
+    def _read_frames(self, input_path, tracker, sheets=None, sheet_mode="merge", selection=None):
+        """
+        분할할 데이터를 읽기 (시트마다 나누어 분할하면 시트를 읽을 때마다 반환)
+
+        행 조건과 출력 열 선택(selection)이 있으면 필요한 열만 읽고, 읽은 직후 조건에 맞는 행만 남긴다.
+
+        Yields:
+            tuple: (시트 이름, DataFrame), 시트를 구분하지 않으면 시트 이름은 None
+        """
+        metrics = tracker.metrics
+        usecols = selection.usecols if selection is not None else None
+        if sheets is None or sheet_mode == "merge":
+            with metrics.stage("read") as stage:
+                if sheets is None:
+                    df = self.read_excel(input_path, usecols)
+                else:
+                    df = self._merge_sheets(list(self.iter_sheets(input_path, sheets, tracker, usecols)))
+                stage.rows = tracker.rows_read = len(df)
+            yield None, self._apply_selection(df, selection, metrics)
+            return
+        
+        sheet_frames = self.iter_sheets(input_path, sheets, tracker, usecols)
+        while True:
+            with metrics.stage("read") as stage:
+                sheet_name, df = next(sheet_frames, (None, None))
+                stage.rows = len(df) if df is not None else 0
+            if df is None:
+                return
+            yield sheet_name, self._apply_selection(df, selection, metrics, sheet_name)
+    
+    def _apply_selection(self, df, selection, metrics, sheet_name=None):
+        """
+        읽은 데이터에 행 조건과 출력 열 선택 적용 (selection이 None이면 그대로)
+        """
+        if selection is None:
+            return df
+        with metrics.stage("filter", rows=len(df)):
+            selected = selection.apply(df)
+        if selection.row_filter:
+            logger.info(f"{sheet_name + ' 시트 ' if sheet_name is not None else ''}"
+                        f"행 조건({selection.row_filter}): {len(df)}행 중 {len(selected)}행 선택")
+        return selected
+    
+    def _key_frame(self, df, column_num, tracker, groups=None, selection=None):
+        """
+        기준 열 번호를 검사하고 인덱스로 변환 (2단계 처리면 나머지 열을 메모리를 덜 쓰는 타입으로 변환)
+
+        Returns:
+            tuple: (DataFrame, 기준 열 인덱스)
+        """
+        with tracker.metrics.stage("key_extraction", rows=len(df)):
+            if selection is not None and selection.usecols is not None:
+                # 출력 열을 선택했으면 기준 열 위치는 선택한 열 기준 (열 범위는 읽을 때 검사)
+                self._key_columns(column_num, max(selection.usecols) + 1)
+                column_idx = selection.key_index
+            else:
+                # 사용자 입력 값 -> 인덱스로 변환 및 열 번호 유효성 검사
+                column_idx = self._key_columns(column_num, len(df.columns))
+            
+            # 2단계 처리에서는 기준 열을 제외한 열을 메모리를 덜 쓰는 타입으로 변환
+            if groups is not None:
+                df = compact_dtypes(df, exclude=column_idx if isinstance(column_idx, list) else [column_idx])
+        return df, column_idx
+    
+    def _split_frame(self, sheet_name, df, column_idx, file_base, plan, tracker, groups=None, selection=None):
+        """
+        시트 하나를 그룹별로 분할하고 그룹마다 출력 파일 이름을 정함
+
+        시트마다 분할하면 출력 파일/시트 이름에 시트 이름을 붙인다.
+
+        Returns:
+            list[tuple]: (그룹 DataFrame, 출력 파일 이름, 라벨) 목록
+        """
+        metrics = tracker.metrics
+        sheet_label = group_label(sheet_name) if sheet_name is not None else None
+        frame_base = f"{file_base}_{sheet_label}" if sheet_label is not None else file_base
+        
+        # 해당 열 기준으로 한 번에 그룹 분할
+        with metrics.stage("partition", rows=len(df)):
+            partitions = list(partition_frame(df, column_idx, groups,
+                                              selection.output_width if selection is not None else None))
+        unique_values = [value for value, _ in partitions]
+        logger.info(f"{sheet_name + ' 시트 ' if sheet_name is not None else ''}"
+                    f"고유 값 {len(unique_values)}개 추출: {unique_values}")
+        tracker.groups_discovered += len(unique_values)
+        if self.output_mode == "files":
+            tracker.total_files += len(unique_values)
+        else:
+            tracker.total_parts += len(unique_values)
+        
+        # 각 고유 값에 대해 별도의 엑셀 파일 생성
+        with metrics.stage("filenames"):
+            names = plan.assign(unique_values, prefix=f"{frame_base}_")
+            return [
+                (filtered_df, output_file, f"{sheet_label}_{label}" if sheet_label is not None else label)
+                for (_, filtered_df), (label, output_file) in zip(partitions, names)
+            ]
+    
+    def _merge_sheets(self, frames):
+        """
+        여러 시트를 행 방향으로 이어 붙임 (열 이름 기준으로 맞추고, 없는 열은 빈 값)
+        """
+        columns = list(frames[0][1].columns)
+        for sheet_name, df in frames[1:]:
+            if list(df.columns) != columns:
+                logger.warning(f"시트 '{sheet_name}'의 열 구성이 첫 번째 시트와 다릅니다. 열 이름 기준으로 합칩니다.")
+        if len(frames) == 1:
+            return frames[0][1]
+        return pd.concat([df for _, df in frames], ignore_index=True)
+    
+    def _plan_incremental(self, file_name, column_num, jobs):
+        """
+        매니페스트와 비교해 다시 저장할 그룹만 남기고, 사라진 그룹의 출력 파일 삭제
+
+        Returns:
+            tuple: (저장할 jobs, 매니페스트, 매니페스트 키, 출력 파일 이름 -> 그룹 지문)
+        """
+        if isinstance(column_num, (list, tuple)):
+            column_num = ",".join(str(num) for num in column_num)
+        split_key = f"{file_name}|{column_num}"
+        manifest = SplitManifest(self.output_folder)
+        fingerprints = {output_file: frame_fingerprint(part) for part, output_file in jobs}
+        changed, removed = manifest.plan(split_key, fingerprints)
+        
+        for output_file in removed:
+            output_path = os.path.join(self.output_folder, output_file)
+            if os.path.exists(output_path):
+                logger.info(f"사라진 그룹의 출력 파일 삭제: {output_file}")
+                os.remove(output_path)
+        
+        changed_jobs = [job for job in jobs if job[1] in changed]
+        logger.info(f"증분 처리: 그룹 {len(jobs)}개 중 {len(changed_jobs)}개 저장, {len(removed)}개 삭제")
+        return changed_jobs, manifest, split_key, fingerprints
+    
+    def _write_columnar(self, df, column_idx, file_name, tracker, groups=None):
+        """
+        그룹별로 hive 방식 파티션 폴더에 Parquet/Feather 파일 저장
+
+        Returns:
+            list: 저장된 파일 경로 (그룹 순서)
+        """
+        metrics = tracker.metrics
+        with metrics.stage("partition", rows=len(df)):
+            keys = df.iloc[:, column_idx]
+            if groups is None or not groups.matches(keys):
+                groups = GroupIndex(keys)
+        tracker.groups_discovered += len(groups)
+        tracker.total_files += len(groups)
+        tracker.emit("partition", PARTITION_DONE_PERCENT)
+        
+        dataset_dir = os.path.join(self.output_folder, os.path.splitext(file_name)[0])
+        logger.info(f"{self.output_format} 파일 저장 시작; {dataset_dir} (파티션 {len(groups)}개)")
+        with metrics.stage("write", rows=len(df), file=dataset_dir) as stage:
+            def on_written(size):
+                stage.bytes_written += size
+                tracker.file_written(size)
             
-            # 엑셀 파일 저장
-            output_file = f"{file_base}_{safe_value}{file_ext}"
-            self.write_excel(filtered_df, output_file)
+            return write_hive_dataset(df, column_idx, dataset_dir, self.output_format, group_index=groups,
+                                      on_written=on_written, check_cancelled=tracker.check_cancelled)
+    
+    def _write_sheet_bundle(self, jobs, labels, file_base, tracker):
+        """
+        모든 그룹을 워크북 하나에 그룹별 시트로 저장 (제한을 넘으면 다음 워크북으로)
+
+        Returns:
+            list: 저장된 워크북 경로
+        """
+        workbook_path = os.path.join(self.output_folder, f"{file_base}_groups.xlsx")
+        logger.info(f"엑셀 파일 저장 시작; {os.path.basename(workbook_path)} (시트 {len(jobs)}개)")
         
-        # 생성된 파일 경로 반환
+        rows = sum(len(df) for df, _ in jobs)
+        with tracker.metrics.stage("write", rows=rows, file=os.path.basename(workbook_path)) as stage:
+            def on_part():
+                tracker.check_cancelled()
+                tracker.part_written()
+            
+            def on_written(size):
+                stage.bytes_written += size
+                tracker.file_written(size)
+            
+            parts = ((label, df) for label, (df, _) in zip(labels, jobs))
+            return write_sheet_bundles(parts, workbook_path, on_part=on_part, on_written=on_written)
+    
+    def _write_zip_bundle(self, jobs, file_base, tracker):
+        """
+        그룹별 엑셀 파일을 임시 폴더에 저장한 뒤 ZIP 하나로 묶음
+
+        Returns:
+            list: 저장된 ZIP 경로
+        """
+        zip_path = os.path.join(self.output_folder, f"{file_base}_groups.zip")
+        with tempfile.TemporaryDirectory(prefix="excel-parser-", dir=self.output_folder) as temp_folder:
+            written = self._write_partitions(jobs, tracker, temp_folder, bundle=True)
+            tracker.check_cancelled()
+            with tracker.metrics.stage("bundle", file=os.path.basename(zip_path)) as stage:
+                stage.bytes_written = size = write_zip_bundle(written, zip_path)
+        tracker.file_written(size)
+        return [zip_path]
+    
+    def _write_partitions(self, jobs, tracker, output_folder=None, bundle=False):
+        """
+        그룹별 출력 파일 저장
+
+        workers가 2 이상이면 프로세스 풀에서, io_threads가 1 이상이면 스레드 풀에서 병렬로 저장한다.
+        한 그룹의 저장이 실패해도 나머지 그룹은 계속 저장하며, 실패가 있으면 모두 끝난 뒤
+        PartitionWriteError를 발생시킨다.
+
+        Args:
+            jobs (Iterable[tuple]): (DataFrame, 출력 파일 이름) 목록. 병렬 저장이면 제너레이터를 넘겨
+                앞 단계와 저장을 겹쳐 실행할 수 있다.
+            tracker (ProgressTracker): 진행 상황 기록
+            output_folder (str): 저장할 폴더 (None이면 서비스 출력 폴더)
+            bundle (bool): True이면 ZIP으로 묶을 임시 파일이므로 진행 상황에 저장한 파일 대신
+                묶음 항목으로 기록 (ZIP 파일은 묶은 뒤 한 번 기록)
+
+        Returns:
+            list: 저장된 출력 파일 경로 (jobs 순서)
+        """
+        output_folder = output_folder or self.output_folder
+        metrics = tracker.metrics
+        file_written = (lambda size: tracker.part_written()) if bundle else tracker.file_written
         output_files = []
-        for value in unique_values:
-            # 값이 NaN인 경우
-            if pd.isna(value):
-                value_str = "NA"
-            else:
-                value_str = str(value)
+        errors = {}
+        
+        if self.workers == 1 and not self.io_threads:
+            for df, output_file in jobs:
+                tracker.check_cancelled()
+                try:
+                    with metrics.stage("write", rows=len(df), file=output_file) as stage:
+                        stage.bytes_written = size = self.write_excel(df, output_file, output_folder)
+                    output_files.append(os.path.join(output_folder, output_file))
+                    file_written(size)
+                except Exception as e:
+                    errors[output_file] = str(e)
+        else:
+            rows = {}
             
-            # 파일명에 포함할 수 없는 문자 제거
-            safe_value = "".join(c for c in value_str if c not in r'\/:*?"<>|')
+            def path_jobs():
+                for df, output_file in jobs:
+                    rows[output_file] = len(df)
+                    yield df, os.path.join(output_folder, output_file)
             
-            # 출력 파일 경로 추가
-            output_files.append(os.path.join(self.output_folder, f"{file_base}_{safe_value}{file_ext}"))
+            if self.workers > 1:
+                logger.info(f"출력 파일을 {self.workers}개 프로세스로 저장")
+                results = write_partitions_parallel(path_jobs(), self.workers)
+            else:
+                logger.info(f"출력 파일을 {self.io_threads}개 스레드로 저장")
+                results = self._write_partitions_threaded(path_jobs(), metrics)
+            try:
+                for output_path, size, error, seconds in results:
+                    output_file = os.path.basename(output_path)
+                    # 작업 프로세스/스레드에서 측정한 저장 시간 (CPU 시간과 메모리는 측정하지 않음)
+                    metrics.record("write", seconds, rows=rows[output_file], bytes_written=size or 0,
+                                   file=output_file, worker=True)
+                    if error is None:
+                        logger.info(f"{output_file} 엑셀 파일 저장 완료")
+                        output_files.append(output_path)
+                        file_written(size)
+                    else:
+                        logger.error(f"엑셀 파일 저장 오류: {output_file}: {error}")
+                        errors[output_file] = error
+                    tracker.check_cancelled()
+            finally:
+                # 취소 등으로 중단되면 대기 중인 작업을 취소하고 프로세스 풀 종료
+                results.close()
         
+        if errors:
+            raise PartitionWriteError(errors, output_files)
         return output_files
+    
+    def _write_partitions_threaded(self, path_jobs, metrics):
+        """
+        파티션들을 저장 스레드 풀에서 저장 (write_partitions_parallel과 같은 형식으로 결과 반환)
+
+        Yields:
+            tuple: (출력 파일 경로, 저장된 파일 크기, 오류 메시지, 저장 시간(초))
+        """
+        stats = metrics.queue("write", self.io_threads * 2, workers=self.io_threads)
+        results = map_bounded(lambda job: save_frame(*job), path_jobs, self.io_threads, stats)
+        try:
+            for (_, output_path), size, error, seconds in results:
+                yield output_path, size, None if error is None else str(error) or type(error).__name__, seconds
+        finally:
+            results.close()
+    
+    def _parse_data_streaming(self, input_path, file_name, column_num, batch_size, tracker, memory_budget=None,
+                              selection=None):
+        """
+        시트를 행 묶음 단위로 읽으면서 각 행을 해당 그룹의 출력 파일로 바로 보내는 처리
+
+        그룹마다 작성기(spill 모듈)를 두고 버퍼를 로컬 디스크의 임시 파일로 내보낸 뒤,
+        다 읽으면 그룹별로 최종 출력 파일을 만든다. 메모리 사용량은 시트 전체가 아니라
+        batch_size(또는 memory_budget)에 비례한다.
+
+        memory_budget을 지정하면 첫 행 묶음으로 행 크기를 추정해 읽기 묶음 크기를 예산의 1/4 이하로
+        줄이고, 그룹 버퍼는 예산의 1/2을 넘을 때만 내보낸다(그 전에는 행 묶음마다 내보냄).
+
+        io_threads가 1 이상이면 읽기 스레드가 다음 행 묶음을 미리 읽는 동안 읽은 묶음을 그룹으로
+        나누고(미리 읽은 묶음까지 예산의 1/4 안에 들도록 묶음 크기를 줄임), 최종 출력 파일은
+        저장 스레드 풀에서 만든다.
+
+        행 조건과 출력 열 선택(selection)이 있으면 행마다 조건을 검사해 맞는 행의 출력 열만 그룹 버퍼에 넣는다.
+
+        Returns:
+            tuple: (출력 파일 경로 목록, FilenamePlan (Parquet/Feather 출력이면 None))
+        """
+        file_base, file_ext = os.path.splitext(file_name)
+        if self.output_format == "csv":
+            file_ext = ".csv"
+        dataset_dir = os.path.join(self.output_folder, file_base)
+        
+        metrics = tracker.metrics
+        # 그룹 값 -> 작성기, 처음 등장한 순서 유지
+        writers = {}
+        # 그룹이 처음 등장할 때 이름을 정하므로 앞서 정한 이름과 겹치지 않게 됨
+        plan = FilenamePlan(file_ext)
+        pending_limit = None
+        tracker.write_start_percent = STREAM_READ_PERCENT
+        tracker.emit("read", 0)
+        
+        try:
+            with ExcelStreamReader(input_path, batch_size=batch_size) as reader:
+                header = reader.header
+                
+                # 열 번호 유효성 검사
+                column_idx = self._key_columns(column_num, len(header))
+                composite = isinstance(column_idx, list)
+                key_columns = column_idx if composite else [column_idx]
+                # Parquet/Feather는 파일 이름 대신 파티션 폴더를 그룹이 처음 등장할 때 정함
+                names = HivePlan([header[i] for i in key_columns]) if self.output_format in COLUMNAR_FORMATS else plan
+                
+                # 행 조건과 출력 열 (열 번호 유효성 검사 포함)
+                matches = project = None
+                output_columns = None
+                if selection is not None:
+                    for column in selection.row_filter.columns + (selection.output_columns or []):
+                        self._column_index(column + 1, len(header))
+                    if selection.row_filter:
+                        matches = selection.row_filter.matcher()
+                    project, _ = selection.row_projection(header)
+                    output_columns = selection.output_columns
+                rows_selected = 0
+                
+                batches = self._read_batches(reader, metrics)
+                if self.io_threads:
+                    batches = prefetch(batches, metrics.queue("read", PREFETCH_DEPTH))
+                # 동시에 메모리에 있는 행 묶음 수 (처리 중인 묶음 + 미리 읽은 묶음)
+                batches_in_flight = 1 + PREFETCH_DEPTH if self.io_threads else 1
+                # 중단되면 읽기 스레드를 멈추고 나서 워크북을 닫음
+                with contextlib.closing(batches):
+                    for batch in batches:
+                        tracker.check_cancelled()
+                        if memory_budget and pending_limit is None:
+                            row_bytes = estimate_row_bytes(batch)
+                            reader.batch_size = max(1, min(batch_size,
+                                                           memory_budget // 4 // batches_in_flight // row_bytes))
+                            pending_limit = max(1, memory_budget // 2 // row_bytes)
+                            logger.info(f"메모리 예산 {memory_budget:,} bytes: 행당 약 {row_bytes} bytes, "
+                                        f"읽기 묶음 {reader.batch_size}행, 그룹 버퍼 최대 {pending_limit}행")
+                        
+                        with metrics.stage("route", rows=len(batch)):
+                            for row in batch:
+                                if matches is not None and not matches(row):
+                                    continue
+                                rows_selected += 1
+                                
+                                # NaN/빈 셀은 하나의 그룹으로 묶음
+                                if composite:
+                                    value = tuple(None if row[i] is None or pd.isna(row[i]) else row[i]
+                                                  for i in column_idx)
+                                else:
+                                    value = row[column_idx]
+                                    if value is None or pd.isna(value):
+                                        value = None
+                            
+                                writer = writers.get(value)
+                                if writer is None:
+                                    writer = self._spill_writer(value, header, key_columns, file_base, names,
+                                                                dataset_dir, auto_flush=pending_limit is None,
+                                                                output_columns=output_columns)
+                                    writers[value] = writer
+                                writer.append(row if project is None else project(row))
+                        
+                        # 그룹 버퍼를 디스크로 내보냄 (예산이 있으면 예산을 넘을 때만)
+                        pending_rows = sum(w.pending_rows for w in writers.values())
+                        if pending_limit is None or pending_rows > pending_limit:
+                            with metrics.stage("spill", rows=pending_rows):
+                                for writer in writers.values():
+                                    writer.flush()
+                        tracker.rows_read += len(batch)
+                        tracker.groups_discovered = len(writers)
+                        if matches is not None:
+                            logger.info(f"{tracker.rows_read}행 읽음 (조건에 맞는 행 {rows_selected}개), "
+                                        f"그룹 {len(writers)}개")
+                        else:
+                            logger.info(f"{tracker.rows_read}행 읽음, 그룹 {len(writers)}개")
+                        if reader.total_rows:
+                            tracker.emit("read", STREAM_READ_PERCENT * min(tracker.rows_read / reader.total_rows, 1))
+                        else:
+                            tracker.emit("read", 0)
             
+            # 그룹별 출력 파일 저장
+            tracker.total_files = len(writers)
+            if self.io_threads:
+                output_files = self._close_writers_threaded(list(writers.values()), tracker)
+            else:
+                output_files = self._close_writers(writers.values(), tracker)
+        finally:
+            # 취소나 오류로 중단된 경우 남은 임시 파일 정리
+            for writer in writers.values():
+                writer.discard()
+        
+        tracker.emit("done", 100)
+        return output_files, plan if self.output_format not in COLUMNAR_FORMATS else None
+    
+    def _read_batches(self, reader, metrics):
+        """
+        스트리밍 리더의 행 묶음을 읽기 단계로 계측하며 반환
+        """
+        batches = reader.iter_batches()
+        while True:
+            with metrics.stage("read") as stage:
+                batch = next(batches, None)
+                stage.rows = len(batch) if batch else 0
+            if batch is None:
+                return
+            yield batch
+    
+    def _close_writers(self, writers, tracker):
+        """
+        그룹 작성기를 차례로 닫아 최종 출력 파일 저장
 
+        Returns:
+            list: 저장된 출력 파일 경로
+        """
+        metrics = tracker.metrics
+        output_files = []
+        for writer in writers:
+            tracker.check_cancelled()
+            output_file = os.path.basename(writer.output_path)
+            logger.info(f"출력 파일 저장 시작; {output_file}")
+            try:
+                with metrics.stage("write", file=output_file) as stage:
+                    writer.close()
+                    stage.bytes_written = writer.bytes_written
+            except Exception as e:
+                logger.error(f"출력 파일 저장 오류: {str(e)}")
+                raise
+            logger.info(f"{output_file} 출력 파일 저장 완료")
+            output_files.append(writer.output_path)
+            tracker.file_written(writer.bytes_written)
+        return output_files
+    
+    def _close_writers_threaded(self, writers, tracker):
+        """
+        그룹 작성기를 저장 스레드 풀에서 닫아 최종 출력 파일 저장 (결과는 작성기 순서로 기록)
+
+        Returns:
+            list: 저장된 출력 파일 경로
+        """
+        metrics = tracker.metrics
+        output_files = []
+        stats = metrics.queue("write", self.io_threads * 2, workers=self.io_threads)
+        results = map_bounded(lambda writer: writer.close(), writers, self.io_threads, stats)
+        try:
+            for writer, _, error, seconds in results:
+                output_file = os.path.basename(writer.output_path)
+                if error is not None:
+                    logger.error(f"출력 파일 저장 오류: {str(error)}")
+                    raise error
+                metrics.record("write", seconds, bytes_written=writer.bytes_written, file=output_file, worker=True)
+                logger.info(f"{output_file} 출력 파일 저장 완료")
+                output_files.append(writer.output_path)
+                tracker.file_written(writer.bytes_written)
+                tracker.check_cancelled()
+        finally:
+            results.close()
+        return output_files
+    
+    def _spill_writer(self, value, header, key_columns, file_base, plan, dataset_dir, auto_flush=True,
+                      output_columns=None):
+        """
+        출력 형식에 맞는 그룹 작성기 생성 (스트리밍 모드)
+
+        plan은 출력 형식이 Parquet/Feather이면 HivePlan, 그 외에는 FilenamePlan이다.
+        output_columns를 지정하면 작성기는 해당 열만(지정한 순서) 담은 행을 받는다.
+        """
+        output_header = header if output_columns is None else [header[i] for i in output_columns]
+        if self.output_format in COLUMNAR_FORMATS:
+            part_dir = os.path.join(dataset_dir, plan.directory(value))
+            os.makedirs(part_dir, exist_ok=True)
+            output_path = os.path.join(part_dir, f"part-0{COLUMNAR_FORMATS[self.output_format]}")
+            drop_columns = key_columns if output_columns is None else [
+                output_columns.index(i) for i in key_columns if i in output_columns]
+            return ArrowSpillWriter(output_path, output_header, self.output_format, drop_columns=drop_columns)
+        
+        output_path = os.path.join(self.output_folder, plan.name(value, prefix=f"{file_base}_")[1])
+        if self.output_format == "csv":
+            return CsvSpillWriter(output_path, output_header)
+        return XlsxSpillWriter(output_path, output_header, auto_flush=auto_flush)
@@ -0,0 +1,115 @@
+"""
+대용량 엑셀 파일 스트리밍 읽기
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 읽기를 지원하는 확장자 (openpyxl 읽기 전용 모드)
+STREAMABLE_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+class ExcelStreamReader:
+    """
+    openpyxl 읽기 전용 모드로 시트를 행 묶음(batch) 단위로 읽는 리더
+
+    워크북 전체를 메모리에 올리지 않으므로 메모리 사용량은 시트 크기가 아니라
+    batch_size에 비례한다. with 문으로 사용한다.
+    """
+
+    def __init__(self, file_path, sheet_name=None, batch_size=10000):
+        """
+        ExcelStreamReader 초기화
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheet_name (str): 읽을 시트 이름 (None이면 첫 번째 시트)
+            batch_size (int): 한 번에 반환할 행 수
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in STREAMABLE_EXTENSIONS:
+            raise ValueError(f"스트리밍 읽기는 {', '.join(STREAMABLE_EXTENSIONS)} 파일만 지원합니다: {file_path}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size는 1 이상이어야 합니다: {batch_size}")
+
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.batch_size = batch_size
+        self.header = None
+        self.total_rows = None
+        self._workbook = None
+        self._rows = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """워크북을 열고 헤더 행을 읽는다"""
+        from openpyxl import load_workbook
+
+        logger.info(f"엑셀 파일 스트리밍 읽기 시작: {self.file_path}")
+        self._workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        if self.sheet_name is None:
+            sheet = self._workbook.worksheets[0]
+        else:
+            sheet = self._workbook[self.sheet_name]
+
+        # 시트 크기 정보(dimension)가 있으면 진행률 계산용 전체 행 수로 사용 (헤더 제외)
+        if sheet.max_row:
+            self.total_rows = max(sheet.max_row - 1, 0)
+
+        self._rows = sheet.iter_rows(values_only=True)
+        self.header = list(next(self._rows, ()))
+
+        # 헤더 뒤쪽의 빈 셀 제거
+        while self.header and self.header[-1] is None:
+            self.header.pop()
+
+    def close(self):
+        """워크북 닫기"""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+            self._rows = None
+
+    def iter_batches(self):
+        """
+        데이터 행을 batch_size 단위로 반환
+
+        pandas.read_excel과 같이 데이터 사이의 빈 행은 값이 모두 None인 행으로 반환하고 시트 끝의 빈 행은
+        제외하며, 각 행은 헤더 길이에 맞춘다.
+
+        Yields:
+            list[tuple]: 행 묶음
+        """
+        if self._rows is None:
+            raise RuntimeError("리더가 열려 있지 않습니다. with 문 안에서 사용하세요.")
+
+        width = len(self.header)
+        blank = (None,) * width
+        # 아직 반환하지 않은 연속된 빈 행 수 (뒤에 데이터 행이 나올 때만 반환)
+        blank_rows = 0
+        batch = []
+        for row in self._rows:
+            if all(cell is None for cell in row):
+                blank_rows += 1
+                continue
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            elif len(row) > width:
+                row = row[:width]
+            if blank_rows:
+                batch.extend([blank] * blank_rows)
+                blank_rows = 0
+            batch.append(row)
+            while len(batch) >= self.batch_size:
+                yield batch[:self.batch_size]
+                batch = batch[self.batch_size:]
+        if batch:
+            yield batch
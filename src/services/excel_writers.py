@@ -0,0 +1,381 @@
+"""
+분할 결과 출력용 스트리밍 XLSX 작성기
+
+openpyxl 셀 객체를 만들지 않고 시트 XML을 직접 생성한다. 행은 버퍼에 모았다가
+flush()할 때 임시 파일에 이어 쓰므로, 출력 파일이 많아도 열린 파일 핸들이나
+셀 객체가 쌓이지 않는다.
+"""
+
+import datetime
+import decimal
+import logging
+import math
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 작성기로 저장하는 확장자
+XLSX_EXTENSIONS = (".xlsx", ".xlsm")
+
+# 엑셀 시트 한 장의 최대 행 수
+MAX_ROWS = 1048576
+
+# XML에 쓸 수 없는 제어 문자
+_ILLEGAL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+# 스타일 인덱스 (styles.xml의 cellXfs 순서)
+_STYLE_DATETIME = 1
+_STYLE_DATE = 2
+_STYLE_TIME = 3
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+
+_SHEET_CONTENT_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{index}" r:id="rId{index}"/>'
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}'
+    '<Relationship Id="rId{styles_index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_SHEET_REL = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{index}.xml"/>'
+)
+
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="3">'
+    '<numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy-mm-dd"/>'
+    '<numFmt numFmtId="166" formatCode="hh:mm:ss"/>'
+    '</numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="166" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def _string_cell(ref, text):
+    text = _ILLEGAL_CHARS.sub("", text)
+    if text[:1].isspace() or text[-1:].isspace():
+        return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{escape(text)}</t></is></c>'
+
+
+def _cell_xml(ref, value):
+    """
+    값 하나를 셀 XML로 변환 (빈 값이면 빈 문자열)
+
+    Args:
+        ref (str): 셀 참조 (예: "A1")
+        value: 셀 값
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return _string_cell(ref, value) if value else ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if math.isinf(value):
+            return _string_cell(ref, str(value))
+        # numpy.float64도 float이지만 repr이 "np.float64(...)"이므로 파이썬 float로 변환
+        return f'<c r="{ref}"><v>{float(value)!r}</v></c>'
+    if isinstance(value, datetime.datetime):
+        # NaT 등 결측 값
+        if value != value:
+            return ""
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        serial = (value - _EXCEL_EPOCH) / datetime.timedelta(days=1)
+        return f'<c r="{ref}" s="{_STYLE_DATETIME}"><v>{serial!r}</v></c>'
+    if isinstance(value, datetime.date):
+        serial = (datetime.datetime(value.year, value.month, value.day) - _EXCEL_EPOCH).days
+        return f'<c r="{ref}" s="{_STYLE_DATE}"><v>{serial}</v></c>'
+    if isinstance(value, datetime.time):
+        seconds = value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+        return f'<c r="{ref}" s="{_STYLE_TIME}"><v>{seconds / 86400!r}</v></c>'
+    if isinstance(value, decimal.Decimal):
+        return _cell_xml(ref, float(value))
+
+    # numpy 스칼라 등은 파이썬 기본 타입으로 변환
+    item = getattr(value, "item", None)
+    if item is not None:
+        try:
+            converted = item()
+        except (TypeError, ValueError):
+            converted = value
+        if converted is not value:
+            return _cell_xml(ref, converted)
+
+    # pandas.NA 등 결측 값
+    try:
+        if value != value:
+            return ""
+    except TypeError:
+        return ""
+    return _string_cell(ref, str(value))
+
+
+class XlsxSheetWriter:
+    """
+    시트 한 장에 행을 이어 쓰는 작성기
+
+    XlsxWorkbookWriter.add_sheet()로 생성한다.
+    """
+
+    def __init__(self, name, part_path, flush_rows):
+        self.name = name
+        self.row_count = 0
+        # 임시 파일에 기록한 시트 XML 크기 (압축 전)
+        self.bytes_flushed = 0
+        self._part_path = part_path
+        self._flush_rows = flush_rows
+        self._pending = []
+        self._columns = []
+
+    def append(self, row):
+        """
+        행 하나 추가
+
+        Args:
+            row (Sequence): 셀 값 목록
+        """
+        if self.row_count >= MAX_ROWS:
+            raise ValueError(f"시트 '{self.name}'의 행 수가 엑셀 최대 행 수({MAX_ROWS})를 초과합니다.")
+
+        self.row_count += 1
+        columns = self._columns
+        if len(row) > len(columns):
+            from openpyxl.utils import get_column_letter
+            columns.extend(get_column_letter(i + 1) for i in range(len(columns), len(row)))
+
+        r = self.row_count
+        cells = "".join(_cell_xml(f"{columns[i]}{r}", value) for i, value in enumerate(row))
+        self._pending.append(f'<row r="{r}">{cells}</row>')
+
+        if len(self._pending) >= self._flush_rows:
+            self.flush()
+
+    def append_rows(self, rows):
+        """
+        여러 행 추가
+
+        Args:
+            rows (Iterable[Sequence]): 행 목록
+        """
+        for row in rows:
+            self.append(row)
+
+    @property
+    def pending_rows(self):
+        """아직 디스크에 쓰지 않은 행 수"""
+        return len(self._pending)
+
+    def flush(self):
+        """버퍼에 쌓인 행을 임시 파일에 이어 쓰고 버퍼를 비운다"""
+        if not self._pending:
+            return
+        data = "".join(self._pending).encode("utf-8")
+        with open(self._part_path, "ab") as f:
+            f.write(data)
+        self.bytes_flushed += len(data)
+        self._pending = []
+
+
+class XlsxWorkbookWriter:
+    """
+    시트 XML을 직접 생성하는 스트리밍 XLSX 작성기
+
+    각 시트의 행은 임시 파일에 누적되며, close() 시점에 하나의 xlsx(zip)로 묶인다.
+    with 문으로 사용하면 예외가 발생했을 때 임시 파일만 정리하고 출력 파일은 만들지 않는다.
+    """
+
+    def __init__(self, output_path, flush_rows=1000):
+        """
+        XlsxWorkbookWriter 초기화
+
+        Args:
+            output_path (str): 저장할 xlsx 파일 경로
+            flush_rows (int): 시트별로 이 행 수만큼 쌓이면 임시 파일에 기록
+        """
+        self.output_path = output_path
+        self.bytes_written = 0
+        self._flush_rows = max(1, flush_rows)
+        self._temp_dir = tempfile.mkdtemp(prefix="excel-parser-")
+        self._sheets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    @property
+    def sheets(self):
+        """추가된 시트 목록"""
+        return list(self._sheets)
+
+    @property
+    def bytes_flushed(self):
+        """임시 파일에 기록한 시트 XML 크기 합계 (압축 전)"""
+        return sum(sheet.bytes_flushed for sheet in self._sheets)
+
+    def add_sheet(self, name=None, header=None):
+        """
+        시트 추가
+
+        Args:
+            name (str): 시트 이름 (None이면 Sheet1, Sheet2 ...)
+            header (Sequence): 첫 행에 쓸 헤더
+
+        Returns:
+            XlsxSheetWriter: 추가된 시트 작성기
+        """
+        index = len(self._sheets) + 1
+        part_path = os.path.join(self._temp_dir, f"sheet{index}.xml")
+        sheet = XlsxSheetWriter(name or f"Sheet{index}", part_path, self._flush_rows)
+        # 빈 시트도 유효한 XML이 되도록 파일을 미리 생성
+        open(part_path, "w", encoding="utf-8").close()
+        if header is not None:
+            sheet.append(header)
+        self._sheets.append(sheet)
+        return sheet
+
+    def flush(self):
+        """모든 시트의 버퍼를 임시 파일에 기록"""
+        for sheet in self._sheets:
+            sheet.flush()
+
+    def close(self):
+        """xlsx 파일로 묶어 저장하고 임시 파일 정리"""
+        if self._temp_dir is None:
+            return
+        try:
+            if not self._sheets:
+                self.add_sheet()
+            self.flush()
+            self._write_package()
+            self.bytes_written = os.path.getsize(self.output_path)
+        finally:
+            self.discard()
+
+    def discard(self):
+        """저장하지 않고 임시 파일만 정리"""
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def _write_package(self):
+        sheet_types = "".join(_SHEET_CONTENT_TYPE.format(index=i) for i in range(1, len(self._sheets) + 1))
+        workbook_sheets = "".join(
+            _WORKBOOK_SHEET.format(name=escape(sheet.name, {'"': "&quot;"}), index=i)
+            for i, sheet in enumerate(self._sheets, start=1)
+        )
+        workbook_rels = "".join(_WORKBOOK_SHEET_REL.format(index=i) for i in range(1, len(self._sheets) + 1))
+
+        with zipfile.ZipFile(self.output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("[Content_Types].xml", _CONTENT_TYPES.format(sheets=sheet_types))
+            zf.writestr("_rels/.rels", _ROOT_RELS)
+            zf.writestr("xl/workbook.xml", _WORKBOOK.format(sheets=workbook_sheets))
+            zf.writestr(
+                "xl/_rels/workbook.xml.rels",
+                _WORKBOOK_RELS.format(sheets=workbook_rels, styles_index=len(self._sheets) + 1),
+            )
+            zf.writestr("xl/styles.xml", _STYLES)
+            for i, sheet in enumerate(self._sheets, start=1):
+                with zf.open(f"xl/worksheets/sheet{i}.xml", "w") as dst:
+                    dst.write(_SHEET_HEAD.encode("utf-8"))
+                    with open(sheet._part_path, "rb") as src:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+                    dst.write(_SHEET_TAIL.encode("utf-8"))
+
+
+def write_frame_xlsx(df, output_path, sheet_name=None):
+    """
+    DataFrame을 스트리밍 작성기로 xlsx 파일에 저장 (인덱스 제외)
+
+    Args:
+        df (pandas.DataFrame): 저장할 데이터
+        output_path (str): 저장할 파일 경로
+        sheet_name (str): 시트 이름
+
+    Returns:
+        int: 저장된 파일 크기 (bytes)
+    """
+    with XlsxWorkbookWriter(output_path) as writer:
+        sheet = writer.add_sheet(sheet_name, header=list(df.columns))
+        sheet.append_rows(df.itertuples(index=False, name=None))
+    return writer.bytes_written
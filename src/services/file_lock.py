@@ -0,0 +1,142 @@
+"""
+여러 프로세스가 함께 쓰는 파일의 잠금과 원자적 저장
+
+일괄 처리 작업 프로세스나 작업 서버의 작업들이 같은 캐시 색인/매니페스트를 갱신할 때,
+잠근 상태에서 최신 내용을 다시 읽고 고쳐 저장하도록 사용한다.
+"""
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 잠금 대기 중 경고를 남기는 간격 (초)
+LOCK_TIMEOUT = 30
+
+# Windows OpenProcess/GetExitCodeProcess 상수
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_ERROR_ACCESS_DENIED = 5
+_STILL_ACTIVE = 259
+
+
+def _owner():
+    """잠금 파일에 기록할 잠금 보유자 ("<호스트 이름> <PID>")"""
+    return f"{socket.gethostname()} {os.getpid()}"
+
+
+def _process_alive(pid):
+    """현재 컴퓨터에서 PID의 프로세스가 실행 중인지 확인"""
+    if os.name == "nt":
+        import ctypes
+
+        # Windows의 os.kill(pid, 0)은 프로세스를 종료시키므로 OpenProcess로 확인
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return ctypes.get_last_error() == _ERROR_ACCESS_DENIED
+        try:
+            code = ctypes.c_ulong()
+            return not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)) or code.value == _STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_owner(lock_path):
+    """잠금 파일의 보유자 문자열 (파일이 없으면 None)"""
+    try:
+        with open(lock_path, encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _is_stale(owner, lock_path, timeout):
+    """
+    잠금 보유자가 비정상 종료되어 남은 잠금인지 확인
+
+    같은 컴퓨터의 보유 프로세스가 없으면 남은 잠금이다. 다른 컴퓨터(공유 폴더)의 잠금은 확인할 수
+    없으므로 보유자가 해제할 때까지 기다린다. 보유자를 기록하기 전에 종료된 빈 잠금 파일은
+    timeout보다 오래되었을 때 남은 잠금으로 본다.
+    """
+    host, _, pid = owner.rpartition(" ")
+    if not pid.isdigit():
+        try:
+            return time.time() - os.path.getmtime(lock_path) > timeout
+        except FileNotFoundError:
+            return False
+    return host == socket.gethostname() and not _process_alive(int(pid))
+
+
+@contextmanager
+def file_lock(lock_path, timeout=LOCK_TIMEOUT):
+    """
+    잠금 파일 생성 방식의 프로세스 간 잠금
+
+    잠금 파일에 보유자(호스트 이름, PID)를 기록한다. 보유 프로세스가 살아 있으면 오래 걸려도
+    잠금을 빼앗지 않고 기다리며, 보유 프로세스가 비정상 종료되어 남은 잠금 파일만 제거한다.
+
+    Args:
+        lock_path (str): 잠금 파일 경로
+        timeout (float): 대기 중 경고를 남기는 간격 (초)
+    """
+    warn_at = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            owner = _read_owner(lock_path)
+            if owner is not None and _is_stale(owner, lock_path, timeout):
+                # 다른 대기자가 먼저 제거하고 새로 잠갔으면 그 잠금은 남김
+                if _read_owner(lock_path) == owner:
+                    logger.warning(f"비정상 종료로 남은 잠금 파일 제거: {lock_path} (보유자 {owner or '알 수 없음'})")
+                    try:
+                        os.remove(lock_path)
+                    except FileNotFoundError:
+                        pass
+                continue
+            if time.monotonic() > warn_at:
+                logger.warning(f"잠금 대기 중: {lock_path} (보유자 {owner})")
+                warn_at = time.monotonic() + timeout
+            time.sleep(0.05)
+    try:
+        os.write(fd, _owner().encode("utf-8"))
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+
+def write_json(path, data, **options):
+    """
+    JSON 파일을 같은 폴더의 고유한 임시 파일에 쓴 뒤 교체 (읽는 쪽은 항상 완성된 파일을 봄)
+
+    Args:
+        path (str): 저장할 파일 경로
+        data: 저장할 데이터
+        **options: json.dump 옵션 (indent 등)
+    """
+    fd, temp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp",
+                                     dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
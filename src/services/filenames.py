@@ -0,0 +1,167 @@
+"""
+출력 파일 이름 계획
+
+그룹 값을 파일 이름에 쓸 수 있는 문자열로 바꾸고, 서로 다른 값이 같은 파일 이름이 되는 경우
+(예: "A/B"와 "AB", 대소문자만 다른 값, 빈 값과 "NA")를 찾아 이름을 구분한다.
+이름이 겹친 채로 저장하면 나중에 저장한 그룹이 앞의 파일을 덮어쓰므로, 저장 전에 모든 이름을
+한 번에 정한다. 같은 값의 이름은 한 번만 계산한다.
+"""
+
+import hashlib
+import logging
+import re
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 파일 이름에 사용할 수 없는 문자 (Windows 기준) 와 제어 문자
+_INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+# Windows 예약 장치 이름 (확장자가 붙어도 사용할 수 없음, 대소문자 구분 없음, 소문자로 비교)
+RESERVED_NAMES = frozenset(
+    ["con", "prn", "aux", "nul"]
+    + [f"com{i}" for i in range(1, 10)]
+    + [f"lpt{i}" for i in range(1, 10)]
+)
+
+# 파일 이름 최대 길이 (UTF-8 bytes, 대부분의 파일 시스템 제한)
+MAX_NAME_BYTES = 255
+
+
+def group_label(value):
+    """
+    그룹 값을 파일/시트 이름에 넣을 문자열로 변환
+
+    열 조합 기준이면 값마다 변환해 "_"로 잇는다.
+    """
+    if isinstance(value, str):
+        return _INVALID_FILENAME_CHARS.sub("", value)
+    if isinstance(value, tuple):
+        return "_".join(group_label(item) for item in value)
+    # 값이 NaN인 경우
+    value_str = "NA" if value is None or pd.isna(value) else str(value)
+    # 파일명에 포함할 수 없는 문자 제거
+    return _INVALID_FILENAME_CHARS.sub("", value_str)
+
+
+def _truncate(text, max_bytes):
+    """UTF-8로 max_bytes 이하가 되도록 문자 단위로 자름"""
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+class FilenamePlan:
+    """
+    그룹 값 -> 출력 파일 이름 계획
+
+    이름은 "<prefix><라벨><ext>" 형식이다. 라벨은 group_label()로 만들고,
+    - 다른 값과 대소문자 구분 없이 겹치면 " (2)", " (3)" ... 을 붙이고 (먼저 계획한 값이 원래 이름 사용)
+    - Windows 예약 이름(CON, NUL 등)이 되면 "_"를 붙이며
+    - 파일 이름이 MAX_NAME_BYTES를 넘으면 라벨을 자르고 원래 라벨의 해시를 붙인다.
+    같은 값과 prefix로 다시 요청하면 처음 정한 이름을 그대로 반환한다.
+
+    Attributes:
+        ext (str): 확장자 (예: ".xlsx")
+        entries (list): (prefix, 그룹 값, 라벨, 파일 이름) 목록 (계획한 순서)
+        renamed (list): (그룹 값, 원래 파일 이름, 바뀐 파일 이름) 목록 (겹침/예약/길이 때문에 바뀐 이름)
+    """
+
+    def __init__(self, ext):
+        self.ext = ext
+        self.renamed = []
+        # (prefix, 그룹 값) -> (라벨, 파일 이름), 계획한 순서 유지
+        self._names = {}
+        self._used = set()
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def entries(self):
+        """(prefix, 그룹 값, 라벨, 파일 이름) 목록 (계획한 순서)"""
+        return [(prefix, value, label, file_name)
+                for (prefix, value), (label, file_name) in self._names.items()]
+
+    def assign(self, values, prefix=""):
+        """
+        여러 그룹 값의 라벨과 파일 이름을 한 번에 계획
+
+        Args:
+            values (Iterable): 그룹 값 (열 조합 기준이면 튜플)
+            prefix (str): 파일 이름 앞부분 (예: "급여_")
+
+        Returns:
+            list[tuple]: 값마다 (라벨, 파일 이름)
+        """
+        budget = MAX_NAME_BYTES - len(f"{prefix}{self.ext}".encode("utf-8")) - len(" (99999)")
+        names = self._names
+        keys = []
+        pending = {}
+        for value in values:
+            # NaN은 자기 자신과 같지 않으므로 None으로 바꿔 조회
+            if not isinstance(value, (str, tuple)) and pd.isna(value):
+                value = None
+            keys.append(value)
+            if (prefix, value) not in names and value not in pending:
+                pending[value] = None
+
+        if pending:
+            pending = list(pending)
+            sub = _INVALID_FILENAME_CHARS.sub
+            labels = [sub("", value) if isinstance(value, str) else group_label(value) for value in pending]
+            # 대부분의 값은 그대로 쓸 수 있으므로, 파일 이름을 한 번에 만들고 소문자로 바꿔 겹침만 확인
+            # (정리한 라벨에는 줄바꿈이 없으므로 이어 붙여 한 번에 변환)
+            file_names = [f"{prefix}{label}{self.ext}" for label in labels]
+            folded_names = "\n".join(file_names).lower().split("\n")
+            used = self._used
+            for value, label, file_name, folded in zip(pending, labels, file_names, folded_names):
+                if (folded in used or len(label) * 4 > budget
+                        or folded.partition(".")[0] in RESERVED_NAMES):
+                    self._plan(value, label, prefix, budget)
+                    continue
+                used.add(folded)
+                names[(prefix, value)] = (label, file_name)
+        return [names[(prefix, value)] for value in keys]
+
+    def name(self, value, prefix=""):
+        """
+        그룹 값 하나의 (라벨, 파일 이름) (처음 요청하면 계획에 추가)
+        """
+        return self.assign((value,), prefix)[0]
+
+    def _plan(self, value, raw, prefix, budget):
+        """겹침/예약/길이 문제가 있을 수 있는 그룹 값의 이름을 정해 계획에 추가"""
+        base = raw
+        # 파일 이름 길이 제한: 라벨을 자르고 원래 라벨 해시로 구분 (UTF-8은 문자당 최대 4 bytes)
+        if len(base) * 4 > budget and len(base.encode("utf-8")) > budget:
+            digest = hashlib.sha1(base.encode("utf-8")).hexdigest()[:8]
+            base = f"{_truncate(base, budget - len(digest) - 1)}~{digest}"
+
+        label = base
+        file_name = f"{prefix}{label}{self.ext}"
+        folded = file_name.lower()
+        if folded.partition(".")[0] in RESERVED_NAMES:
+            head, dot, tail = base.partition(".")
+            base = label = f"{head}_{dot}{tail}"
+            file_name = f"{prefix}{label}{self.ext}"
+            folded = file_name.lower()
+        count = 1
+        while folded in self._used:
+            count += 1
+            label = f"{base} ({count})"
+            file_name = f"{prefix}{label}{self.ext}"
+            folded = file_name.lower()
+        self._used.add(folded)
+
+        if label != raw:
+            original = f"{prefix}{raw}{self.ext}"
+            self.renamed.append((value, original, file_name))
+            logger.warning(f"출력 파일 이름 변경: {original!r} -> {file_name!r} (그룹 값 {value!r})")
+
+        self._names[(prefix, value)] = (label, file_name)
+
+    def to_dict(self):
+        """
+        파일 이름 -> 그룹 값 (문자열) 대응표 (보고서/JSON용)
+        """
+        return {file_name: str(value) for (_, value), (_, file_name) in self._names.items()}
@@ -0,0 +1,261 @@
+"""
+읽은 엑셀 데이터의 디스크 캐시
+
+같은 파일을 다른 기준 열로 다시 처리할 때 엑셀을 다시 파싱하지 않도록
+파일 내용 해시 + 시트 이름을 키로 DataFrame을 열 기반 형식(Parquet)으로 저장한다.
+일괄 처리 작업 프로세스나 작업 서버의 작업들이 같은 캐시 폴더를 함께 쓸 수 있도록
+색인은 잠근 상태에서 최신 내용을 다시 읽어 고친 뒤 저장한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from .file_lock import file_lock, write_json
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 용량 (bytes)
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+_INDEX_FILE = "index.json"
+_LOCK_FILE = "index.json.lock"
+_HASH_CHUNK = 1024 * 1024
+
+
+def file_digest(file_path):
+    """
+    파일 내용의 SHA-256 해시
+
+    Args:
+        file_path (str): 파일 경로
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FrameCache:
+    """
+    크기 제한이 있는 LRU 방식의 DataFrame 디스크 캐시
+
+    - 키: 원본 파일 내용 해시 + 시트 이름 + 읽기 엔진
+    - 저장 형식: Parquet (pyarrow 설치 및 변환 가능 시), 그 외에는 pickle
+    - 원본 파일의 크기/수정 시각이 바뀌면 해시를 다시 계산하고 이전 내용의 캐시는 삭제
+    - 여러 프로세스가 같은 캐시 폴더를 사용해도 색인 항목이 사라지지 않음 (색인 잠금)
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        FrameCache 초기화
+
+        Args:
+            cache_dir (str): 캐시 폴더 경로
+            max_bytes (int): 캐시 폴더 최대 크기 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 최대 크기가 이전보다 작아졌을 수 있으므로 열 때 한 번 정리
+        with self._updating():
+            self._evict()
+
+    def load(self, file_path, sheet_name=0, reader_name=""):
+        """
+        캐시된 DataFrame 읽기
+
+        Args:
+            file_path (str): 원본 엑셀 파일 경로
+            sheet_name (str | int): 시트 이름 또는 순서
+            reader_name (str): 읽기 엔진 이름 (엔진마다 dtype이 다르므로 키에 포함)
+
+        Returns:
+            pandas.DataFrame: 캐시된 데이터 (없으면 None)
+        """
+        self._index = self._load_index()
+        key = self._key(file_path, sheet_name, reader_name)
+        entry = self._index["entries"].get(key)
+        if entry is None:
+            return None
+
+        path = os.path.join(self.cache_dir, entry["file"])
+        try:
+            if entry["file"].endswith(".parquet"):
+                df = pd.read_parquet(path)
+            else:
+                with open(path, "rb") as f:
+                    df = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"캐시 파일 읽기 실패, 캐시 항목 삭제: {path}: {str(e)}")
+            with self._updating() as index:
+                # 그 사이 다른 프로세스가 다시 저장했으면 새 항목은 남김
+                if index["entries"].get(key, {}).get("file") == entry["file"]:
+                    self._remove(key)
+            return None
+
+        with self._updating() as index:
+            if key in index["entries"]:
+                index["entries"][key]["last_used"] = time.time()
+        logger.info(f"캐시에서 읽기: {file_path} ({entry['file']})")
+        return df
+
+    def store(self, file_path, df, sheet_name=0, reader_name=""):
+        """
+        DataFrame을 캐시에 저장
+
+        Args:
+            file_path (str): 원본 엑셀 파일 경로
+            df (pandas.DataFrame): 저장할 데이터
+            sheet_name (str | int): 시트 이름 또는 순서
+            reader_name (str): 읽기 엔진 이름
+        """
+        key = self._key(file_path, sheet_name, reader_name)
+        file_name = self._write(key, df)
+        if file_name is None:
+            return
+
+        with self._updating() as index:
+            previous = index["entries"].get(key)
+            if previous is not None and previous["file"] != file_name:
+                self._remove(key)
+            index["entries"][key] = {
+                "file": file_name,
+                "source": os.path.abspath(file_path),
+                "size": os.path.getsize(os.path.join(self.cache_dir, file_name)),
+                "last_used": time.time(),
+            }
+            self._evict()
+        logger.info(f"캐시에 저장: {file_path} ({file_name})")
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._updating() as index:
+            for key in list(index["entries"]):
+                self._remove(key)
+            index["hashes"] = {}
+
+    @property
+    def total_bytes(self):
+        """캐시된 파일 크기 합계"""
+        return sum(entry["size"] for entry in self._index["entries"].values())
+
+    def _key(self, file_path, sheet_name, reader_name):
+        digest = self._source_digest(file_path)
+        sheet = hashlib.sha256(f"{sheet_name}|{reader_name}".encode("utf-8")).hexdigest()[:16]
+        return f"{digest}-{sheet}"
+
+    def _source_digest(self, file_path):
+        """
+        원본 파일 해시 (크기와 수정 시각이 같으면 이전 계산 결과 재사용)
+
+        파일이 바뀌었으면 이전 해시로 만든 캐시 항목을 삭제한다.
+        """
+        source = os.path.abspath(file_path)
+        stat = os.stat(source)
+        known = self._index["hashes"].get(source)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return known["digest"]
+
+        # 해시 계산은 잠그지 않고, 색인 갱신만 잠근 상태에서
+        digest = file_digest(source)
+        with self._updating() as index:
+            known = index["hashes"].get(source)
+            if known and known["digest"] != digest:
+                logger.info(f"원본 파일 변경 감지, 이전 캐시 삭제: {source}")
+                for key, entry in list(index["entries"].items()):
+                    if entry["source"] == source and key.startswith(known["digest"]):
+                        self._remove(key)
+            index["hashes"][source] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+        return digest
+
+    def _write(self, key, df):
+        """
+        Parquet으로 저장하고, 변환할 수 없는 데이터면 pickle로 저장
+
+        고유한 임시 파일에 쓴 뒤 교체하므로 같은 키를 동시에 저장해도 읽는 쪽은 완성된 파일만 본다.
+        """
+        # 문자열이 아닌 열 이름, 타입이 섞인 열 등은 Parquet으로 저장할 수 없음
+        def write_parquet(path):
+            df.to_parquet(path, index=False)
+
+        def write_pickle(path):
+            with open(path, "wb") as f:
+                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for file_name, write in ((f"{key}.parquet", write_parquet), (f"{key}.pkl", write_pickle)):
+            fd, temp_path = tempfile.mkstemp(prefix=f"{file_name}.", suffix=".tmp", dir=self.cache_dir)
+            os.close(fd)
+            try:
+                write(temp_path)
+                os.replace(temp_path, os.path.join(self.cache_dir, file_name))
+                return file_name
+            except Exception as e:
+                self._delete_file(os.path.basename(temp_path))
+                error = e
+        logger.warning(f"캐시 저장 실패: {str(error)}")
+        return None
+
+    def _evict(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (색인을 잠근 상태에서 호출)"""
+        entries = self._index["entries"]
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["size"]
+            logger.info(f"캐시 용량 초과로 삭제: {entries[key]['file']}")
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self._index["entries"].pop(key, None)
+        if entry is not None:
+            self._delete_file(entry["file"])
+
+    def _delete_file(self, file_name):
+        try:
+            os.remove(os.path.join(self.cache_dir, file_name))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def _updating(self):
+        """
+        색인을 잠그고 최신 색인을 다시 읽은 뒤, 블록이 끝나면 저장
+
+        다른 프로세스가 그 사이 추가한 항목을 덮어쓰지 않도록 색인은 항상 이 블록 안에서 고친다.
+
+        Yields:
+            dict: 최신 색인 (self._index)
+        """
+        with file_lock(os.path.join(self.cache_dir, _LOCK_FILE)):
+            self._index = self._load_index()
+            yield self._index
+            self._save_index()
+
+    def _load_index(self):
+        path = os.path.join(self.cache_dir, _INDEX_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            index.setdefault("entries", {})
+            index.setdefault("hashes", {})
+            return index
+        except (FileNotFoundError, ValueError):
+            return {"entries": {}, "hashes": {}}
+
+    def _save_index(self):
+        write_json(os.path.join(self.cache_dir, _INDEX_FILE), self._index)
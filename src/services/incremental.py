@@ -0,0 +1,137 @@
+"""
+증분 분할을 위한 출력 폴더 매니페스트
+
+입력 파일/기준 열마다 그룹별 행 지문(fingerprint)과 출력 파일 해시를 기록해 두고,
+다시 처리할 때 내용이 바뀐 그룹만 새로 저장한다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+import pandas as pd
+
+from .file_lock import file_lock, write_json
+from .frame_cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+# 출력 폴더에 저장되는 매니페스트 파일 이름
+MANIFEST_FILE = ".excel-parser-manifest.json"
+
+_MANIFEST_VERSION = 1
+
+
+def frame_fingerprint(df):
+    """
+    DataFrame 내용(열 이름, 타입, 행 값과 순서)의 지문
+
+    Args:
+        df (pandas.DataFrame): 그룹 데이터
+
+    Returns:
+        str: 16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class SplitManifest:
+    """
+    출력 폴더의 증분 분할 매니페스트
+
+    매니페스트 구조:
+        {"version": 1,
+         "splits": {"<입력 파일>|<열 번호>": {"<출력 파일>": {"fingerprint", "file_hash", "rows"}}}}
+    """
+
+    def __init__(self, output_folder):
+        """
+        SplitManifest 초기화 (기존 매니페스트가 있으면 읽음)
+
+        Args:
+            output_folder (str): 출력 폴더 경로
+        """
+        self.output_folder = output_folder
+        self.path = os.path.join(output_folder, MANIFEST_FILE)
+        self._data = self._load()
+
+    def plan(self, split_key, groups):
+        """
+        다시 저장해야 할 그룹과 삭제할 출력 파일 계산
+
+        지문이 같고 출력 파일이 기록된 해시 그대로 남아 있는 그룹만 건너뛴다.
+
+        Args:
+            split_key (str): 입력 파일/기준 열 식별자
+            groups (dict): 출력 파일 이름 -> 그룹 지문
+
+        Returns:
+            tuple: (changed, removed)
+                - changed (set): 다시 저장할 출력 파일 이름
+                - removed (list): 더 이상 없는 그룹의 출력 파일 이름
+        """
+        previous = self._data["splits"].get(split_key, {})
+        changed = set()
+        for output_file, fingerprint in groups.items():
+            entry = previous.get(output_file)
+            if entry is None or entry["fingerprint"] != fingerprint:
+                changed.add(output_file)
+                continue
+            output_path = os.path.join(self.output_folder, output_file)
+            if not os.path.exists(output_path) or file_digest(output_path) != entry["file_hash"]:
+                changed.add(output_file)
+        removed = [output_file for output_file in previous if output_file not in groups]
+        return changed, removed
+
+    def update(self, split_key, groups, rows, written):
+        """
+        처리 결과로 매니페스트 갱신 후 저장
+
+        Args:
+            split_key (str): 입력 파일/기준 열 식별자
+            groups (dict): 출력 파일 이름 -> 그룹 지문 (이번 처리의 전체 그룹)
+            rows (dict): 출력 파일 이름 -> 행 수
+            written (Iterable[str]): 이번에 새로 저장한 출력 파일 이름
+        """
+        previous = self._data["splits"].get(split_key, {})
+        written = set(written)
+        entries = {}
+        for output_file, fingerprint in groups.items():
+            if output_file not in written and output_file in previous:
+                entries[output_file] = previous[output_file]
+                continue
+            output_path = os.path.join(self.output_folder, output_file)
+            if not os.path.exists(output_path):
+                continue
+            entries[output_file] = {
+                "fingerprint": fingerprint,
+                "file_hash": file_digest(output_path),
+                "rows": int(rows.get(output_file, 0)),
+            }
+        # 일괄 처리 시 다른 프로세스가 같은 매니페스트를 갱신할 수 있으므로
+        # 잠근 상태에서 최신 내용을 다시 읽고 이 입력 파일/기준 열 항목만 바꿔 저장
+        with file_lock(f"{self.path}.lock"):
+            self._data = self._load()
+            self._data["splits"][split_key] = entries
+            self._save()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _MANIFEST_VERSION:
+                data.setdefault("splits", {})
+                return data
+            logger.warning(f"매니페스트 버전이 달라 새로 작성합니다: {self.path}")
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logger.warning(f"매니페스트를 읽을 수 없어 새로 작성합니다: {self.path}: {str(e)}")
+        return {"version": _MANIFEST_VERSION, "splits": {}}
+
+    def _save(self):
+        write_json(self.path, self._data, indent=1)
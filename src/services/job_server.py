@@ -0,0 +1,493 @@
+"""
+상주 작업 서버 (UI 없이 실행)
+
+미리 import를 마친 작업 프로세스 풀을 띄워 두고, 로컬 HTTP로 분할 작업을 받아 큐에 넣는다.
+작업마다 새 프로세스를 띄우지 않으므로 인터프리터 시작과 pandas 등의 import 비용을 한 번만 낸다.
+작업 프로세스 수만큼 동시에 처리하고, 나머지는 큐에서 순서대로 기다린다.
+
+HTTP API (JSON):
+    GET    /health          서버 상태와 상태별 작업 수
+    POST   /jobs            작업 등록 {"file": 경로, "column": 1 또는 [1, 2], ...} -> 202
+    GET    /jobs            전체 작업 목록
+    GET    /jobs/<id>       작업 상태, 진행률, 결과
+    DELETE /jobs/<id>       작업 취소 (대기 중이면 바로, 처리 중이면 다음 확인 지점에서 중단)
+"""
+
+import json
+import logging
+import os
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.managers import SyncManager
+
+from .errors import JobCancelledError
+from .progress import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_STATES = ("queued", "running", "done", "error", "cancelled")
+
+# 작업 요청에서 ExcelParseService 생성 인자로 넘기는 항목
+SERVICE_OPTIONS = ("reader", "cache_dir", "output_mode", "output_format", "io_threads")
+# 작업 요청에서 parse_data 인자로 넘기는 항목
+PARSE_OPTIONS = ("streaming", "batch_size", "incremental", "memory_budget", "profile", "sheets", "sheet_mode",
+                 "filters", "columns")
+
+# 보관할 완료 작업 수 (넘으면 오래된 완료 작업부터 목록에서 제거)
+MAX_FINISHED_JOBS = 1000
+
+# 작업 프로세스가 비정상 종료되었을 때 작업 오류 메시지
+WORKER_CRASHED_ERROR = "작업 프로세스가 비정상 종료되었습니다 (메모리 부족 등)"
+
+
+@dataclass
+class Job:
+    """
+    서버에 등록된 분할 작업 하나
+
+    Attributes:
+        id (str): 작업 ID
+        file (str): 입력 엑셀 파일 경로
+        column (int | list[int]): 기준 열 번호
+        output (str): 출력 폴더
+        options (dict): 서비스/parse_data 옵션
+        status (str): "queued", "running", "done", "error", "cancelled"
+        progress (dict): 마지막 진행 이벤트 (ProgressEvent)
+        output_files (list): 출력 파일 경로
+        profile_files (list): 프로파일 결과 파일 경로
+        metrics (dict): 단계별 계측 값 (JobMetrics.to_dict())
+        error (str): 오류 메시지
+        submitted (float): 등록 시각 (epoch 초)
+        started (float): 처리 시작 시각
+        finished (float): 처리 종료 시각
+    """
+    id: str
+    file: str
+    column: object
+    output: str
+    options: dict = field(default_factory=dict)
+    status: str = "queued"
+    progress: dict = None
+    output_files: list = field(default_factory=list)
+    profile_files: list = field(default_factory=list)
+    metrics: dict = None
+    error: str = None
+    submitted: float = field(default_factory=time.time)
+    started: float = None
+    finished: float = None
+
+    @property
+    def finished_state(self):
+        return self.status in ("done", "error", "cancelled")
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _ignore_interrupt():
+    # Ctrl+C는 프로세스 그룹 전체에 전달되므로 하위 프로세스는 무시하고 서버가 정리하도록 함
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def warm_up():
+    """
+    작업 프로세스 초기화: 처리에 필요한 모듈을 미리 import
+    """
+    _ignore_interrupt()
+    from . import excel_parse_service  # noqa: F401 (pandas, numpy 등 포함)
+    import openpyxl  # noqa: F401
+
+
+def _ping():
+    return os.getpid()
+
+
+def run_job(job_id, file_path, column_num, output_folder, options, cancel_event, events, started):
+    """
+    작업 하나 처리 (작업 프로세스에서 실행)
+
+    Args:
+        job_id (str): 작업 ID
+        file_path (str): 입력 엑셀 파일 경로
+        column_num (int | list[int]): 기준 열 번호
+        output_folder (str): 출력 폴더
+        options (dict): 서비스/parse_data 옵션
+        cancel_event: 취소 이벤트 (Manager().Event())
+        events: 진행 이벤트를 보낼 큐 (Manager().Queue(), (작업 ID, 진행 이벤트) 전달)
+        started: 처리를 시작한 작업 ID -> 작업 프로세스 PID (Manager().dict())
+
+    Returns:
+        dict: {"output_files", "profile_files", "metrics"}
+    """
+    from dataclasses import asdict as event_dict
+
+    from .excel_parse_service import ExcelParseService
+
+    # 대기 중 취소된 작업은 시작하지 않음
+    cancel_token = CancellationToken(cancel_event)
+    cancel_token.raise_if_cancelled()
+    # 진행 이벤트는 서버에 늦게 반영될 수 있으므로, 이 작업 때문에 작업 프로세스가 비정상 종료되어도
+    # 대기 작업으로 보고 다시 넣지 않도록 처리 시작을 먼저 기록
+    started[job_id] = os.getpid()
+    events.put((job_id, None))
+
+    last = {}
+
+    def on_progress(event):
+        # 같은 단계에서 진행률이 바뀌지 않은 이벤트는 건너뜀
+        key = (event.stage, event.percent)
+        if last.get("key") != key:
+            last["key"] = key
+            events.put((job_id, event_dict(event)))
+
+    folder, file_name = os.path.split(os.path.abspath(file_path))
+    service = ExcelParseService(input_folder=folder, output_folder=output_folder,
+                                **{key: options[key] for key in SERVICE_OPTIONS if key in options})
+    output_files = service.parse_data(file_name, column_num, progress_callback=on_progress,
+                                      cancel_token=cancel_token,
+                                      **{key: options[key] for key in PARSE_OPTIONS if key in options})
+    return {
+        "output_files": list(output_files),
+        "profile_files": output_files.profile_files,
+        "metrics": output_files.metrics.to_dict(),
+    }
+
+
+class JobQueue:
+    """
+    상주 작업 프로세스 풀과 작업 상태 관리
+
+    작업 프로세스 하나가 비정상 종료(세그폴트, 메모리 부족으로 강제 종료 등)되면 프로세스 풀 전체를
+    쓸 수 없게 되므로, 새 풀을 띄우고 처리 중이던 작업은 오류로, 아직 시작하지 않은 작업은
+    새 풀에 다시 넣는다(한 번만).
+    """
+
+    def __init__(self, workers=2, output_folder=None):
+        """
+        JobQueue 초기화 (작업 프로세스를 모두 띄우고 import를 마칠 때까지 기다림)
+
+        Args:
+            workers (int): 동시에 처리할 작업 수 (작업 프로세스 수)
+            output_folder (str): 작업 요청에 출력 폴더가 없을 때 사용할 폴더 (기본: ./output)
+        """
+        if workers < 1:
+            raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+        self.workers = workers
+        self.output_folder = output_folder or os.path.join(os.getcwd(), "output")
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._cancel_events = {}
+        # 작업 프로세스 비정상 종료로 새 풀에 다시 넣은 작업 ID
+        self._resubmitted = set()
+        self._closing = False
+        self._manager = SyncManager()
+        self._manager.start(_ignore_interrupt)
+        self._events = self._manager.Queue()
+        # 작업 프로세스에서 처리를 시작한 작업 ID (진행 이벤트와 달리 작업 실행 전에 기록됨)
+        self._started = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up)
+
+        started = time.perf_counter()
+        # 작업 프로세스는 요청이 들어올 때 만들어지므로 미리 workers개를 띄움
+        pids = {future.result() for future in [self._executor.submit(_ping) for _ in range(workers)]}
+        logger.info(f"작업 프로세스 {len(pids)}개 준비 완료 ({time.perf_counter() - started:.2f}초)")
+
+        self._listener = threading.Thread(target=self._listen, name="job-progress", daemon=True)
+        self._listener.start()
+
+    def submit(self, file_path, column_num, output_folder=None, **options):
+        """
+        작업 등록
+
+        Args:
+            file_path (str): 입력 엑셀 파일 경로
+            column_num (int | list[int]): 기준 열 번호 (1부터 시작, 목록이면 열 조합 기준)
+            output_folder (str): 출력 폴더 (None이면 서버 기본 출력 폴더)
+            **options: ExcelParseService 인자(reader, cache_dir, output_mode, output_format)와
+                parse_data 인자(streaming, batch_size, incremental, memory_budget(bytes), profile, sheets, sheet_mode,
+                filters, columns)
+
+        Returns:
+            Job: 등록된 작업
+        """
+        unknown = set(options) - set(SERVICE_OPTIONS) - set(PARSE_OPTIONS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 작업 옵션입니다: {', '.join(sorted(unknown))}")
+        if not os.path.isfile(file_path):
+            raise ValueError(f"입력 파일이 없습니다: {file_path}")
+        if isinstance(column_num, bool) or not isinstance(column_num, (int, list)):
+            raise ValueError(f"column은 열 번호 또는 열 번호 목록이어야 합니다: {column_num}")
+
+        job = Job(uuid.uuid4().hex[:12], os.path.abspath(file_path), column_num,
+                  os.path.abspath(output_folder or self.output_folder), options)
+        cancel_event = self._manager.Event()
+        with self._lock:
+            self.jobs[job.id] = job
+            self._cancel_events[job.id] = cancel_event
+            future, executor = self._start(job)
+        self._watch(job.id, future, executor)
+        logger.info(f"작업 등록: {job.id} {job.file} (열 {column_num})")
+        return job
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """등록 순서대로 전체 작업 목록"""
+        with self._lock:
+            return list(self.jobs.values())
+
+    def counts(self):
+        """상태별 작업 수"""
+        with self._lock:
+            counts = dict.fromkeys(JOB_STATES, 0)
+            for job in self.jobs.values():
+                counts[job.status] += 1
+            return counts
+
+    def cancel(self, job_id):
+        """
+        작업 취소 요청
+
+        대기 중인 작업은 바로 취소되고, 처리 중인 작업은 다음 확인 지점에서 중단된다.
+
+        Returns:
+            Job: 작업 (없으면 None)
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.finished_state:
+                return job
+            self._cancel_events[job_id].set()
+            future = self._futures[job_id]
+        # 아직 작업 프로세스에 넘어가지 않았으면 바로 취소 (_finish에서 상태 변경)
+        future.cancel()
+        logger.info(f"작업 취소 요청: {job_id}")
+        return job
+
+    def shutdown(self):
+        """처리 중인 작업을 취소하고 작업 프로세스 종료"""
+        with self._lock:
+            self._closing = True
+            for job_id, job in self.jobs.items():
+                if not job.finished_state:
+                    self._cancel_events[job_id].set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._events.put(None)
+        self._listener.join()
+        self._manager.shutdown()
+
+    def _listen(self):
+        """작업 프로세스가 보낸 진행 이벤트를 작업 상태에 반영"""
+        while True:
+            message = self._events.get()
+            if message is None:
+                return
+            job_id, event = message
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.finished_state:
+                    continue
+                if event is None:
+                    job.status = "running"
+                    job.started = time.time()
+                else:
+                    job.progress = event
+
+    def _start(self, job):
+        """
+        작업을 현재 프로세스 풀에 넣음 (self._lock을 잡은 상태에서 호출)
+
+        Returns:
+            tuple: (Future, 작업을 넣은 프로세스 풀)
+        """
+        args = (run_job, job.id, job.file, job.column, job.output, job.options,
+                self._cancel_events[job.id], self._events, self._started)
+        try:
+            future = self._executor.submit(*args)
+        except BrokenProcessPool:
+            # 풀이 깨진 뒤 아직 교체하기 전에 들어온 작업
+            self._restart_pool(self._executor)
+            future = self._executor.submit(*args)
+        self._futures[job.id] = future
+        return future, self._executor
+
+    def _watch(self, job_id, future, executor):
+        """작업이 끝나면 _finish 호출 (이미 끝났으면 바로 호출되므로 self._lock 밖에서 호출)"""
+        future.add_done_callback(lambda done: self._finish(job_id, done, executor))
+
+    def _restart_pool(self, broken):
+        """
+        비정상 종료로 쓸 수 없게 된 프로세스 풀을 새 풀로 교체 (self._lock을 잡은 상태에서 호출)
+
+        같은 풀의 작업마다 호출되므로 아직 교체하지 않았을 때만 새로 띄운다.
+        """
+        if self._executor is not broken or self._closing:
+            return
+        logger.error(f"작업 프로세스가 비정상 종료되어 프로세스 풀을 다시 시작합니다 (작업 프로세스 {self.workers}개)")
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_up)
+        # 다음 작업이 import를 기다리지 않도록 작업 프로세스를 미리 띄움
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+    def _finish(self, job_id, future, executor):
+        retry = None
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return
+            job.finished = time.time()
+            try:
+                result = future.result()
+            except (CancelledError, JobCancelledError):
+                job.status = "cancelled"
+            except BrokenProcessPool:
+                self._restart_pool(executor)
+                cancelled = self._cancel_events[job_id].is_set()
+                # 작업 프로세스에서 시작한 작업(풀을 깨뜨린 작업일 수 있음)은 상태가 아직 queued여도 다시 넣지 않음
+                running = job_id in self._started
+                if not running and job_id not in self._resubmitted and not cancelled and not self._closing:
+                    # 다른 작업 때문에 풀이 깨진 대기 작업은 새 풀에서 다시 처리
+                    self._resubmitted.add(job_id)
+                    job.finished = None
+                    retry = self._start(job)
+                elif cancelled:
+                    job.status = "cancelled"
+                else:
+                    job.status = "error"
+                    job.error = WORKER_CRASHED_ERROR
+            except Exception as e:
+                job.status = "error"
+                job.error = str(e) or type(e).__name__
+            else:
+                job.status = "done"
+                job.output_files = result["output_files"]
+                job.profile_files = result["profile_files"]
+                job.metrics = result["metrics"]
+            if retry is None:
+                del self._futures[job_id]
+                del self._cancel_events[job_id]
+                self._started.pop(job_id, None)
+                self._resubmitted.discard(job_id)
+                self._trim_finished()
+        if retry is not None:
+            logger.warning(f"작업 프로세스 비정상 종료로 대기 중이던 작업을 다시 등록: {job_id}")
+            self._watch(job_id, *retry)
+            return
+        logger.info(f"작업 종료: {job_id} ({job.status})")
+
+    def _trim_finished(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished_state]
+        for job_id in finished[:max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+            del self.jobs[job_id]
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    작업 서버 HTTP 요청 처리 (server.queue에 JobQueue가 있어야 함)
+    """
+
+    def do_GET(self):
+        queue = self.server.queue
+        if self.path == "/health":
+            self._send(HTTPStatus.OK, {"status": "ok", "workers": queue.workers, "jobs": queue.counts()})
+        elif self.path == "/jobs":
+            self._send(HTTPStatus.OK, [job.to_dict() for job in queue.list_jobs()])
+        elif self.path.startswith("/jobs/"):
+            self._send_job(queue.get(self.path[len("/jobs/"):]))
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로입니다: {self.path}")
+
+    def do_POST(self):
+        if self.path != "/jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로입니다: {self.path}")
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict) or "file" not in request or "column" not in request:
+                raise ValueError("file과 column은 필수 항목입니다.")
+            options = {key: value for key, value in request.items() if key not in ("file", "column", "output")}
+            job = self.server.queue.submit(request["file"], request["column"], request.get("output"), **options)
+        except (ValueError, TypeError) as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self._send(HTTPStatus.ACCEPTED, job.to_dict())
+
+    def do_DELETE(self):
+        if not self.path.startswith("/jobs/"):
+            self._send_error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로입니다: {self.path}")
+            return
+        self._send_job(self.server.queue.cancel(self.path[len("/jobs/"):]))
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_job(self, job):
+        if job is None:
+            self._send_error(HTTPStatus.NOT_FOUND, "작업이 없습니다.")
+        else:
+            self._send(HTTPStatus.OK, job.to_dict())
+
+    def _send_error(self, status, message):
+        self._send(status, {"error": message})
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def make_server(queue, host="127.0.0.1", port=8765):
+    """
+    작업 서버 생성 (serve_forever()로 실행)
+
+    Args:
+        queue (JobQueue): 작업 큐
+        host (str): 바인딩할 주소 (기본: 로컬에서만 접속 가능)
+        port (int): 포트 (0이면 빈 포트 자동 선택, server.server_address로 확인)
+
+    Returns:
+        ThreadingHTTPServer: HTTP 서버
+    """
+    server = ThreadingHTTPServer((host, port), JobRequestHandler)
+    server.daemon_threads = True
+    server.queue = queue
+    return server
+
+
+def serve(host="127.0.0.1", port=8765, workers=2, output_folder=None):
+    """
+    작업 서버 실행 (Ctrl+C로 종료할 때까지)
+
+    Args:
+        host (str): 바인딩할 주소
+        port (int): 포트
+        workers (int): 동시에 처리할 작업 수
+        output_folder (str): 기본 출력 폴더
+    """
+    queue = JobQueue(workers, output_folder)
+    server = make_server(queue, host, port)
+    logger.info(f"작업 서버 시작: http://{server.server_address[0]}:{server.server_address[1]} (작업 프로세스 {workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        queue.shutdown()
+        logger.info("작업 서버 종료")
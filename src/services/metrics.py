@@ -0,0 +1,305 @@
+"""
+작업 단계별 계측
+
+단계마다 소요 시간, CPU 시간, 처리 행 수, 저장 크기, 최대 메모리(tracemalloc)를 모으고,
+원하면 단계 실행 구간을 trace 파일로 남긴다. 파이프라인으로 실행하면 단계 사이 큐의 길이와
+대기 시간, 단계 스레드의 사용률도 모은다. trace 파일은 Chrome trace 이벤트 형식의
+JSON 배열을 한 줄에 이벤트 하나씩 기록하므로(닫는 괄호 생략 허용 형식) 작업 도중에 중단되어도
+chrome://tracing이나 Perfetto(ui.perfetto.dev)에서 그대로 열 수 있다.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class StageMetrics:
+    """
+    단계 하나의 누적 계측 값
+
+    Attributes:
+        name (str): 단계 이름
+        calls (int): 실행 횟수 (예: 저장한 파일 수)
+        wall_seconds (float): 소요 시간 합계 (초)
+        cpu_seconds (float): 현재 스레드의 CPU 시간 합계 (초)
+        rows (int): 처리한 행 수
+        bytes_written (int): 저장한 파일 크기 합계
+        peak_bytes (int): 단계 실행 중 최대 메모리 (tracemalloc, 측정하지 않았으면 None)
+    """
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows: int = 0
+    bytes_written: int = 0
+    peak_bytes: int = None
+
+    @property
+    def rows_per_second(self):
+        """초당 처리 행 수"""
+        return self.rows / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self):
+        data = asdict(self)
+        data["rows_per_second"] = self.rows_per_second
+        return data
+
+
+@dataclass
+class QueueMetrics:
+    """
+    파이프라인 단계 하나(앞 단계에서 항목을 받는 큐 포함)의 계측 값
+
+    Attributes:
+        name (str): 단계 이름 (예: "read", "write")
+        capacity (int): 큐에 담을 수 있는 최대 항목 수 (가득 차면 앞 단계가 기다림)
+        workers (int): 단계를 실행하는 스레드 수
+        items (int): 처리한 항목 수
+        busy_seconds (float): 단계 스레드가 항목을 처리한 시간 합계 (초)
+        blocked_seconds (float): 큐가 가득 차 앞 단계가 기다린 시간 합계 (초, back-pressure)
+        starved_seconds (float): 큐가 비어 다음 단계가 기다린 시간 합계 (초)
+        max_depth (int): 최대 큐 길이
+        depth_total (int): 항목을 넣을 때마다 잰 큐 길이의 합계 (평균 계산용)
+        elapsed_seconds (float): 단계 시작부터 종료까지의 시간 (초)
+    """
+    name: str
+    capacity: int = 0
+    workers: int = 1
+    items: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    starved_seconds: float = 0.0
+    max_depth: int = 0
+    depth_total: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def mean_depth(self):
+        """평균 큐 길이"""
+        return self.depth_total / self.items if self.items else 0.0
+
+    @property
+    def utilization(self):
+        """단계 스레드 사용률 (0-1, 처리 시간 / (경과 시간 x 스레드 수))"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return min(self.busy_seconds / (self.elapsed_seconds * self.workers), 1.0)
+
+    def enqueued(self, depth):
+        """항목 하나를 큐에 넣은 직후의 큐 길이 기록"""
+        self.items += 1
+        self.depth_total += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def to_dict(self):
+        data = asdict(self)
+        data["mean_depth"] = self.mean_depth
+        data["utilization"] = self.utilization
+        return data
+
+
+class JobMetrics:
+    """
+    작업 하나(파일 하나의 분할)의 단계별 계측 값
+
+    stage()로 감싼 구간을 단계 이름별로 누적한다. 같은 이름으로 여러 번 실행하면
+    (예: 파일마다 "write") 합계가 쌓이고, trace 파일에는 실행마다 이벤트가 하나씩 기록된다.
+    파이프라인의 다른 스레드에서 stage()/record()를 호출해도 된다.
+    """
+
+    def __init__(self, job_name="", trace_memory=False, trace_file=None):
+        """
+        JobMetrics 초기화
+
+        Args:
+            job_name (str): 작업 이름 (trace 이벤트 분류에 사용)
+            trace_memory (bool): True이면 tracemalloc으로 단계별 최대 메모리 측정 (실행이 느려짐)
+            trace_file (str): 단계 실행 구간을 기록할 trace 파일 경로 (None이면 기록 안 함)
+        """
+        self.job_name = job_name
+        self.stages = {}
+        self.queues = {}
+        self.trace_file = trace_file
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._ended = None
+        self._trace = None
+        self._own_tracemalloc = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracemalloc = True
+        self._trace_memory = trace_memory
+        if trace_file:
+            self._trace = open(trace_file, "w", encoding="utf-8")
+            self._trace.write("[\n")
+
+    @property
+    def total_seconds(self):
+        """작업 시작부터 종료(close)까지의 시간 (초)"""
+        end = self._ended if self._ended is not None else time.perf_counter()
+        return end - self._started
+
+    @contextmanager
+    def stage(self, name, rows=0, **args):
+        """
+        단계 실행 구간 계측
+
+        Args:
+            name (str): 단계 이름
+            rows (int): 처리할 행 수 (구간 안에서 알게 되면 yield된 객체의 rows에 더함)
+            **args: trace 이벤트에 함께 기록할 값 (예: file="a.xlsx")
+
+        Yields:
+            StageMetrics: 이번 실행분 계측 값 (rows, bytes_written을 구간 안에서 더할 수 있음)
+        """
+        current = StageMetrics(name, calls=1, rows=rows)
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield current
+        finally:
+            current.wall_seconds = time.perf_counter() - started
+            current.cpu_seconds = time.thread_time() - cpu_started
+            if self._trace_memory:
+                current.peak_bytes = tracemalloc.get_traced_memory()[1]
+            self._add(current)
+            self._write_event(current, started, args)
+
+    def record(self, name, wall_seconds=0.0, rows=0, bytes_written=0, **args):
+        """
+        다른 곳(예: 작업 프로세스)에서 측정한 값을 단계에 더함
+
+        Args:
+            name (str): 단계 이름
+            wall_seconds (float): 소요 시간 (초)
+            rows (int): 처리한 행 수
+            bytes_written (int): 저장한 파일 크기
+            **args: trace 이벤트에 함께 기록할 값
+        """
+        current = StageMetrics(name, calls=1, wall_seconds=wall_seconds, rows=rows, bytes_written=bytes_written)
+        self._add(current)
+        self._write_event(current, time.perf_counter() - wall_seconds, args)
+
+    def queue(self, name, capacity, workers=1):
+        """
+        파이프라인 단계의 큐 계측 값 (같은 이름이면 기존 값에 이어서 누적)
+
+        Args:
+            name (str): 단계 이름
+            capacity (int): 큐 최대 길이
+            workers (int): 단계를 실행하는 스레드 수
+
+        Returns:
+            QueueMetrics: 단계 계측 값
+        """
+        with self._lock:
+            stats = self.queues.get(name)
+            if stats is None:
+                stats = self.queues[name] = QueueMetrics(name, capacity=capacity, workers=workers)
+            return stats
+
+    def close(self):
+        """계측 종료 (trace 파일 닫기, 직접 시작한 tracemalloc 중지)"""
+        if self._ended is None:
+            self._ended = time.perf_counter()
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+        if self._own_tracemalloc:
+            tracemalloc.stop()
+            self._own_tracemalloc = False
+
+    def to_dict(self):
+        """
+        JSON으로 저장할 수 있는 계측 값
+
+        Returns:
+            dict: {"job", "total_seconds", "stages": {단계 이름: 계측 값}}
+        """
+        return {
+            "job": self.job_name,
+            "total_seconds": self.total_seconds,
+            "stages": {name: stage.to_dict() for name, stage in self.stages.items()},
+            "queues": {name: stats.to_dict() for name, stats in self.queues.items()},
+        }
+
+    def summary(self):
+        """
+        단계별 계측 값을 표 형식 문자열로 반환
+        """
+        lines = [f"{'stage':<16} {'calls':>6} {'wall(s)':>9} {'cpu(s)':>9} {'rows/s':>12} {'MB written':>11} {'peak MB':>8}"]
+        for stage in self.stages.values():
+            peak = f"{stage.peak_bytes / 1024 ** 2:>8.1f}" if stage.peak_bytes is not None else f"{'-':>8}"
+            lines.append(f"{stage.name:<16} {stage.calls:>6} {stage.wall_seconds:>9.3f} {stage.cpu_seconds:>9.3f} "
+                         f"{stage.rows_per_second:>12,.0f} {stage.bytes_written / 1024 ** 2:>11.1f} {peak}")
+        lines.append(f"{'total':<16} {'':>6} {self.total_seconds:>9.3f}")
+        if self.queues:
+            lines.append("")
+            lines.append(f"{'queue':<16} {'items':>6} {'depth':>9} {'max':>5} {'blocked(s)':>11} "
+                         f"{'starved(s)':>11} {'util':>6}")
+            for stats in self.queues.values():
+                lines.append(f"{stats.name:<16} {stats.items:>6} {stats.mean_depth:>4.1f}/{stats.capacity:<4} "
+                             f"{stats.max_depth:>5} {stats.blocked_seconds:>11.3f} {stats.starved_seconds:>11.3f} "
+                             f"{stats.utilization:>6.0%}")
+        return "\n".join(lines)
+
+    def _add(self, current):
+        with self._lock:
+            total = self.stages.get(current.name)
+            if total is None:
+                total = self.stages[current.name] = StageMetrics(current.name)
+            total.calls += current.calls
+            total.wall_seconds += current.wall_seconds
+            total.cpu_seconds += current.cpu_seconds
+            total.rows += current.rows
+            total.bytes_written += current.bytes_written
+            if current.peak_bytes is not None:
+                total.peak_bytes = max(total.peak_bytes or 0, current.peak_bytes)
+
+    def _write_event(self, current, started, args):
+        if self._trace is None:
+            return
+        event_args = {key: value for key, value in (
+            ("rows", current.rows),
+            ("bytes_written", current.bytes_written),
+            ("cpu_ms", round(current.cpu_seconds * 1000, 3)),
+            ("peak_bytes", current.peak_bytes),
+        ) if value}
+        event_args.update({key: str(value) for key, value in args.items()})
+        event = {
+            "name": current.name,
+            "cat": self.job_name,
+            "ph": "X",
+            "ts": round((started - self._started) * 1e6, 1),
+            "dur": round(current.wall_seconds * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": event_args,
+        }
+        with self._lock:
+            if self._trace is not None:
+                self._trace.write(json.dumps(event, ensure_ascii=False) + ",\n")
+
+
+class SplitResult(list):
+    """
+    parse_data의 반환 값: 출력 파일 경로 목록(list)에 작업 계측 값(metrics)을 덧붙인 것
+
+    Attributes:
+        metrics (JobMetrics): 단계별 계측 값
+        profile_files (list): 프로파일링 결과 파일 경로 (프로파일링하지 않았으면 빈 목록)
+        filename_plan (FilenamePlan): 그룹 값별 출력 파일 이름 (Parquet/Feather 출력이면 None)
+    """
+
+    def __init__(self, output_files=(), metrics=None, profile_files=(), filename_plan=None):
+        super().__init__(output_files)
+        self.metrics = metrics
+        self.profile_files = list(profile_files)
+        self.filename_plan = filename_plan
@@ -0,0 +1,240 @@
+"""
+프로세스 풀을 이용한 그룹별 출력 파일 병렬 저장
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from .excel_writers import XLSX_EXTENSIONS, write_frame_xlsx
+
+logger = logging.getLogger(__name__)
+
+# CSV를 나누어 쓸 행 수
+CSV_CHUNK_ROWS = 50000
+
+# 이 행 수 이상인 파티션은 Arrow IPC로 보냄. 작은 파티션은 변환 준비 비용이 커서 pickle이 더 빠름
+# (benchmarks/bench_transfer.py)
+ARROW_MIN_ROWS = 10000
+
+# 작업 프로세스가 비정상 종료되어 저장하지 못한 파티션의 오류 메시지
+WORKER_CRASHED_ERROR = "저장 작업 프로세스가 비정상 종료되었습니다 (메모리 부족 등)"
+
+
+def save_frame(df, output_path):
+    """
+    DataFrame을 확장자에 맞는 방식으로 저장 (인덱스 제외)
+
+    Args:
+        df (pandas.DataFrame): 저장할 데이터
+        output_path (str): 저장할 파일 경로
+
+    Returns:
+        int: 저장된 파일 크기 (bytes)
+    """
+    ext = os.path.splitext(output_path)[1].lower()
+    if ext in XLSX_EXTENSIONS:
+        return write_frame_xlsx(df, output_path)
+    if ext == ".csv":
+        # 엑셀에서 바로 열 수 있도록 BOM 포함 UTF-8, 큰 그룹은 나누어 기록
+        df.to_csv(output_path, index=False, encoding="utf-8-sig", chunksize=CSV_CHUNK_ROWS)
+        return os.path.getsize(output_path)
+    df.to_excel(output_path, index=False)
+    return os.path.getsize(output_path)
+
+
+class PackedPartition:
+    """
+    작업 프로세스로 보낼 파티션 (pack_partition으로 생성)
+
+    숫자/날짜/문자열 열은 Arrow IPC 스트림 하나에 담아 보내므로, 셀 값마다 파이썬 객체를
+    직렬화하는 대신 열 버퍼를 복사한다. 나머지 열(값 종류가 섞인 object 열, 범주형 등)은
+    배열 그대로 직렬화한다. 행 인덱스는 저장하지 않으므로 보내지 않는다.
+
+    Attributes:
+        columns (pandas.Index): 열 이름
+        arrow (pyarrow.Buffer): Arrow IPC 스트림 (arrow_positions 순서의 열)
+        arrow_positions (list[int]): Arrow로 보낸 열 위치
+        others (dict): 나머지 열 위치 -> 값 배열
+    """
+
+    def __init__(self, columns, arrow, arrow_positions, others):
+        self.columns = columns
+        self.arrow = arrow
+        self.arrow_positions = arrow_positions
+        self.others = others
+
+    def to_frame(self):
+        """작업 프로세스에서 DataFrame으로 복원 (열 이름과 값은 원래와 같고 인덱스는 0부터)"""
+        import pyarrow as pa
+
+        columns = dict(self.others)
+        table = pa.ipc.open_stream(self.arrow).read_all()
+        for i, position in enumerate(self.arrow_positions):
+            columns[position] = table.column(i).to_pandas()
+        df = pd.DataFrame({i: columns[i] for i in range(len(self.columns))}, copy=False)
+        df.columns = self.columns
+        return df
+
+
+def _arrow_compatible(column):
+    """Arrow로 보냈다가 같은 값으로 되돌릴 수 있는 열인지 (numpy 숫자/bool/날짜 열, 문자열만 있는 object 열)"""
+    dtype = column.dtype
+    if dtype == object:
+        return pd.api.types.infer_dtype(column, skipna=True) == "string"
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufM"
+
+
+def pack_partition(df, min_rows=ARROW_MIN_ROWS):
+    """
+    파티션을 작업 프로세스로 보내기 좋은 형태로 변환
+
+    pyarrow가 있고 min_rows행 이상이면 Arrow로 옮길 수 있는 열을 Arrow IPC 스트림으로 묶은
+    PackedPartition을, 그 밖에는 DataFrame을 그대로 돌려준다 (executor가 pickle로 직렬화).
+
+    Args:
+        df (pandas.DataFrame): 저장할 파티션
+        min_rows (int): Arrow로 보낼 최소 행 수
+
+    Returns:
+        PackedPartition | pandas.DataFrame: 작업 프로세스로 보낼 파티션
+    """
+    if len(df) < min_rows:
+        return df
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return df
+
+    arrays = []
+    arrow_positions = []
+    others = {}
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
+        if _arrow_compatible(column):
+            try:
+                arrays.append(pa.Array.from_pandas(column))
+                arrow_positions.append(i)
+                continue
+            except (pa.ArrowException, UnicodeError):
+                # 인코딩할 수 없는 문자열 등
+                pass
+        others[i] = column.array
+    if not arrays:
+        return df
+
+    batch = pa.RecordBatch.from_arrays(arrays, names=[str(i) for i in arrow_positions])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return PackedPartition(df.columns, sink.getvalue(), arrow_positions, others)
+
+
+def _write_partition(partition, output_path):
+    """
+    작업 프로세스에서 실행되는 저장 함수
+
+    예외 객체는 직렬화가 불가능할 수 있으므로 메시지로 변환해 돌려준다.
+
+    Args:
+        partition (PackedPartition | pandas.DataFrame): pack_partition으로 변환한 파티션
+        output_path (str): 저장할 파일 경로
+
+    Returns:
+        tuple: (저장된 파일 크기, 오류 메시지, 저장 시간(초)), 크기와 오류 메시지 중 하나는 None
+    """
+    started = time.perf_counter()
+    try:
+        df = partition.to_frame() if isinstance(partition, PackedPartition) else partition
+        return save_frame(df, output_path), None, time.perf_counter() - started
+    except Exception as e:
+        return None, str(e) or type(e).__name__, time.perf_counter() - started
+
+
+def write_partitions_parallel(jobs, workers):
+    """
+    파티션들을 프로세스 풀에서 병렬로 저장
+
+    파티션은 pack_partition으로 변환해 보낸다. 동시에 작업 중인 파티션은 workers * 2개로 제한하여
+    보낼 파티션이 한꺼번에 메모리에 쌓이지 않도록 하고, 결과는 입력 순서대로 돌려준다.
+
+    그룹마다 오류를 따로 돌려주므로 한 그룹이 실패해도 나머지 그룹은 계속 저장한다.
+    작업 프로세스가 비정상 종료되어(메모리 부족 등) 풀을 쓸 수 없게 되면 새 풀로 바꾸고,
+    그때 작업 중이던 파티션은 어느 파티션 때문인지 알 수 없으므로 하나씩 따로 다시 저장한다.
+    따로 저장할 때도 작업 프로세스가 종료되면 그 파티션만 실패로 돌려준다.
+
+    Args:
+        jobs (Iterable[tuple]): (DataFrame, 출력 파일 경로) 목록
+        workers (int): 작업 프로세스 수
+
+    Yields:
+        tuple: (출력 파일 경로, 저장된 파일 크기, 오류 메시지, 작업 프로세스에서의 저장 시간(초))
+        
+    반환된 제너레이터를 도중에 close()하면 대기 중인 작업을 취소하고 풀을 종료한다.
+    """
+    max_pending = workers * 2
+    executor = ProcessPoolExecutor(max_workers=workers)
+    retry_executor = None
+    # 비정상 종료로 교체한 풀 (마지막에 함께 종료)
+    broken = []
+    pending = deque()
+
+    def replace(pool):
+        """깨진 풀을 새 풀로 교체 (같은 풀의 작업마다 호출되므로 아직 교체하지 않았을 때만)"""
+        nonlocal executor
+        if pool is executor:
+            logger.error(f"저장 작업 프로세스가 비정상 종료되어 프로세스 풀을 다시 시작합니다 (작업 프로세스 {workers}개)")
+            broken.append(executor)
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit(partition, output_path):
+        try:
+            return executor, executor.submit(_write_partition, partition, output_path)
+        except BrokenProcessPool:
+            replace(executor)
+            return executor, executor.submit(_write_partition, partition, output_path)
+
+    def result(partition, output_path, pool, future):
+        nonlocal retry_executor
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            replace(pool)
+        except Exception as e:
+            # 파티션을 작업 프로세스로 보내지 못한 경우 등
+            return None, str(e) or type(e).__name__, 0.0
+
+        logger.warning(f"작업 프로세스 비정상 종료로 파티션을 따로 다시 저장: {output_path}")
+        if retry_executor is None:
+            retry_executor = ProcessPoolExecutor(max_workers=1)
+        try:
+            return retry_executor.submit(_write_partition, partition, output_path).result()
+        except BrokenProcessPool:
+            logger.error(f"파티션 저장 중 작업 프로세스가 비정상 종료됨: {output_path}")
+            broken.append(retry_executor)
+            retry_executor = None
+            return None, WORKER_CRASHED_ERROR, 0.0
+
+    try:
+        for df, output_path in jobs:
+            partition = pack_partition(df)
+            pending.append((partition, output_path, *submit(partition, output_path)))
+            if len(pending) >= max_pending:
+                job = pending.popleft()
+                yield (job[1], *result(*job))
+        while pending:
+            job = pending.popleft()
+            yield (job[1], *result(*job))
+    finally:
+        # 중간에 중단되면 아직 시작하지 않은 작업은 취소
+        for *_, future in pending:
+            future.cancel()
+        for pool in [executor, retry_executor, *broken]:
+            if pool is not None:
+                pool.shutdown()
@@ -0,0 +1,156 @@
+"""
+DataFrame 분할(파티셔닝) 로직
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def factorize_keys(keys):
+    """
+    기준 값(여러 열이면 값 조합)마다 그룹 코드 부여
+
+    여러 열은 열마다 factorize한 코드를 한 열씩 합치고 곧바로 다시 factorize하므로
+    코드 범위는 행 수가 아니라 실제 등장한 조합 수에 비례한다.
+
+    Args:
+        keys (pandas.Series | pandas.DataFrame | numpy.ndarray): 그룹 기준 값 (DataFrame이면 열 조합)
+
+    Returns:
+        tuple: (codes, uniques)
+            - codes (numpy.ndarray): 행별 그룹 코드 (처음 등장한 순서로 0부터)
+            - uniques (pandas.Index): 그룹 값 (여러 열이면 값 조합의 MultiIndex)
+    """
+    if not isinstance(keys, pd.DataFrame):
+        return pd.factorize(keys, sort=False, use_na_sentinel=False)
+    if len(keys.columns) == 1:
+        return pd.factorize(keys.iloc[:, 0], sort=False, use_na_sentinel=False)
+
+    codes = np.zeros(len(keys), dtype=np.int64)
+    for i in range(len(keys.columns)):
+        column_codes, column_uniques = pd.factorize(keys.iloc[:, i], sort=False, use_na_sentinel=False)
+        codes, _ = pd.factorize(codes * len(column_uniques) + column_codes, sort=False)
+
+    # 그룹마다 처음 등장한 행의 값으로 조합 구성
+    first_rows = np.zeros(codes.max() + 1 if len(codes) else 0, dtype=np.int64)
+    first_rows[codes[::-1]] = np.arange(len(codes) - 1, -1, -1)
+    uniques = pd.MultiIndex.from_arrays(
+        [keys.iloc[first_rows, i].to_numpy() for i in range(len(keys.columns))],
+        names=list(keys.columns),
+    )
+    return codes, uniques
+
+
+def partition_indices(keys):
+    """
+    키 값을 한 번만 훑어 그룹별 행 위치를 계산
+
+    factorize로 각 행에 그룹 코드를 부여한 뒤 안정 정렬하여
+    같은 그룹의 행이 연속되도록 만든다. 그룹 순서는 Series.unique()와
+    동일하게 처음 등장한 순서를 따르며, NaN은 하나의 그룹으로 묶인다.
+
+    Args:
+        keys (pandas.Series | pandas.DataFrame | numpy.ndarray): 그룹 기준 값 (DataFrame이면 열 조합)
+
+    Returns:
+        tuple: (uniques, order, bounds)
+            - uniques (pandas.Index): 그룹 값 (등장 순서, 여러 열이면 값 조합의 MultiIndex)
+            - order (numpy.ndarray): 그룹 순으로 정렬된 행 위치
+            - bounds (numpy.ndarray): 각 그룹이 order에서 차지하는 구간 경계 (길이 len(uniques) + 1)
+    """
+    codes, uniques = factorize_keys(keys)
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(uniques))
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    return uniques, order, bounds
+
+
+class GroupIndex:
+    """
+    기준 열만으로 계산한 그룹 색인
+
+    기준 열만 먼저 읽어 그룹 수와 그룹별 행 수를 바로 확인하고,
+    나머지 열을 읽은 뒤에는 같은 색인으로 분할할 수 있다.
+    """
+
+    def __init__(self, keys):
+        """
+        GroupIndex 초기화
+
+        Args:
+            keys (pandas.Series | pandas.DataFrame): 기준 열 값 (DataFrame이면 열 조합)
+        """
+        self.column_name = keys.name if isinstance(keys, pd.Series) else list(keys.columns)
+        self.uniques, self.order, self.bounds = partition_indices(keys)
+        self._keys = keys
+
+    def __len__(self):
+        return len(self.uniques)
+
+    @property
+    def row_count(self):
+        """전체 행 수"""
+        return len(self._keys)
+
+    @property
+    def counts(self):
+        """그룹별 행 수 (uniques 순서)"""
+        return np.diff(self.bounds)
+
+    def matches(self, keys):
+        """
+        다른 시점에 읽은 기준 열이 이 색인과 같은 행 배치인지 확인
+
+        Args:
+            keys (pandas.Series | pandas.DataFrame): 기준 열 값
+        """
+        if type(keys) is not type(self._keys):
+            return False
+        if len(keys) != len(self._keys):
+            return False
+        return keys.reset_index(drop=True).equals(self._keys.reset_index(drop=True))
+
+    def summary(self):
+        """
+        그룹별 행 수 요약
+
+        Returns:
+            pandas.DataFrame: 그룹 값(기준 열마다 한 열)과 행 수 (행 수 내림차순)
+        """
+        if isinstance(self.uniques, pd.MultiIndex):
+            levels = [self.uniques.get_level_values(i) for i in range(self.uniques.nlevels)]
+            names = [str(name) for name in self.column_name]
+        else:
+            levels = [self.uniques]
+            names = [str(self.column_name)]
+        summary = pd.DataFrame({
+            name: level.astype(object).where(~level.isna(), "NA") for name, level in zip(names, levels)
+        })
+        summary["행 수"] = self.counts
+        return summary.sort_values("행 수", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def partition_frame(df, column_idx, group_index=None, output_width=None):
+    """
+    지정한 열 값 기준으로 DataFrame을 그룹별로 분할
+
+    전체 프레임을 그룹 순으로 한 번만 재배열(take)한 뒤 구간을 잘라내므로
+    각 파티션은 재배열된 프레임의 뷰(view)가 된다.
+
+    Args:
+        df (pandas.DataFrame): 분할할 데이터
+        column_idx (int | list[int]): 기준 열 인덱스 (0부터 시작, 목록이면 열 조합 기준)
+        group_index (GroupIndex): 미리 계산한 그룹 색인 (행 배치가 같을 때만 재사용)
+        output_width (int): 파티션에 남길 앞쪽 열 수 (None이면 전체, 출력하지 않는 기준 열을 뒤에 붙였을 때)
+
+    Yields:
+        tuple: (그룹 값, 해당 그룹의 DataFrame), 열 조합 기준이면 그룹 값은 튜플
+    """
+    keys = df.iloc[:, column_idx]
+    if group_index is not None and group_index.matches(keys):
+        uniques, order, bounds = group_index.uniques, group_index.order, group_index.bounds
+    else:
+        uniques, order, bounds = partition_indices(keys)
+    sorted_df = df.take(order) if output_width is None else df.iloc[order, :output_width]
+    for i, value in enumerate(uniques):
+        yield value, sorted_df.iloc[bounds[i]:bounds[i + 1]]
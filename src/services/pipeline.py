@@ -0,0 +1,174 @@
+"""
+크기가 제한된 큐로 단계를 잇는 생산자/소비자 파이프라인
+
+읽기 단계는 별도 스레드에서 다음 항목을 미리 꺼내 큐에 쌓아 두고(prefetch),
+저장 단계는 스레드 풀에서 실행한다(map_bounded). 큐가 가득 차면 앞 단계가 기다리므로
+(back-pressure) 메모리에 쌓이는 항목 수는 큐 크기로 제한되고, 디스크/네트워크 입출력을
+기다리는 동안 다른 단계가 CPU 작업을 계속한다.
+
+단계마다 큐 길이, 대기 시간, 스레드 사용률을 QueueMetrics에 기록한다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 읽기 단계에서 미리 꺼내 둘 항목 수
+PREFETCH_DEPTH = 2
+
+# 큐가 가득 찼을 때 중단 요청을 확인하는 간격 (초)
+_POLL_SECONDS = 0.1
+
+# 읽기 스레드가 끝났음을 알리는 표시
+_DONE = object()
+
+
+class _Failure:
+    """읽기 스레드에서 발생한 예외 (꺼내는 쪽에서 다시 발생)"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def prefetch(source, stats, depth=PREFETCH_DEPTH):
+    """
+    source의 항목을 별도 스레드에서 미리 꺼내 depth개까지 큐에 쌓아 두고 차례로 반환
+
+    source는 읽기 스레드에서만 반복하므로, 스레드 간에 공유할 수 없는 객체
+    (예: 열려 있는 워크북)를 읽는 제너레이터도 넘길 수 있다. source에서 발생한 예외는
+    꺼내는 쪽에서 다시 발생한다.
+
+    Args:
+        source (Iterable): 읽을 항목
+        stats (QueueMetrics): 큐 길이와 대기/처리 시간을 기록할 계측 값
+        depth (int): 큐 최대 길이
+
+    Yields:
+        source의 항목 (순서 유지)
+
+    반환된 제너레이터를 도중에 close()하면 읽기 스레드가 지금 꺼내는 항목까지만 읽고 멈춘다.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    started = time.perf_counter()
+
+    def put(item):
+        waited = time.perf_counter()
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=_POLL_SECONDS)
+            except queue.Full:
+                continue
+            stats.blocked_seconds += time.perf_counter() - waited
+            return True
+        return False
+
+    def produce():
+        iterator = iter(source)
+        try:
+            while not stop.is_set():
+                busy = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.busy_seconds += time.perf_counter() - busy
+                if not put(item):
+                    break
+                stats.enqueued(items.qsize())
+        except BaseException as e:
+            put(_Failure(e))
+        finally:
+            # 제너레이터는 만든 스레드에서 닫아야 안쪽 with 문(워크북 등)이 정리됨
+            if hasattr(iterator, "close"):
+                iterator.close()
+            put(_DONE)
+
+    thread = threading.Thread(target=produce, name=f"pipeline-{stats.name}", daemon=True)
+    thread.start()
+    try:
+        while True:
+            waited = time.perf_counter()
+            item = items.get()
+            stats.starved_seconds += time.perf_counter() - waited
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        # 가득 찬 큐에 넣으려고 기다리는 읽기 스레드를 깨운 뒤 종료 대기
+        while thread.is_alive():
+            try:
+                items.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                pass
+        thread.join()
+        stats.elapsed_seconds += time.perf_counter() - started
+
+
+def _timed(fn, item):
+    """
+    작업 스레드에서 실행되는 함수: 결과와 예외, 실행 시간을 함께 반환
+    """
+    started = time.perf_counter()
+    try:
+        return fn(item), None, time.perf_counter() - started
+    except Exception as e:
+        return None, e, time.perf_counter() - started
+
+
+def map_bounded(fn, items, threads, stats, max_pending=None):
+    """
+    items마다 fn을 스레드 풀에서 실행하고 결과를 입력 순서대로 반환
+
+    items는 호출한 스레드에서 하나씩 꺼내므로 앞 단계(예: 분할)를 제너레이터로 넘기면
+    앞 단계와 저장이 겹쳐 실행된다. 대기/실행 중인 작업은 max_pending개로 제한하고,
+    가득 차면 가장 오래된 작업이 끝날 때까지 다음 항목을 꺼내지 않는다.
+
+    Args:
+        fn (Callable): 항목 하나를 처리할 함수 (작업 스레드에서 실행)
+        items (Iterable): 처리할 항목
+        threads (int): 작업 스레드 수
+        stats (QueueMetrics): 대기 중인 작업 수와 처리 시간을 기록할 계측 값
+        max_pending (int): 최대 대기/실행 작업 수 (None이면 threads * 2)
+
+    Yields:
+        tuple: (항목, 결과, 예외, 작업 스레드에서의 실행 시간(초)), 예외가 없으면 None
+
+    반환된 제너레이터를 도중에 close()하면 아직 시작하지 않은 작업을 취소하고
+    실행 중인 작업이 끝날 때까지 기다린다.
+    """
+    max_pending = max_pending or threads * 2
+    started = time.perf_counter()
+    pending = deque()
+
+    def finished(item, future):
+        result, error, seconds = future.result()
+        stats.busy_seconds += seconds
+        return item, result, error, seconds
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix=f"pipeline-{stats.name}") as executor:
+        try:
+            for item in items:
+                pending.append((item, executor.submit(_timed, fn, item)))
+                stats.enqueued(len(pending))
+                if len(pending) >= max_pending:
+                    item, future = pending.popleft()
+                    waited = time.perf_counter()
+                    result = finished(item, future)
+                    stats.blocked_seconds += time.perf_counter() - waited
+                    yield result
+            while pending:
+                yield finished(*pending.popleft())
+        finally:
+            # 중간에 중단되면 아직 시작하지 않은 작업은 취소
+            for _, future in pending:
+                future.cancel()
+            stats.elapsed_seconds += time.perf_counter() - started
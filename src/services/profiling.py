@@ -0,0 +1,188 @@
+"""
+작업 프로파일링
+
+작업 하나를 cProfile 또는 샘플링 프로파일러로 감싸 실행하고, 결과를 출력 폴더에 저장한다.
+현장에서 느린 입력 파일을 받았을 때 디버거 없이(PyInstaller 빌드에서도) 원인을 확인하기 위한 것이다.
+
+- cprofile: 모든 함수 호출을 기록 (<파일명>_profile.prof, pstats/snakeviz로 열람) + 요약 텍스트.
+  작업 중 시작한 스레드(io_threads의 저장/미리 읽기 스레드)의 호출도 합쳐 기록한다.
+- sampling: 별도 스레드가 작업 스레드의 호출 스택을 주기적으로 기록 (오버헤드가 작음)
+  (<파일명>_profile.folded, flamegraph.pl/speedscope 형식) + 요약 텍스트.
+  작업 스레드만 기록하므로 저장/미리 읽기 스레드에서 쓴 시간은 해당 작업을 기다린 시간으로 나타난다.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 프로파일링 방식
+PROFILE_MODES = ("cprofile", "sampling")
+
+# 요약 텍스트에 표시할 함수 수
+TOP_FUNCTIONS = 30
+
+
+class SamplingProfiler:
+    """
+    대상 스레드의 호출 스택을 일정 간격으로 기록하는 샘플링 프로파일러
+    """
+
+    def __init__(self, thread_id=None, interval=0.005):
+        """
+        SamplingProfiler 초기화
+
+        Args:
+            thread_id (int): 기록할 스레드 ID (None이면 생성한 스레드)
+            interval (float): 기록 간격 (초)
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        # 호출 스택(바깥 -> 안쪽 함수 이름 튜플) -> 기록 횟수
+        self.stacks = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write_folded(self, path):
+        """
+        접힌 스택(folded stack) 형식으로 저장 ("바깥;...;안쪽 횟수" 한 줄에 스택 하나)
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def summary(self, top=TOP_FUNCTIONS):
+        """
+        함수별 자체 시간(self)과 누적 시간(total) 비율 요약 텍스트
+        """
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for frame in set(stack):
+                total[frame] += count
+        samples = max(self.sample_count, 1)
+        lines = [f"샘플 {self.sample_count}개 (간격 {self.interval * 1000:.1f}ms)", "",
+                 f"{'self%':>7} {'total%':>7}  함수"]
+        for frame, count in own.most_common(top):
+            lines.append(f"{count / samples:>7.1%} {total[frame] / samples:>7.1%}  {frame}")
+        lines += ["", f"{'total%':>7}  함수 (누적 시간 순)"]
+        for frame, count in total.most_common(top):
+            lines.append(f"{count / samples:>7.1%}  {frame}")
+        return "\n".join(lines) + "\n"
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+            self.sample_count += 1
+
+
+def _profile_new_threads(profilers):
+    """
+    이후 시작하는 스레드마다 cProfile.Profile을 켜서 profilers에 추가 (threading.setprofile(None)으로 해제)
+
+    Python 3.11까지 cProfile은 켠 스레드만 기록한다. 3.12부터는 sys.monitoring으로
+    모든 스레드를 기록하고 프로파일러를 하나만 켤 수 있으므로 아무것도 하지 않는다.
+    """
+    if sys.version_info >= (3, 12):
+        return
+
+    def start(frame, event, arg):
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        profilers.append(profiler)
+        profiler.enable()
+
+    threading.setprofile(start)
+
+
+def _cprofile_stats(profiler, thread_profilers):
+    """작업 스레드와 작업 중 시작한 스레드의 cProfile 결과를 합친 통계"""
+    stats = pstats.Stats(profiler)
+    for thread_profiler in thread_profilers:
+        stats.add(thread_profiler)
+    return stats
+
+
+def _cprofile_summary(stats, top=TOP_FUNCTIONS):
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return stream.getvalue()
+
+
+@contextmanager
+def profile_job(mode, output_base):
+    """
+    with 블록 안의 작업을 프로파일링하고 결과 파일 저장 (작업이 실패해도 저장)
+
+    Args:
+        mode (str): 프로파일링 방식 ("cprofile", "sampling")
+        output_base (str): 결과 파일 경로 앞부분 (예: output/급여 -> output/급여_profile.prof)
+
+    Yields:
+        list: 저장된 결과 파일 경로 (블록이 끝난 뒤 채워짐)
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"지원하지 않는 프로파일링 방식입니다: {mode} (사용 가능: {', '.join(PROFILE_MODES)})")
+
+    profile_files = []
+    started = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        # 저장/미리 읽기 스레드의 호출도 기록해 결과에 합침
+        thread_profilers = []
+        _profile_new_threads(thread_profilers)
+        profiler.enable()
+    else:
+        profiler = SamplingProfiler()
+        profiler.start()
+    try:
+        yield profile_files
+    finally:
+        elapsed = time.perf_counter() - started
+        summary_path = f"{output_base}_profile.txt"
+        if mode == "cprofile":
+            profiler.disable()
+            threading.setprofile(None)
+            data_path = f"{output_base}_profile.prof"
+            stats = _cprofile_stats(profiler, thread_profilers)
+            stats.dump_stats(data_path)
+            summary = _cprofile_summary(stats)
+        else:
+            profiler.stop()
+            data_path = f"{output_base}_profile.folded"
+            profiler.write_folded(data_path)
+            summary = profiler.summary()
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(f"프로파일링 방식: {mode}, 소요 시간: {elapsed:.3f}초\n\n{summary}")
+        profile_files.extend([data_path, summary_path])
+        logger.info(f"프로파일 저장: {data_path}, {summary_path}")
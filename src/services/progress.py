@@ -0,0 +1,170 @@
+"""
+작업 진행 상황 보고 및 취소 처리
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from .errors import JobCancelledError
+from .metrics import JobMetrics
+
+# 단계별 진행률 구간 (%)
+# 일괄 읽기는 진행률을 알 수 없으므로 읽기 완료 시점에 READ_DONE_PERCENT로 이동한다
+READ_DONE_PERCENT = 10
+PARTITION_DONE_PERCENT = 15
+# 스트리밍 모드에서 읽기(=분할)가 차지하는 구간
+STREAM_READ_PERCENT = 90
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    진행 상황 이벤트
+
+    Attributes:
+        stage (str): 현재 단계 ("read", "partition", "write", "done")
+        percent (int): 전체 진행률 (0-100)
+        rows_read (int): 읽은 행 수
+        groups_discovered (int): 발견한 그룹 수
+        files_written (int): 저장한 파일 수 (묶음 출력이면 저장을 마친 워크북/ZIP 수)
+        total_files (int): 저장할 전체 파일 수 (아직 모르거나 묶음 출력이면 0)
+        bytes_written (int): 저장한 파일 크기 합계
+        parts_written (int): 묶음 출력(sheets, zip)에서 묶음에 넣은 그룹 수 (시트 또는 ZIP 항목)
+        total_parts (int): 묶음 출력에서 묶음에 넣을 전체 그룹 수 (파일로 저장하면 0)
+        elapsed (float): 작업 시작 후 경과 시간 (초)
+        eta (float): 예상 남은 시간 (초, 추정할 수 없으면 None)
+    """
+    stage: str
+    percent: int
+    rows_read: int = 0
+    groups_discovered: int = 0
+    files_written: int = 0
+    total_files: int = 0
+    bytes_written: int = 0
+    parts_written: int = 0
+    total_parts: int = 0
+    elapsed: float = 0.0
+    eta: float = None
+
+
+class CancellationToken:
+    """
+    협조적 작업 취소 토큰
+
+    다른 스레드(예: UI)에서 cancel()을 호출하면 작업이 다음 확인 지점에서
+    JobCancelledError로 중단된다.
+    """
+
+    def __init__(self, event=None):
+        """
+        CancellationToken 초기화
+
+        Args:
+            event: 취소 여부를 담을 이벤트 (set, is_set 지원). 다른 프로세스에서 취소하려면
+                multiprocessing.Manager().Event()를 넘긴다. None이면 threading.Event 사용
+        """
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        """작업 취소 요청"""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """취소 요청 여부"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """취소 요청이 있으면 JobCancelledError 발생"""
+        if self._event.is_set():
+            raise JobCancelledError("작업이 취소되었습니다.")
+
+
+class ProgressTracker:
+    """
+    작업 하나의 진행 카운터를 보관하고 ProgressEvent를 콜백으로 전달
+    """
+
+    def __init__(self, callback=None, cancel_token=None, metrics=None):
+        """
+        ProgressTracker 초기화
+
+        Args:
+            callback (Callable[[ProgressEvent], None]): 진행 이벤트를 받을 함수
+            cancel_token (CancellationToken): 취소 토큰
+            metrics (JobMetrics): 단계별 계측 값을 모을 객체 (None이면 새로 생성)
+        """
+        self.callback = callback
+        self.cancel_token = cancel_token
+        self.metrics = metrics if metrics is not None else JobMetrics()
+        self.rows_read = 0
+        self.groups_discovered = 0
+        self.files_written = 0
+        self.total_files = 0
+        self.bytes_written = 0
+        self.parts_written = 0
+        self.total_parts = 0
+        # 쓰기 단계가 시작되는 진행률
+        self.write_start_percent = PARTITION_DONE_PERCENT
+        self._started = time.perf_counter()
+
+    def check_cancelled(self):
+        """취소 요청이 있으면 JobCancelledError 발생"""
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def emit(self, stage, percent):
+        """
+        현재 카운터로 진행 이벤트 전달
+
+        Args:
+            stage (str): 현재 단계
+            percent (float): 전체 진행률 (0-100)
+        """
+        if self.callback is None:
+            return
+        percent = min(max(percent, 0), 100)
+        elapsed = time.perf_counter() - self._started
+        eta = None
+        if 0 < percent < 100:
+            eta = elapsed * (100 - percent) / percent
+        elif percent >= 100:
+            eta = 0.0
+        self.callback(ProgressEvent(
+            stage=stage,
+            percent=int(percent),
+            rows_read=self.rows_read,
+            groups_discovered=self.groups_discovered,
+            files_written=self.files_written,
+            total_files=self.total_files,
+            bytes_written=self.bytes_written,
+            parts_written=self.parts_written,
+            total_parts=self.total_parts,
+            elapsed=elapsed,
+            eta=eta,
+        ))
+
+    def file_written(self, size):
+        """
+        파일 하나 저장 완료를 기록하고 쓰기 단계 진행률 전달
+
+        Args:
+            size (int): 저장된 파일 크기 (bytes)
+        """
+        self.files_written += 1
+        self.bytes_written += size or 0
+        if self.total_files:
+            ratio = self.files_written / self.total_files
+            self.emit("write", self.write_start_percent + (100 - self.write_start_percent) * ratio)
+
+    def part_written(self):
+        """
+        묶음 출력에서 그룹 하나를 시트/ZIP 항목으로 저장했음을 기록하고 쓰기 단계 진행률 전달
+
+        묶음 파일 자체는 저장을 마칠 때 file_written으로 한 번 기록한다.
+        """
+        self.parts_written += 1
+        if self.total_parts:
+            ratio = self.parts_written / self.total_parts
+            self.emit("write", self.write_start_percent + (100 - self.write_start_percent) * ratio)
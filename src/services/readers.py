@@ -0,0 +1,263 @@
+"""
+엑셀 읽기 엔진(백엔드)
+
+ExcelParseService는 생성 시 지정한 리더로 입력 파일을 읽는다.
+"auto"를 지정하면 설치된 엔진 중 가장 빠른 것을 고른다.
+"""
+
+import importlib.util
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(*modules):
+    """모듈을 실제로 import하지 않고 설치 여부만 확인"""
+    return all(importlib.util.find_spec(module) is not None for module in modules)
+
+
+class ExcelReader:
+    """
+    엑셀 읽기 엔진 기본 클래스
+    """
+
+    # 리더 이름 (get_reader에서 사용)
+    name = None
+    # 필요한 선택 의존성 모듈
+    requires = ()
+
+    @classmethod
+    def is_available(cls):
+        """필요한 패키지가 설치되어 있는지 여부"""
+        return _installed(*cls.requires)
+
+    def read(self, file_path, sheet_name=0, usecols=None, dtype=None, nrows=None):
+        """
+        엑셀 시트를 DataFrame으로 읽기
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheet_name (str | int): 읽을 시트 이름 또는 순서
+            usecols (list[int]): 읽을 열 인덱스 (None이면 전체)
+            dtype (dict): 열별 데이터 타입 지정
+            nrows (int): 읽을 데이터 행 수 (None이면 전체, 0이면 헤더만)
+
+        Returns:
+            pandas.DataFrame: 엑셀 데이터
+        """
+        return self._convert(pd.read_excel(file_path, sheet_name=sheet_name, usecols=usecols, dtype=dtype,
+                                           nrows=nrows, **self._read_options()))
+
+    def read_selected(self, file_path, select, sheet_name=0):
+        """
+        헤더로 시트의 열 수를 확인해 읽을 열을 정한 뒤 그 열만 읽기
+
+        워크북은 한 번만 열므로 헤더와 데이터가 압축 해제와 공유 문자열 파싱 결과를 함께 쓴다
+        (헤더만 읽은 뒤 read(usecols=...)를 호출하면 두 번 열고 두 번 파싱한다).
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            select (Callable[[int], list[int]]): 시트의 열 수 -> 읽을 열 인덱스 목록
+            sheet_name (str | int): 읽을 시트 이름 또는 순서
+
+        Returns:
+            pandas.DataFrame: select가 반환한 순서의 열
+        """
+        options = self._read_options()
+        with pd.ExcelFile(file_path, engine=options.pop("engine", None)) as book:
+            column_idx = select(len(book.parse(sheet_name, nrows=0, **options).columns))
+            # usecols로 읽으면 시트의 열 순서가 되므로 요청한 순서로 되돌림
+            usecols = sorted(set(column_idx))
+            df = self._convert(book.parse(sheet_name, usecols=usecols, **options))
+        return df.iloc[:, [usecols.index(i) for i in column_idx]]
+
+    def sheet_names(self, file_path):
+        """
+        워크북의 시트 이름 목록 (워크북 순서)
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+
+        Returns:
+            list: 시트 이름
+        """
+        with pd.ExcelFile(file_path, engine=self._read_options().get("engine")) as book:
+            return list(book.sheet_names)
+
+    def read_sheets(self, file_path, sheet_names=None, on_sheet=None):
+        """
+        여러 시트를 DataFrame으로 읽기
+
+        워크북을 한 번만 열어 모든 시트가 공유 문자열/스타일 파싱 결과를 함께 쓴다
+        (시트마다 read()를 호출하면 시트 수만큼 압축을 풀고 공유 문자열을 다시 파싱한다).
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheet_names (list[str]): 읽을 시트 이름 (None이면 전체 시트)
+            on_sheet (Callable[[str, DataFrame, int, int], None]): 시트 하나를 읽을 때마다
+                (시트 이름, 데이터, 읽은 시트 수, 전체 시트 수)로 호출할 함수
+
+        Returns:
+            dict: 시트 이름 -> DataFrame (요청 순서)
+        """
+        frames = {}
+        for name, df, total in self.iter_sheets(file_path, sheet_names):
+            frames[name] = df
+            if on_sheet is not None:
+                on_sheet(name, df, len(frames), total)
+        return frames
+
+    def iter_sheets(self, file_path, sheet_names=None, usecols=None):
+        """
+        여러 시트를 하나씩 읽어 반환 (워크북은 한 번만 열고, 다 읽거나 반복을 멈추면 닫음)
+
+        Args:
+            file_path (str): 엑셀 파일 경로
+            sheet_names (list[str]): 읽을 시트 이름 (None이면 전체 시트)
+            usecols (list[int]): 시트마다 읽을 열 인덱스 (None이면 전체)
+
+        Yields:
+            tuple: (시트 이름, DataFrame, 전체 시트 수) (요청 순서)
+        """
+        options = self._read_options()
+        with pd.ExcelFile(file_path, engine=options.pop("engine", None)) as book:
+            names = list(book.sheet_names) if sheet_names is None else list(sheet_names)
+            missing = [name for name in names if name not in book.sheet_names]
+            if missing:
+                raise ValueError(f"시트가 없습니다: {', '.join(missing)} (시트 목록: {', '.join(book.sheet_names)})")
+            for name in names:
+                yield name, self._convert(book.parse(name, usecols=usecols, **options)), len(names)
+
+    def _read_options(self):
+        return {}
+
+    def _convert(self, df):
+        """읽은 DataFrame의 열 타입 변환 (기본은 그대로)"""
+        return df
+
+
+class OpenpyxlReader(ExcelReader):
+    """
+    pandas 기본 엔진 (xlsx는 openpyxl, xls는 xlrd)
+    """
+    name = "openpyxl"
+    requires = ("openpyxl",)
+
+
+class CalamineReader(ExcelReader):
+    """
+    Rust 기반 calamine 엔진 (python-calamine 필요)
+    """
+    name = "calamine"
+    requires = ("python_calamine",)
+
+    def _read_options(self):
+        return {"engine": "calamine"}
+
+
+class ArrowReader(ExcelReader):
+    """
+    calamine으로 읽은 뒤 문자열 열을 Arrow 버퍼로 보관하는 엔진 (python-calamine, pyarrow 필요)
+
+    값이 모두 문자열(또는 빈 셀)인 열은 파이썬 객체 배열 대신 Arrow 문자열 버퍼에 담기므로
+    분할/저장 단계의 메모리 사용량이 줄어든다. 숫자/날짜 열은 calamine 엔진과 같은 numpy 타입이고,
+    숫자와 문자열 등이 섞인 열은 값이 바뀌지 않도록 object로 둔다(다른 엔진과 같은 값).
+    """
+    name = "arrow"
+    requires = ("python_calamine", "pyarrow")
+
+    def _read_options(self):
+        return {"engine": "calamine"}
+
+    def _convert(self, df):
+        columns = {}
+        for i in range(len(df.columns)):
+            column = df.iloc[:, i]
+            if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string":
+                columns[i] = column.astype("string[pyarrow]")
+        if not columns:
+            return df
+
+        df = df.copy(deep=False)
+        for i, column in columns.items():
+            df.isetitem(i, column)
+        return df
+
+
+def compact_dtypes(df, exclude=(), max_category_ratio=0.5):
+    """
+    반복 값이 많은 열을 메모리를 덜 쓰는 타입으로 변환
+
+    고유 값 비율이 max_category_ratio 이하인 문자열(object) 열은 category로,
+    정수 열은 값 범위에 맞는 가장 작은 정수 타입으로 바꾼다. 값 자체는 바뀌지 않는다.
+
+    Args:
+        df (pandas.DataFrame): 변환할 데이터
+        exclude (Iterable[int]): 변환하지 않을 열 인덱스
+        max_category_ratio (float): category로 변환할 최대 고유 값 비율
+
+    Returns:
+        pandas.DataFrame: 변환된 데이터
+    """
+    exclude = set(exclude)
+    columns = {}
+    for i in range(len(df.columns)):
+        if i in exclude:
+            continue
+        column = df.iloc[:, i]
+        if column.dtype == object and len(column):
+            if column.nunique(dropna=False) <= len(column) * max_category_ratio:
+                columns[i] = column.astype("category")
+        elif pd.api.types.is_signed_integer_dtype(column.dtype) and not isinstance(column.dtype, pd.ArrowDtype):
+            columns[i] = pd.to_numeric(column, downcast="integer")
+    if not columns:
+        return df
+
+    df = df.copy(deep=False)
+    for i, column in columns.items():
+        df.isetitem(i, column)
+    return df
+
+
+# 이름 -> 리더 클래스
+READERS = {reader.name: reader for reader in (CalamineReader, ArrowReader, OpenpyxlReader)}
+
+# "auto" 선택 시 우선순위 (빠른 순)
+AUTO_ORDER = ("calamine", "arrow", "openpyxl")
+
+
+def available_readers():
+    """
+    설치된 리더 이름 목록 (AUTO_ORDER 순)
+    """
+    return [name for name in AUTO_ORDER if READERS[name].is_available()]
+
+
+def get_reader(name="auto"):
+    """
+    이름으로 리더 생성
+
+    Args:
+        name (str | ExcelReader): 리더 이름 ("auto", "calamine", "arrow", "openpyxl") 또는 리더 객체
+
+    Returns:
+        ExcelReader: 리더
+    """
+    if isinstance(name, ExcelReader):
+        return name
+
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            if READERS[candidate].is_available():
+                logger.info(f"엑셀 읽기 엔진 자동 선택: {candidate}")
+                return READERS[candidate]()
+        raise ValueError("사용 가능한 엑셀 읽기 엔진이 없습니다.")
+
+    reader_class = READERS.get(name)
+    if reader_class is None:
+        raise ValueError(f"지원하지 않는 엑셀 읽기 엔진입니다: {name} (사용 가능: {', '.join(READERS)})")
+    if not reader_class.is_available():
+        raise ValueError(f"'{name}' 엔진에 필요한 패키지가 설치되어 있지 않습니다: {', '.join(reader_class.requires)}")
+    return reader_class()
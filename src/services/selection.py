@@ -0,0 +1,405 @@
+"""
+분할 작업의 행 필터와 출력 열 선택
+
+조건은 "<열 번호><연산자><값>" 형식의 문자열(예: "3==재직", "5>=2024-01-01", "2 in 서울,부산")이나
+Condition으로 지정하고, 여러 개면 모두 만족하는 행만 남긴다(AND). 출력 열을 선택하면 필요한 열
+(출력 열, 기준 열, 조건 열)만 읽고, 그룹을 나누기 전에 조건에 맞지 않는 행과 선택하지 않은 열을 버린다.
+
+값 비교 규칙 (행 묶음 단위 비교와 셀 단위 비교가 같은 결과를 낸다)
+- 숫자/날짜 값은 같은 종류의 셀과만 비교한다 (1과 1.0은 같음, 문자열 셀 "1"은 입력한 글자와 같으면 같음)
+- 문자열 값은 문자열 셀과 비교한다 (대소 비교는 사전 순)
+- TRUE/FALSE 셀은 숫자 1/0으로 비교한다 (pandas는 숫자와 섞인 열의 TRUE를 1로 읽음). 조건 값 TRUE/FALSE도 1/0이다
+- contains는 셀을 글자로 바꿔 찾는다 (TRUE는 "1", 정수인 실수 1.0은 "1")
+- 값을 비우면("3==") 빈 셀을 뜻한다
+- 빈 셀은 "!="를 제외한 모든 조건에서 제외된다
+"""
+
+import datetime
+import math
+import numbers
+import operator
+import re
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+# 지원하는 연산자
+OPERATORS = ("==", "!=", ">", ">=", "<", "<=", "in", "contains")
+
+_ORDERING = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+_CONDITION_PATTERN = re.compile(r"^\s*(\d+)\s*(==|!=|>=|<=|=|>|<|in(?=\s)|contains(?=\s))\s*(.*?)\s*$", re.S)
+_INT_PATTERN = re.compile(r"^[+-]?\d+$")
+_FLOAT_PATTERN = re.compile(r"^[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2})?)?$")
+_BOOLEANS = {"TRUE": 1, "FALSE": 0}
+
+
+def parse_value(text):
+    """
+    조건 값 문자열을 비교할 값으로 변환
+
+    정수/실수와 TRUE/FALSE(1/0)는 숫자, YYYY-MM-DD[ HH:MM[:SS]]는 날짜, 빈 문자열은 빈 셀(None),
+    따옴표로 감싼 값과 나머지는 문자열이 된다.
+    """
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    if not text:
+        return None
+    if _INT_PATTERN.match(text):
+        return int(text)
+    if _FLOAT_PATTERN.match(text):
+        return float(text)
+    if text.upper() in _BOOLEANS:
+        return _BOOLEANS[text.upper()]
+    if _DATE_PATTERN.match(text):
+        return pd.Timestamp(text)
+    return text
+
+
+def parse_condition(text):
+    """
+    "<열 번호><연산자><값>" 형식의 조건 문자열을 Condition으로 변환
+
+    예: "3==재직", "3 != 퇴사", "5>=2024-01-01", "2 in 서울,부산", "4 contains 팀", "6=="(빈 셀)
+
+    Args:
+        text (str): 조건 문자열
+
+    Returns:
+        Condition: 조건
+    """
+    match = _CONDITION_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"조건 형식이 올바르지 않습니다: {text!r} "
+                         f"(예: 3==재직, 5>=2024-01-01, 2 in 서울,부산 / 연산자: {', '.join(OPERATORS)})")
+    column, op, raw = match.groups()
+    if op == "in":
+        items = [item.strip() for item in raw.split(",")]
+        return Condition(int(column), op, [parse_value(item) for item in items], items)
+    if op == "contains":
+        return Condition(int(column), op, raw, raw)
+    return Condition(int(column), op, parse_value(raw), raw.strip().strip("'\""))
+
+
+def _kind(value):
+    """비교할 때의 값 종류 ("empty", "number", "datetime", "text", "other", TRUE/FALSE는 "number")"""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return "empty"
+    if isinstance(value, str):
+        return "text"
+    if isinstance(value, (bool, np.bool_)):
+        return "number"
+    if isinstance(value, numbers.Number):
+        return "empty" if isinstance(value, float) and math.isnan(value) else "number"
+    if isinstance(value, (datetime.date, np.datetime64)):
+        return "datetime"
+    return "other"
+
+
+def _cell_text(cell):
+    """contains 조건에서 찾을 셀 글자 (TRUE/FALSE는 1/0, 정수인 실수는 소수점 없이)"""
+    if isinstance(cell, (bool, np.bool_)) or isinstance(cell, float) and cell.is_integer():
+        return str(int(cell))
+    return str(cell)
+
+
+class Condition:
+    """
+    열 하나에 대한 행 조건
+
+    Attributes:
+        column (int): 열 번호 (1부터 시작)
+        op (str): 연산자 (OPERATORS 중)
+        value: 비교할 값 ("in"이면 값 목록, None이면 빈 셀)
+        text (str): 입력한 값 문자열 ("in"이면 목록). 문자열 셀은 이 글자와 비교한다.
+    """
+
+    def __init__(self, column, op, value, text=None):
+        if op == "=":
+            op = "=="
+        if op not in OPERATORS:
+            raise ValueError(f"지원하지 않는 연산자입니다: {op} (사용 가능: {', '.join(OPERATORS)})")
+        if not isinstance(column, int) or column < 1:
+            raise ValueError(f"조건 열 번호는 1 이상이어야 합니다: {column}")
+        self.column = column
+        self.op = op
+
+        if op == "in":
+            values = list(value)
+            texts = list(text) if text is not None else [None] * len(values)
+            self.value = [self._normalize(item) for item in values]
+            self.text = [self._text(item, item_text) for item, item_text in zip(self.value, texts)]
+        else:
+            self.value = self._normalize(value)
+            self.text = self._text(self.value, text)
+        if op in _ORDERING and _kind(self.value) not in ("number", "datetime", "text"):
+            raise ValueError(f"'{op}' 조건에는 숫자, 날짜 또는 문자열 값이 필요합니다: {self}")
+        if op == "contains" and not self.text:
+            raise ValueError(f"'contains' 조건에는 찾을 문자열이 필요합니다: {self}")
+
+    def __repr__(self):
+        return f"Condition({self})"
+
+    def __str__(self):
+        text = ",".join(self.text) if self.op == "in" else self.text
+        separator = " " if self.op in ("in", "contains") else ""
+        return f"{self.column}{separator}{self.op}{separator}{text}"
+
+    @staticmethod
+    def _normalize(value):
+        if _kind(value) == "empty":
+            return None
+        if isinstance(value, (bool, np.bool_)):
+            return int(value)
+        if isinstance(value, (datetime.date, np.datetime64)):
+            return pd.Timestamp(value)
+        return value
+
+    @staticmethod
+    def _text(value, text):
+        if text is not None:
+            return text
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def _equals(cell, value, text):
+        """셀 하나가 값과 같은지 확인"""
+        kind = _kind(cell)
+        if value is None:
+            return kind == "empty"
+        if kind == "text":
+            return cell == text
+        if kind != _kind(value):
+            return False
+        if kind == "datetime":
+            return pd.Timestamp(cell) == value
+        return cell == value
+
+    def matches(self, cell):
+        """
+        셀 하나가 조건을 만족하는지 확인 (스트리밍 처리용)
+        """
+        op = self.op
+        if op == "==":
+            return self._equals(cell, self.value, self.text)
+        if op == "!=":
+            return not self._equals(cell, self.value, self.text)
+        if op == "in":
+            return any(self._equals(cell, value, text) for value, text in zip(self.value, self.text))
+        kind = _kind(cell)
+        if op == "contains":
+            return kind != "empty" and self.text in (cell if kind == "text" else _cell_text(cell))
+        if kind != _kind(self.value):
+            return False
+        if kind == "datetime":
+            cell = pd.Timestamp(cell)
+        return _ORDERING[op](cell, self.value)
+
+    def mask(self, column):
+        """
+        열 전체에 조건을 적용 (숫자/날짜/문자열 타입 열은 벡터 연산, 그 밖의 열은 셀마다 matches)
+
+        Args:
+            column (pandas.Series): 조건 열
+
+        Returns:
+            numpy.ndarray: 행별 조건 만족 여부 (bool)
+        """
+        dtype = column.dtype
+        op = self.op
+        if op == "!=":
+            return ~Condition(self.column, "==", self.value, self.text).mask(column)
+        if op == "in":
+            result = np.zeros(len(column), dtype=bool)
+            for value, text in zip(self.value, self.text):
+                result |= Condition(self.column, "==", value, text).mask(column)
+            return result
+
+        if pd.api.types.is_numeric_dtype(dtype):
+            kind = "number"
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            kind = "datetime"
+        elif pd.api.types.is_string_dtype(dtype) and dtype != object:
+            kind = "text"
+        else:
+            return self._mask_cells(column)
+
+        if op == "contains":
+            if kind != "text":
+                return self._mask_cells(column)
+            return column.str.contains(self.text, regex=False).to_numpy(dtype=bool, na_value=False)
+        if op == "==" and self.value is None:
+            return column.isna().to_numpy(dtype=bool)
+        if op == "==" and kind == "text":
+            return (column == self.text).to_numpy(dtype=bool, na_value=False)
+        if _kind(self.value) != kind:
+            # 숫자/날짜 열에는 다른 종류의 셀(문자열 등)이 없음
+            return np.zeros(len(column), dtype=bool)
+        if kind == "number":
+            values = column.to_numpy(dtype="float64", na_value=np.nan)
+            compare = operator.eq if op == "==" else _ORDERING[op]
+            return compare(values, self.value)
+        compare = operator.eq if op == "==" else _ORDERING[op]
+        return compare(column, self.value).to_numpy(dtype=bool, na_value=False)
+
+    def _mask_cells(self, column):
+        """셀마다 matches를 적용 (여러 종류의 값이 섞인 object 열 등)"""
+        return np.fromiter(map(self.matches, column.tolist()), dtype=bool, count=len(column))
+
+
+class RowFilter:
+    """
+    행 조건 목록 (모두 만족하는 행만 남김)
+
+    Attributes:
+        conditions (list[Condition]): 조건 목록
+    """
+
+    def __init__(self, conditions=()):
+        """
+        RowFilter 초기화
+
+        Args:
+            conditions (Iterable[Condition | str]): 조건 (문자열이면 parse_condition으로 변환)
+        """
+        self.conditions = [c if isinstance(c, Condition) else parse_condition(c) for c in conditions]
+
+    def __bool__(self):
+        return bool(self.conditions)
+
+    def __len__(self):
+        return len(self.conditions)
+
+    def __str__(self):
+        return " & ".join(str(condition) for condition in self.conditions)
+
+    @property
+    def columns(self):
+        """조건에 쓰인 열 인덱스 (0부터 시작, 중복 제거)"""
+        return sorted({condition.column - 1 for condition in self.conditions})
+
+    def mask(self, df, positions=None):
+        """
+        DataFrame에서 모든 조건을 만족하는 행
+
+        Args:
+            df (pandas.DataFrame): 읽은 데이터
+            positions (dict): 열 인덱스(시트 기준) -> df에서의 위치 (None이면 같음)
+
+        Returns:
+            numpy.ndarray: 행별 조건 만족 여부 (bool)
+        """
+        result = np.ones(len(df), dtype=bool)
+        for condition in self.conditions:
+            position = condition.column - 1 if positions is None else positions[condition.column - 1]
+            result &= condition.mask(df.iloc[:, position])
+        return result
+
+    def matcher(self):
+        """
+        행(시트 열 순서의 튜플) 하나가 모든 조건을 만족하는지 확인하는 함수 (스트리밍 처리용)
+        """
+        checks = [(condition.column - 1, condition.matches) for condition in self.conditions]
+        return lambda row: all(check(row[i]) for i, check in checks)
+
+
+class ColumnSelection:
+    """
+    행 필터와 출력 열 선택을 읽은 데이터에 적용하는 방법
+
+    출력 열을 선택하면 출력 열, 기준 열, 조건 열만 읽는다(usecols). 필터와 선택을 적용한 데이터는
+    출력 열(선택한 순서) 뒤에 출력하지 않는 기준 열을 붙인 형태이며, 앞의 output_width개 열만 저장한다.
+
+    Attributes:
+        row_filter (RowFilter): 행 조건
+        output_columns (list[int]): 저장할 열 인덱스 (0부터 시작, 선택한 순서, None이면 전체)
+        usecols (list[int]): 읽을 열 인덱스 (시트 열 순서, None이면 전체)
+        output_width (int): 필터/선택을 적용한 데이터에서 저장할 앞쪽 열 수 (None이면 전체)
+    """
+
+    def __init__(self, column_num, output_columns=None, row_filter=None):
+        """
+        ColumnSelection 초기화
+
+        Args:
+            column_num (int | list[int]): 기준 열 번호 (1부터 시작)
+            output_columns (list[int]): 저장할 열 번호 (1부터 시작, None이면 전체)
+            row_filter (RowFilter): 행 조건
+        """
+        self.composite = isinstance(column_num, (list, tuple)) and len(column_num) > 1
+        key_columns = [num - 1 for num in (column_num if isinstance(column_num, (list, tuple)) else [column_num])]
+        self.row_filter = row_filter if row_filter is not None else RowFilter()
+        self.key_columns = key_columns
+
+        if output_columns is not None:
+            output_columns = list(output_columns)
+            if not output_columns:
+                raise ValueError("출력 열 번호를 하나 이상 지정해야 합니다.")
+            if len(set(output_columns)) != len(output_columns):
+                raise ValueError(f"출력 열 번호가 중복되었습니다: {output_columns}")
+            invalid = [num for num in output_columns + [k + 1 for k in key_columns] if num < 1]
+            if invalid:
+                raise ValueError(f"열 번호는 1 이상이어야 합니다: {invalid}")
+            output_columns = [num - 1 for num in output_columns]
+        self.output_columns = output_columns
+
+        if output_columns is None:
+            self.usecols = None
+            self.output_width = None
+            self._take = None
+            self._positions = None
+            self._key_positions = key_columns
+            return
+
+        extra_keys = [key for key in key_columns if key not in output_columns]
+        columns = output_columns + extra_keys
+        self.usecols = sorted(set(columns) | set(self.row_filter.columns))
+        self._positions = {column: i for i, column in enumerate(self.usecols)}
+        self._take = [self._positions[column] for column in columns]
+        self._key_positions = [columns.index(key) for key in key_columns]
+        self.output_width = len(output_columns) if extra_keys else None
+
+    @property
+    def key_index(self):
+        """필터/선택을 적용한 데이터에서의 기준 열 위치 (열 조합 기준이면 목록)"""
+        return self._key_positions if self.composite else self._key_positions[0]
+
+    def apply(self, df):
+        """
+        읽은 데이터(usecols로 읽은 열)에 행 조건과 열 선택 적용
+
+        Args:
+            df (pandas.DataFrame): 읽은 데이터
+
+        Returns:
+            pandas.DataFrame: 조건을 만족하는 행, 출력 열 + 출력하지 않는 기준 열
+        """
+        if self.usecols is None:
+            for column in self.row_filter.columns:
+                if column >= len(df.columns):
+                    raise ValueError(f"요청된 열 번호 {column + 1}이 유효하지 않습니다. "
+                                     f"열 범위는 1-{len(df.columns)} 입니다.")
+        if self.row_filter:
+            rows = self.row_filter.mask(df, self._positions)
+            if self._take is None:
+                return df if rows.all() else df.iloc[rows]
+            return df.iloc[rows, self._take]
+        return df if self._take is None else df.iloc[:, self._take]
+
+    def row_projection(self, header):
+        """
+        시트 열 순서의 행 -> 저장할 열 튜플 변환 함수와 출력 헤더 (스트리밍 처리용)
+
+        Returns:
+            tuple: (변환 함수 (선택하지 않았으면 None), 출력 헤더)
+        """
+        if self.output_columns is None:
+            return None, header
+        header = [header[i] for i in self.output_columns]
+        if len(self.output_columns) == 1:
+            column = self.output_columns[0]
+            return (lambda row: (row[column],)), header
+        return itemgetter(*self.output_columns), header
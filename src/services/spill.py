@@ -0,0 +1,340 @@
+"""
+청크 단위 분할용 그룹별 출력 작성기
+
+스트리밍(청크) 모드에서 그룹마다 작성기를 하나씩 두고 행을 append()로 모은다.
+flush()하면 버퍼의 행을 로컬 디스크의 임시(spill) 파일에 이어 쓰고, close()에서 최종
+출력 파일로 만든다. 파일 핸들은 flush할 때만 열므로 그룹이 많아도 열린 파일이 쌓이지 않는다.
+
+모든 작성기는 같은 메서드를 가진다:
+    append(row), pending_rows, flush(), close(), discard(), output_path, bytes_written
+"""
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .columnar_writer import to_arrow_table
+from .excel_writers import MAX_ROWS, XlsxWorkbookWriter
+from .parallel_writer import CSV_CHUNK_ROWS
+
+
+def estimate_row_bytes(rows, sample=1000):
+    """
+    행 하나가 메모리에서 차지하는 크기 추정 (앞쪽 sample개 행의 평균)
+
+    Args:
+        rows (list[tuple]): 행 목록
+        sample (int): 추정에 사용할 행 수
+
+    Returns:
+        int: 행 하나의 추정 크기 (bytes)
+    """
+    rows = rows[:sample]
+    if not rows:
+        return 1
+    total = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in rows)
+    return max(1, total // len(rows))
+
+
+class XlsxSpillWriter:
+    """
+    그룹 하나를 xlsx로 저장하는 작성기 (XlsxWorkbookWriter의 시트 임시 파일에 spill)
+    """
+
+    def __init__(self, output_path, header, auto_flush=True):
+        """
+        Args:
+            output_path (str): 저장할 xlsx 파일 경로
+            header (Sequence): 헤더 행
+            auto_flush (bool): False이면 flush() 호출 전까지 행을 버퍼에 모음
+        """
+        self._workbook = XlsxWorkbookWriter(output_path, flush_rows=1000 if auto_flush else MAX_ROWS)
+        self._sheet = self._workbook.add_sheet(header=header)
+
+    @property
+    def output_path(self):
+        return self._workbook.output_path
+
+    @property
+    def bytes_written(self):
+        return self._workbook.bytes_written
+
+    @property
+    def pending_rows(self):
+        """아직 디스크에 쓰지 않은 행 수"""
+        return self._sheet.pending_rows
+
+    def append(self, row):
+        self._sheet.append(row)
+
+    def flush(self):
+        self._workbook.flush()
+
+    def close(self):
+        self._workbook.close()
+
+    def discard(self):
+        self._workbook.discard()
+
+
+class CsvSpillWriter:
+    """
+    그룹 하나를 CSV로 저장하는 작성기
+
+    flush()마다 버퍼의 행을 출력 폴더의 임시 파일(<출력 파일>.spill)에 pickle로 이어 쓰고,
+    close()에서 CSV_CHUNK_ROWS행씩 읽어 save_frame과 같이 DataFrame.to_csv(BOM 포함 UTF-8)로 저장한다.
+    열 타입은 flush한 행 묶음들의 타입을 합쳐 그룹 전체 기준으로 정하므로(정수 열에 결측/실수가 있으면 실수 등)
+    메모리에서 분할해 저장한 파일과 같은 내용이 된다.
+    """
+
+    def __init__(self, output_path, header):
+        """
+        Args:
+            output_path (str): 저장할 CSV 파일 경로
+            header (Sequence): 헤더 행
+        """
+        self.output_path = output_path
+        self.bytes_written = 0
+        self._header = list(header)
+        self._spill_path = f"{output_path}.spill"
+        self._pending = []
+        # 열마다 지금까지 flush한 값의 dtype (값이 모두 결측이면 None)과 결측 값 여부
+        self._dtypes = [None] * len(self._header)
+        self._has_null = [False] * len(self._header)
+        open(self._spill_path, "wb").close()
+
+    @property
+    def pending_rows(self):
+        return len(self._pending)
+
+    def append(self, row):
+        self._pending.append(row)
+
+    def flush(self):
+        if not self._pending:
+            return
+        df = pd.DataFrame(self._pending, columns=range(len(self._header)))
+        for i, column in df.items():
+            nulls = column.isna()
+            if nulls.any():
+                self._has_null[i] = True
+            if not nulls.all():
+                self._dtypes[i] = _common_dtype(self._dtypes[i], column.dtype)
+        with open(self._spill_path, "ab") as f:
+            pickle.dump(self._pending, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pending = []
+
+    def close(self):
+        if self._spill_path is None:
+            return
+        try:
+            self.flush()
+            dtypes = self._column_dtypes()
+            part_path = f"{self.output_path}.part"
+            first = True
+            for rows in self._read_chunks():
+                df = pd.DataFrame(rows, columns=range(len(self._header)), dtype=object)
+                for i, dtype in dtypes.items():
+                    df[i] = df[i].astype(dtype)
+                df.columns = self._header
+                # 엑셀에서 바로 열 수 있도록 BOM은 첫 조각에만
+                df.to_csv(part_path, mode="w" if first else "a", header=first, index=False,
+                          encoding="utf-8-sig" if first else "utf-8")
+                first = False
+            os.replace(part_path, self.output_path)
+            self.bytes_written = os.path.getsize(self.output_path)
+        finally:
+            self.discard()
+
+    def discard(self):
+        if self._spill_path is not None:
+            for path in (self._spill_path, f"{self.output_path}.part"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self._spill_path = None
+
+    def _column_dtypes(self):
+        """
+        열 위치 -> 변환할 dtype (object로 둘 열은 제외)
+
+        그룹 전체를 DataFrame으로 만들었을 때처럼, 결측 값이 있는 정수 열은 실수로,
+        결측 값이 있는 TRUE/FALSE 열과 값이 모두 결측인 열은 object로 둔다.
+        """
+        dtypes = {}
+        for i, (dtype, has_null) in enumerate(zip(self._dtypes, self._has_null)):
+            if dtype is None or dtype.kind == "O" or dtype.kind == "b" and has_null:
+                continue
+            dtypes[i] = np.dtype("float64") if dtype.kind in "iu" and has_null else dtype
+        return dtypes
+
+    def _read_chunks(self):
+        """
+        spill 파일의 행을 CSV_CHUNK_ROWS행씩 반환 (save_frame과 같은 단위로 나누어 날짜 형식도 같게 정해짐)
+        """
+        chunk = []
+        chunks = 0
+        with open(self._spill_path, "rb") as f:
+            while True:
+                try:
+                    chunk.extend(pickle.load(f))
+                except EOFError:
+                    break
+                while len(chunk) >= CSV_CHUNK_ROWS:
+                    yield chunk[:CSV_CHUNK_ROWS]
+                    chunk = chunk[CSV_CHUNK_ROWS:]
+                    chunks += 1
+        # 행이 없어도 헤더는 저장
+        if chunk or not chunks:
+            yield chunk
+
+
+def _common_dtype(a, b):
+    """두 행 묶음에서 추론한 열 dtype을 합친 dtype (정수와 실수는 실수, 그 밖에 다르면 object)"""
+    if a is None or a == b:
+        return b
+    if a.kind in "iuf" and b.kind in "iuf":
+        return np.dtype("float64")
+    return np.dtype(object)
+
+
+class ArrowSpillWriter:
+    """
+    그룹 하나를 Parquet/Feather로 저장하는 작성기
+
+    flush()마다 버퍼의 행을 Arrow 레코드 배치로 바꾸어 임시 Arrow IPC 스트림 파일에 이어 쓰고,
+    close()에서 배치 단위로 읽어 최종 파일에 옮겨 쓰므로 그룹 전체를 메모리에 올리지 않는다.
+    배치마다 타입이 다를 수 있으므로(예: 정수 열에 나중에 문자열) 배치는 자기 스키마로 이어 쓰고,
+    열 타입을 합친 최종 스키마로 close()에서 배치마다 변환한다 (이미 쓴 spill 내용은 다시 쓰지 않음).
+    """
+
+    def __init__(self, output_path, header, output_format, drop_columns=()):
+        """
+        Args:
+            output_path (str): 저장할 파일 경로
+            header (Sequence): 헤더 행
+            output_format (str): "parquet" 또는 "feather"
+            drop_columns (Iterable[int]): 저장하지 않을 열 인덱스 (hive 폴더 이름으로 표현한 기준 열)
+        """
+        import pyarrow
+
+        self._pa = pyarrow
+        self.output_path = output_path
+        self.output_format = output_format
+        self.bytes_written = 0
+        drop_columns = set(drop_columns)
+        self._keep = [i for i in range(len(header)) if i not in drop_columns]
+        self._columns = [header[i] for i in self._keep]
+        self._temp_dir = tempfile.mkdtemp(prefix="excel-parser-")
+        self._spill_path = os.path.join(self._temp_dir, "spill.arrows")
+        # 첫 배치의 스키마 (pandas 메타데이터용)와 열마다 합친 타입, 결측 값 여부
+        self._schema = None
+        self._types = None
+        self._has_null = None
+        self._pending = []
+
+    @property
+    def pending_rows(self):
+        return len(self._pending)
+
+    def append(self, row):
+        self._pending.append(row)
+
+    def flush(self):
+        if not self._pending:
+            return
+        keep = self._keep
+        df = pd.DataFrame([[row[i] for i in keep] for row in self._pending], columns=self._columns)
+        self._pending = []
+        table = to_arrow_table(df)
+
+        if self._schema is None:
+            self._schema = table.schema
+            self._types = list(table.schema.types)
+            self._has_null = [False] * len(self._types)
+        for i, column in enumerate(table.columns):
+            self._types[i] = self._merge_type(self._types[i], column.type)
+            self._has_null[i] = self._has_null[i] or column.null_count > 0
+        with self._pa.OSFile(self._spill_path, "ab") as sink:
+            with self._pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def close(self):
+        if self._temp_dir is None:
+            return
+        try:
+            self.flush()
+            schema = self._output_schema()
+            batches = (self._conform(batch, schema) for batch in self._read_spill())
+            if self.output_format == "parquet":
+                import pyarrow.parquet as parquet
+                with parquet.ParquetWriter(self.output_path, schema) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+            else:
+                options = self._pa.ipc.IpcWriteOptions(compression="lz4")
+                with self._pa.ipc.new_file(self.output_path, schema, options=options) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+            self.bytes_written = os.path.getsize(self.output_path)
+        finally:
+            self.discard()
+
+    def discard(self):
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def _merge_type(self, a, b):
+        """두 배치의 열 타입을 합친 타입 (정수와 실수는 실수, 그 밖에 다르면 문자열)"""
+        pa = self._pa
+        if a == b or pa.types.is_null(b):
+            return a
+        if pa.types.is_null(a):
+            return b
+        if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in (a, b)):
+            return pa.float64()
+        return pa.string()
+
+    def _output_schema(self):
+        """
+        최종 파일 스키마 (메모리에서 분할할 때처럼 결측 값이 있는 정수 열은 실수)
+        """
+        pa = self._pa
+        fields = []
+        for field, type_, has_null in zip(self._schema, self._types, self._has_null):
+            if pa.types.is_integer(type_) and has_null:
+                type_ = pa.float64()
+            fields.append(field.with_type(type_))
+        return pa.schema(fields, metadata=self._schema.metadata)
+
+    def _conform(self, batch, schema):
+        """배치를 최종 스키마로 변환 (문자열로 넓힌 열은 to_arrow_table처럼 str()로 변환)"""
+        pa = self._pa
+        if batch.schema.equals(schema):
+            return batch
+        columns = []
+        for column, field in zip(batch.columns, schema):
+            if column.type != field.type:
+                if pa.types.is_string(field.type) and not pa.types.is_null(column.type):
+                    column = pa.array([None if v is None else str(v) for v in column.to_pylist()], pa.string())
+                else:
+                    column = column.cast(field.type)
+            columns.append(column)
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    def _read_spill(self):
+        """
+        spill 파일의 레코드 배치 (flush마다 스트림이 하나씩 이어 붙어 있음)
+        """
+        with self._pa.memory_map(self._spill_path) as source:
+            while source.tell() < source.size():
+                reader = self._pa.ipc.open_stream(source)
+                for batch in reader:
+                    yield batch
@@ -8,40 +8,130 @@ PyQt5를 사용하여 사용자 인터페이스를 제공합니다.
 import sys
 import os
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QFileDialog, 
-                           QLabel, QVBoxLayout, QHBoxLayout, QWidget, QTableWidget, 
-                           QTableWidgetItem, QMessageBox, QProgressBar)
+                           QLabel, QVBoxLayout, QHBoxLayout, QWidget, QTableView, 
+                           QMessageBox, QProgressBar, QSpinBox, QCheckBox, QLineEdit)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 
 # 상위 디렉토리의 모듈을 import 하기 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Excel 파싱 서비스 가져오기 (구현이 필요함)
-from services.excel_parse_service import ExcelParseService
+# pandas 등을 불러오는 ExcelParseService는 창이 빨리 뜨도록 첫 작업을 실행할 때 import
+from services.errors import JobCancelledError
+from services.progress import CancellationToken
+from ui.table_model import DataFrameTableModel
 
 
 class WorkerThread(QThread):
     """
     백그라운드에서 엑셀 파싱을 수행하는 작업 스레드
     """
-    progress_signal = pyqtSignal(int)
+    progress_signal = pyqtSignal(object)
     finished_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
+    cancelled_signal = pyqtSignal()
     
-    def __init__(self, file_path):
+    def __init__(self, file_path, column_num, groups=None, profile=None, filters=None, columns=None):
         super().__init__()
         self.file_path = file_path
-        self.excel_service = ExcelParseService()
+        self.column_num = column_num
+        self.groups = groups
+        self.profile = profile
+        # 행 조건 문자열 목록과 출력 열 번호 (조건 해석은 작업 스레드에서)
+        self.filters = filters
+        self.columns = columns
+        self.cancel_token = CancellationToken()
         
     def run(self):
         try:
+            from services.excel_parse_service import ExcelParseService
+            # 입력 파일 위치에 output 폴더 생성
+            excel_service = ExcelParseService(
+                output_folder=os.path.join(os.path.dirname(self.file_path), "output"))
             # 엑셀 파일 파싱 작업 수행
-            result = self.excel_service.parse_excel(self.file_path, progress_callback=self.update_progress)
+            result = excel_service.parse_excel(
+                self.file_path, self.column_num,
+                progress_callback=self.update_progress, cancel_token=self.cancel_token, groups=self.groups,
+                profile=self.profile, filters=self.filters, columns=self.columns)
             self.finished_signal.emit(result)
+        except JobCancelledError:
+            self.cancelled_signal.emit()
         except Exception as e:
             self.error_signal.emit(str(e))
     
-    def update_progress(self, value):
-        self.progress_signal.emit(value)
+    def update_progress(self, event):
+        self.progress_signal.emit(event)
+    
+    def cancel(self):
+        """작업 취소 요청 (현재 처리 중인 단계가 끝나면 중단됨)"""
+        self.cancel_token.cancel()
+
+
+class PreviewThread(QThread):
+    """
+    기준 열만 읽어 그룹 구성을 확인하는 작업 스레드
+    """
+    finished_signal = pyqtSignal(object)
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, file_path, column_num):
+        super().__init__()
+        self.file_path = file_path
+        self.column_num = column_num
+        
+    def run(self):
+        try:
+            from services.excel_parse_service import ExcelParseService
+            excel_service = ExcelParseService(input_folder=os.path.dirname(self.file_path))
+            groups = excel_service.preview_groups(os.path.basename(self.file_path), self.column_num)
+            self.finished_signal.emit(groups)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+
+class AggregateThread(QThread):
+    """
+    그룹별 요약 통계를 계산하는 작업 스레드 (그룹별 파일은 만들지 않음)
+    """
+    progress_signal = pyqtSignal(object)
+    finished_signal = pyqtSignal(object)
+    error_signal = pyqtSignal(str)
+    cancelled_signal = pyqtSignal()
+    
+    def __init__(self, file_path, column_num, value_columns=None):
+        super().__init__()
+        self.file_path = file_path
+        self.column_num = column_num
+        self.value_columns = value_columns
+        self.cancel_token = CancellationToken()
+        
+    def run(self):
+        try:
+            from services.excel_parse_service import ExcelParseService
+            excel_service = ExcelParseService(
+                input_folder=os.path.dirname(self.file_path),
+                output_folder=os.path.join(os.path.dirname(self.file_path), "output"))
+            result = excel_service.aggregate(
+                os.path.basename(self.file_path), self.column_num, value_columns=self.value_columns,
+                aggregations=("count", "sum", "mean", "min", "max"),
+                progress_callback=self.progress_signal.emit, cancel_token=self.cancel_token)
+            self.finished_signal.emit(result)
+        except JobCancelledError:
+            self.cancelled_signal.emit()
+        except Exception as e:
+            self.error_signal.emit(str(e))
+    
+    def cancel(self):
+        """작업 취소 요청"""
+        self.cancel_token.cancel()
+
+
+def format_number(value):
+    """요약표 숫자 표시 (정수는 천 단위 구분, 소수는 둘째 자리까지, 빈 값은 빈 칸)"""
+    if value is None or value != value:
+        return ''
+    if float(value).is_integer():
+        return f'{value:,.0f}'
+    return f'{value:,.2f}'
 
 
 class ExcelParserUI(QMainWindow):
@@ -71,29 +161,73 @@ class ExcelParserUI(QMainWindow):
         file_layout.addWidget(self.browse_button)
         main_layout.addLayout(file_layout)
         
+        # 기준 열 번호 입력
+        column_layout = QHBoxLayout()
+        column_layout.addWidget(QLabel("기준 열 번호"))
+        self.column_spin = QSpinBox()
+        self.column_spin.setRange(1, 16384)
+        column_layout.addWidget(self.column_spin)
+        # 그룹 요약에서 집계할 값 열 번호 (공백/쉼표로 구분, 비우면 숫자 열 전체)
+        column_layout.addWidget(QLabel("값 열 번호"))
+        self.value_columns_edit = QLineEdit()
+        self.value_columns_edit.setPlaceholderText("예: 3 4 (비우면 숫자 열 전체)")
+        column_layout.addWidget(self.value_columns_edit)
+        column_layout.addStretch()
+        # 느린 파일 진단용: 출력 폴더에 프로파일 결과(.prof, 요약 .txt) 저장
+        self.profile_check = QCheckBox("프로파일링")
+        column_layout.addWidget(self.profile_check)
+        main_layout.addLayout(column_layout)
+        
+        # 파일 분할 행 조건 (";"로 구분, 모두 만족하는 행만)과 출력 열 번호 (비우면 전체 열)
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("행 조건"))
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("예: 3>=100; 2 in 서울,부산 (비우면 전체 행)")
+        filter_layout.addWidget(self.filter_edit)
+        filter_layout.addWidget(QLabel("출력 열 번호"))
+        self.output_columns_edit = QLineEdit()
+        self.output_columns_edit.setPlaceholderText("예: 1 3 5 (비우면 전체 열)")
+        filter_layout.addWidget(self.output_columns_edit)
+        main_layout.addLayout(filter_layout)
+        
         # 진행 상황 표시
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
         
-        # 결과 테이블
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(3)
-        self.result_table.setHorizontalHeaderLabels(['헤더', '데이터 타입', '설명'])
+        # 결과 테이블 (보이는 셀만 DataFrame에서 읽는 모델)
+        self.result_model = DataFrameTableModel()
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         self.result_table.horizontalHeader().setStretchLastSection(True)
         main_layout.addWidget(self.result_table)
         
         # 실행 및 저장 버튼
         button_layout = QHBoxLayout()
-        self.parse_button = QPushButton("헤더 파싱")
+        self.preview_button = QPushButton("그룹 미리보기")
+        self.preview_button.setEnabled(False)
+        self.preview_button.clicked.connect(self.preview_groups)
+        
+        self.aggregate_button = QPushButton("그룹 요약")
+        self.aggregate_button.setEnabled(False)
+        self.aggregate_button.clicked.connect(self.aggregate_groups)
+        
+        self.parse_button = QPushButton("파일 분할")
         self.parse_button.setEnabled(False)
         self.parse_button.clicked.connect(self.parse_excel)
         
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_parsing)
+        
         self.save_button = QPushButton("결과 저장")
         self.save_button.setEnabled(False)
         self.save_button.clicked.connect(self.save_results)
         
+        button_layout.addWidget(self.preview_button)
+        button_layout.addWidget(self.aggregate_button)
         button_layout.addWidget(self.parse_button)
+        button_layout.addWidget(self.cancel_button)
         button_layout.addWidget(self.save_button)
         main_layout.addLayout(button_layout)
         
@@ -104,6 +238,10 @@ class ExcelParserUI(QMainWindow):
         self.selected_file = None
         self.parse_results = None
         self.worker_thread = None
+        self.preview_thread = None
+        self.aggregate_thread = None
+        # (파일 경로, 열 번호, GroupIndex) - 미리보기 결과를 분할에 재사용
+        self.group_preview = None
     
     def browse_file(self):
         """파일 탐색기 열기"""
@@ -115,31 +253,152 @@ class ExcelParserUI(QMainWindow):
             self.selected_file = file_path
             self.file_label.setText(f"선택된 파일: {os.path.basename(file_path)}")
             self.parse_button.setEnabled(True)
+            self.preview_button.setEnabled(True)
+            self.aggregate_button.setEnabled(True)
             self.statusBar().showMessage(f"파일이 선택됨: {file_path}")
     
+    def preview_groups(self):
+        """기준 열의 그룹 구성 미리보기"""
+        if not self.selected_file:
+            QMessageBox.warning(self, '경고', '파일을 먼저 선택하세요.')
+            return
+        
+        self.preview_button.setEnabled(False)
+        self.statusBar().showMessage('그룹 확인 중...')
+        
+        self.preview_thread = PreviewThread(self.selected_file, self.column_spin.value())
+        self.preview_thread.finished_signal.connect(self.preview_finished)
+        self.preview_thread.error_signal.connect(self.preview_error)
+        self.preview_thread.start()
+    
+    def preview_finished(self, groups):
+        """그룹 미리보기 완료 처리"""
+        self.group_preview = (self.preview_thread.file_path, self.preview_thread.column_num, groups)
+        self.display_groups(groups)
+        self.preview_button.setEnabled(True)
+        self.statusBar().showMessage(f'그룹 {len(groups):,}개, {groups.row_count:,}행')
+    
+    def preview_error(self, error_message):
+        """그룹 미리보기 오류 처리"""
+        QMessageBox.critical(self, '오류', f'그룹 확인 중 오류가 발생했습니다: {error_message}')
+        self.preview_button.setEnabled(True)
+        self.statusBar().showMessage('그룹 확인 오류')
+    
+    def aggregate_groups(self):
+        """그룹별 행 수와 값 열 집계 계산 (요약표 파일 하나만 저장)"""
+        if not self.selected_file:
+            QMessageBox.warning(self, '경고', '파일을 먼저 선택하세요.')
+            return
+        
+        text = self.value_columns_edit.text().replace(',', ' ').split()
+        try:
+            value_columns = [int(number) for number in text] or None
+        except ValueError:
+            QMessageBox.warning(self, '경고', '값 열 번호는 숫자로 입력하세요. (예: 3 4)')
+            return
+        
+        self.aggregate_button.setEnabled(False)
+        self.parse_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.statusBar().showMessage('그룹 요약 중...')
+        
+        self.aggregate_thread = AggregateThread(self.selected_file, self.column_spin.value(), value_columns)
+        self.aggregate_thread.progress_signal.connect(self.update_progress)
+        self.aggregate_thread.finished_signal.connect(self.aggregate_finished)
+        self.aggregate_thread.error_signal.connect(self.aggregate_error)
+        self.aggregate_thread.cancelled_signal.connect(self.aggregate_cancelled)
+        self.aggregate_thread.start()
+    
+    def aggregate_finished(self, result):
+        """그룹 요약 완료 처리"""
+        summary = result.summary
+        # 기준 열과 출력 파일 열을 제외한 숫자 열 (행 수, 집계 열)
+        first = list(summary.columns).index('행 수')
+        last = len(summary.columns) - 1 if summary.columns[-1] == '출력 파일' else len(summary.columns)
+        self.result_model.set_frame(summary, formatters={i: format_number for i in range(first, last)})
+        self.finish_aggregate(f'그룹 {len(summary):,}개 요약 저장: {result.output_file}')
+        if result.invalid_values:
+            skipped = ', '.join(f'{column} {count:,}개' for column, count in result.invalid_values.items())
+            QMessageBox.information(self, '알림', f'숫자가 아닌 값은 집계에서 제외했습니다: {skipped}')
+    
+    def aggregate_error(self, error_message):
+        """그룹 요약 오류 처리"""
+        QMessageBox.critical(self, '오류', f'그룹 요약 중 오류가 발생했습니다: {error_message}')
+        self.finish_aggregate('그룹 요약 오류')
+    
+    def aggregate_cancelled(self):
+        """그룹 요약 취소 완료 처리"""
+        self.finish_aggregate('그룹 요약 취소됨')
+    
+    def finish_aggregate(self, message):
+        """그룹 요약이 끝난 뒤 UI 상태 복원"""
+        self.aggregate_button.setEnabled(True)
+        self.parse_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        self.statusBar().showMessage(message)
+    
     def parse_excel(self):
         """엑셀 파일 파싱 시작"""
         if not self.selected_file:
             QMessageBox.warning(self, '경고', '파일을 먼저 선택하세요.')
             return
+        
+        filters = [text.strip() for text in self.filter_edit.text().split(';') if text.strip()] or None
+        text = self.output_columns_edit.text().replace(',', ' ').split()
+        try:
+            columns = [int(number) for number in text] or None
+        except ValueError:
+            QMessageBox.warning(self, '경고', '출력 열 번호는 숫자로 입력하세요. (예: 1 3 5)')
+            return
             
         # UI 상태 업데이트
         self.parse_button.setEnabled(False)
         self.browse_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.statusBar().showMessage('파싱 중...')
         
+        # 같은 파일/열의 미리보기 결과가 있으면 그룹 계산 재사용
+        groups = None
+        if self.group_preview is not None:
+            preview_file, preview_column, preview_groups = self.group_preview
+            if preview_file == self.selected_file and preview_column == self.column_spin.value():
+                groups = preview_groups
+        
         # 워커 스레드 시작
-        self.worker_thread = WorkerThread(self.selected_file)
+        profile = "cprofile" if self.profile_check.isChecked() else None
+        self.worker_thread = WorkerThread(self.selected_file, self.column_spin.value(), groups, profile,
+                                          filters, columns)
         self.worker_thread.progress_signal.connect(self.update_progress)
         self.worker_thread.finished_signal.connect(self.parsing_finished)
         self.worker_thread.error_signal.connect(self.parsing_error)
+        self.worker_thread.cancelled_signal.connect(self.parsing_cancelled)
         self.worker_thread.start()
     
-    def update_progress(self, value):
+    def cancel_parsing(self):
+        """진행 중인 파싱/그룹 요약 작업 취소"""
+        for thread in (self.worker_thread, self.aggregate_thread):
+            if thread is not None and thread.isRunning():
+                thread.cancel()
+                self.cancel_button.setEnabled(False)
+                self.statusBar().showMessage('취소 중...')
+    
+    def update_progress(self, event):
         """진행 상황 업데이트"""
-        self.progress_bar.setValue(value)
+        self.progress_bar.setValue(event.percent)
+        message = f'{event.rows_read:,}행 읽음 · 그룹 {event.groups_discovered:,}개 · '
+        if event.total_parts:
+            # 묶음 출력: 시트/ZIP 항목 단위로 진행 상황 표시
+            message += f'그룹 {event.parts_written:,}/{event.total_parts:,}개 저장'
+        else:
+            message += f'파일 {event.files_written:,}/{event.total_files:,}개 저장'
+        if event.eta is not None:
+            message += f' · 남은 시간 약 {event.eta:.0f}초'
+        self.statusBar().showMessage(message)
     
     def parsing_finished(self, results):
         """파싱 작업 완료 처리"""
@@ -149,6 +408,7 @@ class ExcelParserUI(QMainWindow):
         # UI 상태 업데이트
         self.browse_button.setEnabled(True)
         self.parse_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         self.save_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.statusBar().showMessage('파싱 완료')
@@ -160,23 +420,35 @@ class ExcelParserUI(QMainWindow):
         # UI 상태 업데이트
         self.browse_button.setEnabled(True)
         self.parse_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.statusBar().showMessage('파싱 오류')
     
+    def parsing_cancelled(self):
+        """파싱 작업 취소 완료 처리"""
+        self.browse_button.setEnabled(True)
+        self.parse_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        self.statusBar().showMessage('파싱 취소됨')
+    
     def display_results(self):
         """결과를 테이블에 표시"""
         if not self.parse_results:
             return
             
-        # 테이블 초기화
-        self.result_table.setRowCount(0)
-        
-        # 결과 데이터 추가
-        for i, (header, info) in enumerate(self.parse_results.items()):
-            self.result_table.insertRow(i)
-            self.result_table.setItem(i, 0, QTableWidgetItem(header))
-            self.result_table.setItem(i, 1, QTableWidgetItem(info.get('data_type', '')))
-            self.result_table.setItem(i, 2, QTableWidgetItem(info.get('description', '')))
+        import pandas as pd
+        
+        self.result_model.set_frame(pd.DataFrame({
+            '출력 파일': list(self.parse_results.keys()),
+            '경로': list(self.parse_results.values()),
+        }))
+    
+    def display_groups(self, groups):
+        """그룹별 행 수를 테이블에 표시"""
+        summary = groups.summary()
+        # 마지막 열이 행 수
+        self.result_model.set_frame(summary, formatters={len(summary.columns) - 1: lambda count: f'{count:,}'})
     
     def save_results(self):
         """결과를 파일로 저장"""
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+DataFrame 표시용 테이블 모델
+
+셀마다 QTableWidgetItem을 만들지 않고, 화면에 보이는 셀의 값만 DataFrame에서 그때그때 읽는다.
+행은 FETCH_ROWS개씩 나누어 뷰에 알리므로(canFetchMore/fetchMore) 백만 행 데이터나
+수만 개 그룹 요약도 바로 열리고 메모리 사용량이 늘지 않는다.
+"""
+
+import math
+import numbers
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    DataFrame을 그대로 참조하는 읽기 전용 테이블 모델 (QTableView용)
+    """
+
+    # 스크롤이 끝에 닿을 때마다 뷰에 추가로 알릴 행 수
+    FETCH_ROWS = 1000
+
+    def __init__(self, df=None, formatters=None, parent=None):
+        """
+        DataFrameTableModel 초기화
+
+        Args:
+            df (pandas.DataFrame): 표시할 데이터 (복사하지 않고 참조)
+            formatters (dict): 열 인덱스 -> 값을 표시 문자열로 바꾸는 함수
+            parent (QObject): 부모 객체
+        """
+        super().__init__(parent)
+        self._df = None
+        self._formatters = {}
+        self._loaded = 0
+        if df is not None:
+            self.set_frame(df, formatters)
+
+    def set_frame(self, df, formatters=None):
+        """
+        표시할 데이터 교체
+
+        Args:
+            df (pandas.DataFrame): 표시할 데이터
+            formatters (dict): 열 인덱스 -> 값을 표시 문자열로 바꾸는 함수
+        """
+        self.beginResetModel()
+        self._df = df
+        self._formatters = formatters or {}
+        self._loaded = min(len(df), self.FETCH_ROWS) if df is not None else 0
+        self.endResetModel()
+
+    @property
+    def frame(self):
+        """표시 중인 DataFrame"""
+        return self._df
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self._df is None:
+            return 0
+        return len(self._df.columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._df is None:
+            return False
+        return self._loaded < len(self._df)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._df is None:
+            return
+        count = min(self.FETCH_ROWS, len(self._df) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self._df is None:
+            return None
+        if role == Qt.DisplayRole:
+            value = self._df.iat[index.row(), index.column()]
+            formatter = self._formatters.get(index.column())
+            if formatter is not None:
+                return formatter(value)
+            return self._display(value)
+        if role == Qt.TextAlignmentRole:
+            value = self._df.iat[index.row(), index.column()]
+            if isinstance(value, numbers.Number) and not isinstance(value, bool):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or self._df is None:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+    @staticmethod
+    def _display(value):
+        """셀 값을 표시 문자열로 변환 (결측 값은 빈 칸)"""
+        if value is None:
+            return ""
+        if isinstance(value, float) and math.isnan(value):
+            return ""
+        try:
+            # pandas.NA, NaT 등
+            if value != value:
+                return ""
+        except (TypeError, ValueError):
+            pass
+        return str(value)
@@ -0,0 +1,10 @@
+"""
+테스트 공통 설정 (저장소 루트와 src를 import 경로에 추가)
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,167 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import cli
+from services.aggregator import GroupAggregator, check_aggregations, is_numeric_column
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+
+KEYS = ["B", "A", None, "B", "A", "B"]
+AMOUNTS = [1.0, 2.0, 3.0, "x", 5.0, 6.0]
+
+
+def frame():
+    return pd.DataFrame({"dept": KEYS, "amount": AMOUNTS, "count": [1, 2, 3, 4, 5, 6]})
+
+
+def aggregate(df, batch_rows, aggregations=("count", "sum", "mean", "min", "max")):
+    aggregator = GroupAggregator(["dept"], ["amount", "count"], aggregations)
+    for start in range(0, len(df), batch_rows):
+        batch = df.iloc[start:start + batch_rows]
+        aggregator.update(batch[["dept"]], batch[["amount", "count"]])
+    return aggregator
+
+
+def test_group_summary():
+    aggregator = aggregate(frame(), len(KEYS))
+    summary = aggregator.result()
+
+    # 그룹은 처음 등장한 순서, 빈 값은 NA, 숫자가 아닌 값은 제외
+    assert summary["dept"].tolist() == ["B", "A", "NA"]
+    assert summary["행 수"].tolist() == [3, 2, 1]
+    assert summary["amount 개수"].tolist() == [2, 2, 1]
+    assert summary["amount 합계"].tolist() == [7.0, 7.0, 3.0]
+    assert summary["amount 평균"].tolist() == [3.5, 3.5, 3.0]
+    assert summary["count 최댓값"].tolist() == [6, 5, 3]
+    assert aggregator.invalid_values == {"amount": 1, "count": 0}
+
+
+@pytest.mark.parametrize("batch_rows", [1, 2, 4])
+def test_batches_give_same_result(batch_rows):
+    expected = aggregate(frame(), len(KEYS)).result()
+
+    pd.testing.assert_frame_equal(aggregate(frame(), batch_rows).result(), expected)
+
+
+def test_mean_of_empty_group_is_nan():
+    aggregator = GroupAggregator(["dept"], ["amount"], ["mean", "min"])
+    aggregator.update(pd.DataFrame({"dept": ["A", "B"]}), pd.DataFrame({"amount": [None, 1.0]}))
+
+    summary = aggregator.result()
+
+    assert list(summary.columns) == ["dept", "행 수", "amount 평균", "amount 최솟값"]
+    assert np.isnan(summary["amount 평균"][0]) and summary["amount 평균"][1] == 1.0
+
+
+def test_composite_keys_and_empty_result():
+    aggregator = GroupAggregator(["region", "dept"], [], ["sum"])
+    assert list(aggregator.result().columns) == ["region", "dept", "행 수"]
+
+    aggregator.update(pd.DataFrame({"region": ["x", "x", "y"], "dept": ["A", "A", "A"]}), pd.DataFrame(index=range(3)))
+
+    assert aggregator.group_values == [("x", "A"), ("y", "A")]
+    assert aggregator.result()["행 수"].tolist() == [2, 1]
+
+
+def test_check_aggregations():
+    assert check_aggregations(["sum", "max", "sum"]) == ["sum", "max"]
+    with pytest.raises(ValueError):
+        check_aggregations(["median"])
+
+
+def test_is_numeric_column():
+    assert is_numeric_column(pd.Series([1, 2.5]))
+    assert is_numeric_column(pd.Series([1, None], dtype=object))
+    assert not is_numeric_column(pd.Series([True, False]))
+    assert not is_numeric_column(pd.Series(["1", 2], dtype=object))
+    assert not is_numeric_column(pd.Series([None, None], dtype=object))
+    assert not is_numeric_column(pd.Series(pd.to_datetime(["2024-01-01"])))
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["name", "dept", "amount", "memo"])
+    for i in range(30):
+        book.active.append([f"n{i}", f"D{i % 3}", "없음" if i == 7 else i * 1.5, "비고"])
+    book.save(folder / "pay.xlsx")
+    return str(folder)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_service_writes_one_summary(input_folder, tmp_path, streaming):
+    output = tmp_path / "output"
+    service = ExcelParseService(input_folder, str(output))
+
+    result = service.aggregate("pay.xlsx", 2, value_columns=[3], aggregations=["count", "sum"],
+                               streaming=streaming, batch_size=4)
+
+    assert os.listdir(output) == ["pay_summary.xlsx"]
+    assert result.invalid_values == {"amount": 1}
+    summary = result.summary
+    assert summary["dept"].tolist() == ["D0", "D1", "D2"]
+    assert summary["행 수"].tolist() == [10, 10, 10]
+    assert summary["amount 개수"].tolist() == [10, 9, 10]
+    assert summary["amount 합계"].tolist() == [sum(i * 1.5 for i in range(30) if i % 3 == r and i != 7)
+                                               for r in range(3)]
+    assert summary["출력 파일"].tolist() == ["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"]
+    pd.testing.assert_frame_equal(pd.read_excel(result.output_file), summary, check_dtype=False)
+
+
+def test_service_picks_numeric_columns_by_default(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"), output_format="csv")
+
+    result = service.aggregate("pay.xlsx", 2, aggregations=["max"])
+
+    # 문자열이 섞인 amount 열은 숫자 열이 아니므로 행 수만 집계
+    assert result.output_file.endswith("pay_summary.csv")
+    assert list(result.summary.columns) == ["dept", "행 수", "출력 파일"]
+    assert result.summary["행 수"].tolist() == [10, 10, 10]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_service_key_column_after_value_column(input_folder, tmp_path, streaming):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    result = service.aggregate("pay.xlsx", 4, value_columns=[3], aggregations=["count"], streaming=streaming)
+
+    assert result.summary[["memo", "행 수", "amount 개수"]].values.tolist() == [["비고", 30, 29]]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_service_sheet_without_rows(tmp_path, streaming):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    book.save(folder / "empty.xlsx")
+    service = ExcelParseService(str(folder), str(tmp_path / "output"))
+
+    result = service.aggregate("empty.xlsx", 1, value_columns=[2], streaming=streaming)
+
+    assert result.summary.empty
+    assert os.path.exists(result.output_file)
+
+
+@pytest.mark.parametrize("value_columns", [[2], [3, 3], [9]])
+def test_service_rejects_invalid_value_columns(input_folder, tmp_path, value_columns):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    with pytest.raises(ValueError):
+        service.aggregate("pay.xlsx", 2, value_columns=value_columns)
+
+
+def test_cli_summarize(input_folder, tmp_path):
+    output = tmp_path / "output"
+
+    code = cli.main(["summarize", os.path.join(input_folder, "pay.xlsx"), "--output", str(output),
+                     "--column", "2", "--values", "3", "--agg", "sum", "--streaming"])
+
+    assert code == 0
+    assert pd.read_excel(output / "pay_summary.xlsx")["행 수"].tolist() == [10, 10, 10]
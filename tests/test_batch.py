@@ -0,0 +1,75 @@
+import csv
+import json
+import os
+
+import pytest
+
+import cli
+from services.batch import discover_excel_files
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def save_workbook(path, rows):
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(rows):
+        book.active.append([f"D{i % 2}", i])
+    book.save(path)
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    save_workbook(folder / "a.xlsx", 10)
+    save_workbook(folder / "b.xlsx", 6)
+    # 읽을 수 없는 파일, 엑셀 임시 파일, 엑셀이 아닌 파일
+    (folder / "broken.xlsx").write_bytes(b"not a workbook")
+    (folder / "~$a.xlsx").write_bytes(b"")
+    (folder / "notes.txt").write_text("메모", encoding="utf-8")
+    (folder / "sub.xlsx").mkdir()
+    return str(folder)
+
+
+def test_discover_excel_files(input_folder):
+    assert discover_excel_files(input_folder) == ["a.xlsx", "b.xlsx", "broken.xlsx"]
+    with pytest.raises(ValueError):
+        discover_excel_files(os.path.join(input_folder, "missing"))
+
+
+@pytest.mark.parametrize("file_workers", [1, 2])
+def test_parse_folder_reports_every_file(input_folder, tmp_path, file_workers):
+    output = tmp_path / "output"
+    service = ExcelParseService(input_folder, str(output))
+
+    results = service.parse_folder(1, file_workers=file_workers, report_file="report.json")
+
+    assert [(result.file_name, result.status) for result in results] == [
+        ("a.xlsx", "ok"), ("b.xlsx", "ok"), ("broken.xlsx", "error")]
+    assert [(result.rows, result.groups, result.files_written) for result in results[:2]] == [(10, 2, 2), (6, 2, 2)]
+    assert results[2].error
+    assert sorted(name for name in os.listdir(output) if name.endswith(".xlsx")) == [
+        "a_D0.xlsx", "a_D1.xlsx", "b_D0.xlsx", "b_D1.xlsx"]
+
+    report = json.loads((output / "report.json").read_text(encoding="utf-8"))
+    assert (report["files"], report["succeeded"], report["failed"]) == (3, 2, 1)
+    assert (report["rows"], report["files_written"]) == (16, 4)
+    with open(output / "report.csv", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["status"] for row in rows] == ["ok", "ok", "error"]
+
+
+def test_cli_batch(input_folder, tmp_path, capsys):
+    output = tmp_path / "output"
+
+    code = cli.main(["batch", "--input", input_folder, "--output", str(output), "--column", "1",
+                     "--file-workers", "1"])
+
+    printed = capsys.readouterr().out.splitlines()
+    # 실패한 파일이 있으면 종료 코드 1
+    assert code == 1
+    assert printed[0].startswith("a.xlsx: 2개 파일, 10행")
+    assert printed[2].startswith("broken.xlsx: 오류")
+    assert (output / "batch_report.json").exists()
@@ -0,0 +1,72 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import group_keys, make_rows, make_workbook
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+
+
+def digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_workbook_is_deterministic(tmp_path):
+    params = {"rows": 300, "cols": 4, "groups": 7, "skew": 1.0, "string_width": 5, "seed": 3}
+
+    first = make_workbook(str(tmp_path / "first.xlsx"), **params)
+    second = make_workbook(str(tmp_path / "second.xlsx"), **params)
+    other = make_workbook(str(tmp_path / "other.xlsx"), **dict(params, seed=4))
+
+    assert digest(first) == digest(second) != digest(other)
+    df = pd.read_excel(first)
+    assert list(df.columns) == ["group", "col1", "col2", "col3"]
+    assert len(df) == 300 and df["group"].nunique() <= 7
+    assert df["col3"].str.len().eq(5).all()
+
+
+def test_rows_follow_column_kinds():
+    rows = list(make_rows(12, 4, groups=3, string_width=6))
+
+    assert len(rows) == 12 and all(len(row) == 4 for row in rows)
+    assert all(row[0].startswith("G") for row in rows)
+    assert all(isinstance(row[1], int) and isinstance(row[2], float) and len(row[3]) == 6 for row in rows)
+
+
+def test_skew_concentrates_rows_in_first_groups():
+    uniform = np.bincount(group_keys(20000, 50, skew=0.0), minlength=50)
+    skewed = np.bincount(group_keys(20000, 50, skew=1.5), minlength=50)
+
+    assert uniform.max() < 2 * uniform.min()
+    assert skewed[0] > 10 * skewed[-1]
+    assert list(group_keys(100, 5, seed=1)) == list(group_keys(100, 5, seed=1))
+
+
+def test_rejects_workbook_without_columns(tmp_path):
+    with pytest.raises(ValueError):
+        make_workbook(str(tmp_path / "empty.xlsx"), rows=1, cols=0)
+
+
+def test_pipeline_benchmark_records_stages_and_compares(monkeypatch):
+    monkeypatch.syspath_prepend(BENCHMARKS)
+    import bench_pipeline
+
+    params = {"rows": 200, "cols": 3, "groups": 4, "skew": 0.0, "string_width": 4}
+    scenario = bench_pipeline.run_scenario(params, "auto", 1, repeat=1, trace_memory=True)
+
+    assert list(scenario["stages"]) == list(bench_pipeline.STAGES)
+    assert all(result["seconds"] > 0 and result["peak_bytes"] > 0 for result in scenario["stages"].values())
+    assert scenario["input_bytes"] > 0
+
+    results = {"scenarios": {"tiny": scenario}}
+    slower = {"scenarios": {"tiny": dict(scenario, stages={
+        stage: {"seconds": result["seconds"] * 2} for stage, result in scenario["stages"].items()})}}
+    assert bench_pipeline.compare(results, results, threshold=0.2) == []
+    assert bench_pipeline.compare(slower, results, threshold=0.2) == [("tiny", stage) for stage in bench_pipeline.STAGES]
+    # 조건이 다른 기준 결과와는 비교하지 않음
+    other = {"scenarios": {"tiny": dict(scenario, params=dict(params, rows=100))}}
+    assert bench_pipeline.compare(slower, other, threshold=0.2) == []
@@ -0,0 +1,78 @@
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from services.batch import process_file
+from services.bundle_writer import sheet_name, write_sheet_bundles
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def frame(label, rows=3):
+    return pd.DataFrame({"dept": [label] * rows, "amount": range(rows)})
+
+
+@pytest.fixture
+def folders(tmp_path):
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(12):
+        book.active.append([f"D{i % 4}", i])
+    book.save(input_folder / "pay.xlsx")
+    return str(input_folder), str(tmp_path / "output")
+
+
+def test_sheet_name_rules():
+    used = set()
+
+    assert sheet_name("서울/본사", used) == "서울본사"
+    assert sheet_name("서울:본사", used) == "서울본사 (2)"
+    assert sheet_name("SEOUL", used) == "SEOUL"
+    assert sheet_name("seoul", used) == "seoul (2)"
+    assert sheet_name("history", used) == "_history"
+    assert sheet_name("", used) == "NA"
+    assert len(sheet_name("x" * 40, used)) == 31
+
+
+def test_sheet_bundles_roll_over_and_report_file_sizes(tmp_path):
+    parts = [(f"D{i}", frame(f"D{i}")) for i in range(5)]
+    sizes = []
+    part_count = []
+
+    output_files = write_sheet_bundles(iter(parts), str(tmp_path / "bundle.xlsx"), on_part=lambda: part_count.append(1),
+                                       on_written=sizes.append, max_sheets=2)
+
+    assert [os.path.basename(path) for path in output_files] == ["bundle.xlsx", "bundle_2.xlsx", "bundle_3.xlsx"]
+    assert len(part_count) == 5
+    # 워크북마다 한 번, 압축 전 XML 크기가 아닌 최종 파일 크기
+    assert sizes == [os.path.getsize(path) for path in output_files]
+    assert pd.read_excel(output_files[1], sheet_name=None).keys() == {"D2", "D3"}
+
+
+@pytest.mark.parametrize("output_mode", ["sheets", "zip"])
+def test_bundle_progress_counts_groups_and_container(folders, output_mode):
+    input_folder, output_folder = folders
+    service_options = {"input_folder": input_folder, "output_folder": output_folder, "output_mode": output_mode}
+
+    result = process_file(service_options, "pay.xlsx", 1, {})
+
+    assert result.status == "ok", result.error
+    assert (result.files_written, result.parts_written) == (1, 4)
+    assert result.bytes_written == os.path.getsize(result.output_files[0])
+    if output_mode == "zip":
+        with zipfile.ZipFile(result.output_files[0]) as zf:
+            assert len(zf.namelist()) == 4
+    assert os.listdir(output_folder) == [os.path.basename(result.output_files[0])]
+
+
+def test_file_outputs_count_files(folders):
+    input_folder, output_folder = folders
+
+    result = process_file({"input_folder": input_folder, "output_folder": output_folder}, "pay.xlsx", 1, {})
+
+    assert (result.files_written, result.parts_written) == (4, 0)
+    assert result.bytes_written == sum(os.path.getsize(path) for path in result.output_files)
@@ -0,0 +1,67 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.columnar_writer import HIVE_NULL, HivePlan, write_hive_dataset
+from services.excel_parse_service import ExcelParseService
+
+pyarrow = pytest.importorskip("pyarrow")
+openpyxl = pytest.importorskip("openpyxl")
+
+# 대소문자만 다른 값, 숫자 1과 문자열 "1", Windows에서 끝의 점/공백이 지워지는 값
+VALUES = ["Seoul", "seoul", 1, "1", "a.", "a", "b ", None]
+
+
+def relative(paths, root):
+    return [os.path.relpath(path, root) for path in paths]
+
+
+def test_plan_separates_colliding_values():
+    plan = HivePlan(["city"])
+
+    folders = plan.assign(VALUES)
+
+    assert folders == ["city=Seoul", "city=seoul (2)", "city=1", "city=1 (2)", "city=a", "city=a (2)", "city=b",
+                       f"city={HIVE_NULL}"]
+    assert [(value, folder) for value, _, folder in plan.renamed] == [
+        ("seoul", "city=seoul (2)"), ("1", "city=1 (2)"), ("a.", "city=a"), ("a", "city=a (2)"), ("b ", "city=b")]
+    # 같은 값은 처음 정한 폴더를 그대로 사용
+    assert plan.directory("seoul") == "city=seoul (2)"
+
+
+def test_plan_composite_keys_share_parent_folders():
+    plan = HivePlan(["city", "dept"])
+
+    folders = plan.assign([("Seoul", "A"), ("seoul", "a"), ("Seoul", "a")])
+
+    assert folders == [os.path.join("city=Seoul", "dept=A"), os.path.join("city=seoul (2)", "dept=a"),
+                       os.path.join("city=Seoul", "dept=a (2)")]
+
+
+def test_dataset_writes_every_colliding_group(tmp_path):
+    df = pd.DataFrame({"city": VALUES * 2, "amount": range(len(VALUES) * 2)})
+
+    output_files = write_hive_dataset(df, 0, str(tmp_path), "parquet")
+
+    assert len(set(path.lower() for path in output_files)) == len(VALUES)
+    for i, path in enumerate(output_files):
+        assert pd.read_parquet(path)["amount"].tolist() == [i, i + len(VALUES)]
+
+
+def test_streaming_uses_same_folders(tmp_path):
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["city", "amount"])
+    for i, value in enumerate(VALUES * 2):
+        book.active.append([value, i])
+    book.save(input_folder / "pay.xlsx")
+    output_folder = tmp_path / "output"
+    service = ExcelParseService(str(input_folder), str(output_folder), output_format="parquet")
+
+    in_memory = relative(service.parse_data("pay.xlsx", 1), output_folder)
+    streamed = relative(service.parse_data("pay.xlsx", 1, streaming=True), output_folder)
+
+    assert streamed == in_memory
+    assert len(set(path.lower() for path in streamed)) == len(VALUES)
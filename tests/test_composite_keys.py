@@ -0,0 +1,74 @@
+import os
+
+import pandas as pd
+import pytest
+
+import cli
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+
+ROWS = [("a", "서울", "D1"), ("b", "부산", "D1"), ("c", "서울", "D2"), ("d", "서울", "D1"), ("e", None, "D2")]
+NAMES = ["pay_서울_D1.xlsx", "pay_부산_D1.xlsx", "pay_서울_D2.xlsx", "pay_NA_D2.xlsx"]
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["name", "region", "dept"])
+    for row in ROWS:
+        book.active.append(list(row))
+    book.save(folder / "pay.xlsx")
+    return str(folder)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_split_by_column_combination(input_folder, tmp_path, streaming):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", [2, 3], streaming=streaming, batch_size=2)
+
+    # 값 조합마다 한 파일, 파일 이름은 값을 "_"로 이어 붙임 (빈 값은 NA)
+    assert [os.path.basename(path) for path in output_files] == NAMES
+    assert [pd.read_excel(path)["name"].tolist() for path in output_files] == [["a", "d"], ["b"], ["c"], ["e"]]
+
+
+def test_single_column_list_is_plain_split(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", [3])
+
+    assert [os.path.basename(path) for path in output_files] == ["pay_D1.xlsx", "pay_D2.xlsx"]
+
+
+@pytest.mark.parametrize("column_num", [[], [2, 2], [2, 9]])
+def test_invalid_key_columns(input_folder, tmp_path, column_num):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    with pytest.raises(ValueError):
+        service.parse_data("pay.xlsx", column_num)
+
+
+def test_columnar_output_nests_one_folder_per_key(input_folder, tmp_path):
+    pytest.importorskip("pyarrow")
+    output = tmp_path / "output"
+    service = ExcelParseService(input_folder, str(output), output_format="parquet")
+
+    output_files = service.parse_data("pay.xlsx", [2, 3])
+
+    folders = [os.path.relpath(os.path.dirname(path), output / "pay").replace(os.sep, "/") for path in output_files]
+    assert folders == ["region=서울/dept=D1", "region=부산/dept=D1", "region=서울/dept=D2",
+                       "region=__HIVE_DEFAULT_PARTITION__/dept=D2"]
+    assert [pd.read_parquet(path)["name"].tolist() for path in output_files] == [["a", "d"], ["b"], ["c"], ["e"]]
+
+
+def test_cli_accepts_several_columns(input_folder, tmp_path):
+    output = tmp_path / "output"
+
+    code = cli.main(["split", os.path.join(input_folder, "pay.xlsx"), "--output", str(output),
+                     "--column", "2", "3"])
+
+    assert code == 0
+    assert sorted(os.listdir(output)) == sorted(NAMES)
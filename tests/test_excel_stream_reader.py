@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+from services.excel_stream_reader import ExcelStreamReader
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "pay.xlsx"
+    book = openpyxl.Workbook()
+    book.active.title = "first"
+    book.active.append(["dept", "amount", "memo", None, None])
+    for i in range(25):
+        book.active.append([f"D{i % 3}", i] + (["비고"] if i % 4 == 0 else []))
+    book.active.append([])
+    book.active.append(["D0", 99, "x"])
+    second = book.create_sheet("second")
+    second.append(["other"])
+    second.append([1])
+    book.save(path)
+    return str(path)
+
+
+def test_reads_batches_fitted_to_header(workbook):
+    with ExcelStreamReader(workbook, batch_size=10) as reader:
+        batches = list(reader.iter_batches())
+        header = reader.header
+
+    # 헤더 뒤쪽 빈 셀은 제외하고, 행은 헤더 길이에 맞추며, 데이터 사이의 빈 행은 유지
+    assert header == ["dept", "amount", "memo"]
+    assert [len(batch) for batch in batches] == [10, 10, 7]
+    assert batches[0][0] == ("D0", 0, "비고") and batches[0][1] == ("D1", 1, None)
+    assert batches[-1][-2:] == [(None, None, None), ("D0", 99, "x")]
+
+
+def test_cells_beyond_header_are_dropped(tmp_path):
+    path = tmp_path / "wide.xlsx"
+    book = openpyxl.Workbook()
+    book.active.append(["a", "b"])
+    book.active.append([1, 2, "헤더 밖"])
+    book.save(path)
+
+    with ExcelStreamReader(str(path)) as reader:
+        assert list(reader.iter_batches()) == [[(1, 2)]]
+
+
+def test_trailing_blank_rows_are_dropped(tmp_path):
+    path = tmp_path / "blank.xlsx"
+    book = openpyxl.Workbook()
+    book.active.append(["a"])
+    book.active.append([1])
+    book.active["A9"] = None
+    book.active["A9"].number_format = "0.00"
+    book.save(path)
+
+    with ExcelStreamReader(str(path)) as reader:
+        assert list(reader.iter_batches()) == [[(1,)]]
+
+
+def test_batches_match_read_excel(workbook):
+    with ExcelStreamReader(workbook, batch_size=7) as reader:
+        rows = [row for batch in reader.iter_batches() for row in batch]
+        header = reader.header
+
+    expected = pd.read_excel(workbook)
+    assert header == list(expected.columns)
+    assert pd.DataFrame(rows).fillna("").values.tolist() == expected.fillna("").values.tolist()
+
+
+def test_named_sheet(workbook):
+    with ExcelStreamReader(workbook, sheet_name="second") as reader:
+        assert reader.header == ["other"]
+        assert list(reader.iter_batches()) == [[(1,)]]
+
+
+def test_rejects_unsupported_input(workbook, tmp_path):
+    with pytest.raises(ValueError):
+        ExcelStreamReader(str(tmp_path / "pay.xls"))
+    with pytest.raises(ValueError):
+        ExcelStreamReader(workbook, batch_size=0)
+    with pytest.raises(RuntimeError):
+        next(ExcelStreamReader(workbook).iter_batches())
+
+
+def test_streaming_split_matches_in_memory_split(workbook, tmp_path):
+    folder, file_name = os.path.split(workbook)
+    expected = ExcelParseService(folder, str(tmp_path / "memory")).parse_data(file_name, 1)
+    output_files = ExcelParseService(folder, str(tmp_path / "streaming")).parse_data(file_name, 1, streaming=True,
+                                                                                      batch_size=4)
+
+    assert [os.path.basename(path) for path in output_files] == [os.path.basename(path) for path in expected]
+    for path, expected_path in zip(output_files, expected):
+        pd.testing.assert_frame_equal(pd.read_excel(path), pd.read_excel(expected_path))
@@ -0,0 +1,95 @@
+import datetime
+import decimal
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.excel_writers import MAX_ROWS, XlsxWorkbookWriter, write_frame_xlsx
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def sheet_values(path, sheet=0):
+    book = openpyxl.load_workbook(path)
+    values = [list(row) for row in book.worksheets[sheet].iter_rows(values_only=True)]
+    book.close()
+    return values
+
+
+def test_cell_types_round_trip(tmp_path):
+    path = str(tmp_path / "types.xlsx")
+    row = ["서울 <&>", " 앞뒤 공백 ", 7, 1.25, True, datetime.datetime(2024, 1, 2, 3, 4, 5),
+           datetime.date(2024, 2, 29), datetime.time(12, 30), decimal.Decimal("2.5"), np.int64(3), np.float64(0.5),
+           None, float("nan"), pd.NaT, pd.NA, "", "제어\x01문자"]
+
+    with XlsxWorkbookWriter(path) as writer:
+        writer.add_sheet("값", header=[f"c{i}" for i in range(len(row))]).append(row)
+
+    values = sheet_values(path)
+    assert values[0] == [f"c{i}" for i in range(len(row))]
+    assert values[1] == ["서울 <&>", " 앞뒤 공백 ", 7, 1.25, True, datetime.datetime(2024, 1, 2, 3, 4, 5),
+                         datetime.datetime(2024, 2, 29), datetime.time(12, 30), 2.5, 3, 0.5,
+                         None, None, None, None, None, "제어문자"]
+
+
+def test_multiple_sheets_and_flushes(tmp_path):
+    path = str(tmp_path / "sheets.xlsx")
+
+    with XlsxWorkbookWriter(path, flush_rows=3) as writer:
+        first = writer.add_sheet("첫째", header=["a"])
+        second = writer.add_sheet('"둘째"')
+        first.append_rows([i] for i in range(10))
+        # flush_rows마다 임시 파일에 기록하고 버퍼는 비움
+        assert first.pending_rows < 3 and first.bytes_flushed > 0
+        second.append(["x"])
+
+    assert writer.bytes_written == os.path.getsize(path)
+    assert pd.ExcelFile(path).sheet_names == ["첫째", '"둘째"']
+    assert sheet_values(path)[1:] == [[i] for i in range(10)]
+    assert sheet_values(path, 1) == [["x"]]
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    path = tmp_path / "failed.xlsx"
+
+    with pytest.raises(RuntimeError):
+        with XlsxWorkbookWriter(str(path)) as writer:
+            writer.add_sheet().append([1])
+            raise RuntimeError("중단")
+
+    assert not path.exists()
+    assert writer._temp_dir is None
+
+
+def test_empty_workbook_has_one_sheet(tmp_path):
+    path = str(tmp_path / "empty.xlsx")
+    XlsxWorkbookWriter(path).close()
+
+    assert pd.ExcelFile(path).sheet_names == ["Sheet1"]
+
+
+def test_row_limit(tmp_path):
+    writer = XlsxWorkbookWriter(str(tmp_path / "full.xlsx"))
+    sheet = writer.add_sheet()
+    sheet.row_count = MAX_ROWS
+
+    with pytest.raises(ValueError):
+        sheet.append([1])
+    writer.discard()
+
+
+def test_write_frame_matches_pandas(tmp_path):
+    df = pd.DataFrame({
+        "dept": ["D0", "D1", np.nan],
+        "amount": [1.5, np.nan, 3.0],
+        "count": [1, 2, 3],
+        "date": [datetime.datetime(2024, 1, 1), None, datetime.datetime(2024, 3, 1, 12)],
+    })
+    path = str(tmp_path / "frame.xlsx")
+
+    size = write_frame_xlsx(df, path, sheet_name="데이터")
+
+    assert size == os.path.getsize(path)
+    pd.testing.assert_frame_equal(pd.read_excel(path, sheet_name="데이터"), df)
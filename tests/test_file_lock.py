@@ -0,0 +1,121 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from services.file_lock import file_lock, write_json
+
+
+def dead_pid():
+    """이미 종료된 프로세스의 PID"""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def acquire_in_thread(lock_path, timeout):
+    """다른 스레드에서 잠금을 기다렸다가 잡은 뒤 바로 해제, 잡은 시각을 기록"""
+    acquired = []
+
+    def run():
+        with file_lock(lock_path, timeout=timeout):
+            acquired.append(time.monotonic())
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, acquired
+
+
+def test_lock_records_owner_and_is_removed(tmp_path):
+    lock_path = str(tmp_path / "index.lock")
+
+    with file_lock(lock_path):
+        with open(lock_path, encoding="utf-8") as f:
+            assert f.read() == f"{socket.gethostname()} {os.getpid()}"
+
+    assert not os.path.exists(lock_path)
+
+
+def test_lock_of_dead_process_is_broken(tmp_path):
+    lock_path = tmp_path / "index.lock"
+    lock_path.write_text(f"{socket.gethostname()} {dead_pid()}", encoding="utf-8")
+
+    thread, acquired = acquire_in_thread(str(lock_path), timeout=30)
+    thread.join(10)
+
+    assert acquired
+    assert not lock_path.exists()
+
+
+def test_lock_of_live_holder_is_not_broken_after_timeout(tmp_path):
+    lock_path = str(tmp_path / "index.lock")
+
+    with file_lock(lock_path):
+        # 오래 걸리는 저장 중에도 대기 시간이 지났다고 잠금을 빼앗지 않음
+        thread, acquired = acquire_in_thread(lock_path, timeout=0.1)
+        time.sleep(0.6)
+        assert not acquired
+        released = time.monotonic()
+    thread.join(10)
+
+    assert acquired and acquired[0] >= released
+
+
+def test_lock_of_other_host_is_waited_for(tmp_path):
+    lock_path = tmp_path / "index.lock"
+    lock_path.write_text(f"other-host.invalid {dead_pid()}", encoding="utf-8")
+
+    thread, acquired = acquire_in_thread(str(lock_path), timeout=0.1)
+    time.sleep(0.4)
+    assert not acquired
+    lock_path.unlink()
+    thread.join(10)
+
+    assert acquired
+
+
+def test_empty_lock_file_is_broken_only_when_old(tmp_path):
+    lock_path = tmp_path / "index.lock"
+    lock_path.write_text("", encoding="utf-8")
+
+    thread, acquired = acquire_in_thread(str(lock_path), timeout=1)
+    time.sleep(0.3)
+    assert not acquired
+    old = time.time() - 60
+    os.utime(lock_path, (old, old))
+    thread.join(10)
+
+    assert acquired
+
+
+def test_write_json_replaces_file(tmp_path):
+    path = tmp_path / "manifest.json"
+    write_json(str(path), {"a": 1})
+    write_json(str(path), {"값": [1, 2]}, indent=1)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"값": [1, 2]}
+    assert os.listdir(tmp_path) == ["manifest.json"]
+
+
+def test_lock_is_held_across_processes(tmp_path):
+    lock_path = str(tmp_path / "index.lock")
+    script = (
+        "import sys, time\n"
+        "from services.file_lock import file_lock\n"
+        "with file_lock(sys.argv[1], timeout=0.1):\n"
+        "    print('locked', flush=True)\n"
+        "    time.sleep(1)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    holder = subprocess.Popen([sys.executable, "-c", script, lock_path], stdout=subprocess.PIPE, env=env, text=True)
+    assert holder.stdout.readline().strip() == "locked"
+
+    started = time.monotonic()
+    with file_lock(lock_path, timeout=0.1):
+        waited = time.monotonic() - started
+    holder.wait(10)
+
+    assert waited > 0.5
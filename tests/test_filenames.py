@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+from services.filenames import MAX_NAME_BYTES, RESERVED_NAMES, FilenamePlan, group_label
+
+
+def test_group_label():
+    assert group_label('a/b:c*?"<>|') == "abc"
+    assert group_label("탭\t이름") == "탭이름"
+    assert group_label(None) == "NA"
+    assert group_label(math.nan) == "NA"
+    assert group_label(3) == "3"
+    assert group_label(("서울", None, 1.5)) == "서울_NA_1.5"
+
+
+def test_plain_values_keep_their_names():
+    plan = FilenamePlan(".xlsx")
+    assert plan.assign(["인사팀", "영업팀"], prefix="급여_") == [
+        ("인사팀", "급여_인사팀.xlsx"), ("영업팀", "급여_영업팀.xlsx")]
+    assert plan.renamed == []
+
+
+def test_colliding_values_get_numbered_suffixes():
+    plan = FilenamePlan(".xlsx")
+    names = [file_name for _, file_name in plan.assign(["A/B", "AB", "ab", None, "NA"], prefix="f_")]
+
+    assert names == ["f_AB.xlsx", "f_AB (2).xlsx", "f_ab (3).xlsx", "f_NA.xlsx", "f_NA (2).xlsx"]
+    assert len({name.lower() for name in names}) == len(names)
+    assert [original for _, original, _ in plan.renamed] == ["f_AB.xlsx", "f_ab.xlsx", "f_NA.xlsx"]
+
+
+def test_same_value_is_named_once():
+    plan = FilenamePlan(".csv")
+    first = plan.name("x", prefix="a_")
+    assert plan.assign(["x", "x"], prefix="a_") == [first, first]
+    # NaN은 None과 같은 그룹
+    assert plan.name(math.nan, prefix="a_") == plan.name(None, prefix="a_")
+    assert len(plan) == 2
+    # prefix가 다르면 다른 파일
+    assert plan.name("x", prefix="b_")[1] == "b_x.csv"
+
+
+@pytest.mark.parametrize("value", ["CON", "nul", "Com1", "lpt9.txt"])
+def test_reserved_names(value):
+    assert "con" in RESERVED_NAMES and "CON" not in RESERVED_NAMES
+    label, file_name = FilenamePlan(".xlsx").name(value)
+
+    assert file_name.partition(".")[0].lower() not in RESERVED_NAMES
+    assert label.lower().startswith(value.partition(".")[0].lower() + "_")
+
+
+def test_long_names_are_truncated_with_hash():
+    plan = FilenamePlan(".xlsx")
+    first = plan.name("가" * 200, prefix="급여_")[1]
+    second = plan.name("가" * 199 + "나", prefix="급여_")[1]
+
+    assert len(first.encode("utf-8")) <= MAX_NAME_BYTES
+    assert first != second and first.endswith(".xlsx") and "~" in first
+
+
+def test_to_dict_and_entries():
+    plan = FilenamePlan(".xlsx")
+    plan.assign([1, ("a", 2)], prefix="p_")
+
+    assert plan.to_dict() == {"p_1.xlsx": "1", "p_a_2.xlsx": "('a', 2)"}
+    assert [entry[1] for entry in plan.entries] == [1, ("a", 2)]
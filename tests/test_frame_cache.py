@@ -0,0 +1,104 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from services.frame_cache import FrameCache
+
+pytest.importorskip("pyarrow")
+
+
+def make_source(folder, name, content=b"workbook"):
+    path = os.path.join(folder, name)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def frame(n):
+    return pd.DataFrame({"key": [f"k{i % 3}" for i in range(n)], "value": range(n)})
+
+
+def index_entries(cache_dir):
+    with open(os.path.join(cache_dir, "index.json"), encoding="utf-8") as f:
+        return json.load(f)["entries"]
+
+
+def test_store_and_load(tmp_path):
+    source = make_source(tmp_path, "a.xlsx")
+    cache = FrameCache(str(tmp_path / "cache"))
+
+    assert cache.load(source) is None
+    cache.store(source, frame(5))
+
+    pd.testing.assert_frame_equal(FrameCache(str(tmp_path / "cache")).load(source), frame(5))
+    # 시트와 읽기 엔진이 다르면 다른 항목
+    assert cache.load(source, sheet_name="other") is None
+    assert cache.load(source, reader_name="openpyxl") is None
+
+
+def test_changed_source_drops_old_entry(tmp_path):
+    source = make_source(tmp_path, "a.xlsx")
+    cache = FrameCache(str(tmp_path / "cache"))
+    cache.store(source, frame(5))
+
+    make_source(tmp_path, "a.xlsx", b"changed workbook")
+    assert cache.load(source) is None
+    assert index_entries(cache.cache_dir) == {}
+    assert [name for name in os.listdir(cache.cache_dir) if name.endswith(".parquet")] == []
+
+
+def test_evicts_least_recently_used(tmp_path):
+    sources = [make_source(tmp_path, f"{i}.xlsx", str(i).encode()) for i in range(3)]
+    cache = FrameCache(str(tmp_path / "cache"))
+    cache.store(sources[0], frame(1000))
+    size = cache.total_bytes
+
+    cache.max_bytes = size * 2
+    cache.store(sources[1], frame(1000))
+    cache.load(sources[0])
+    cache.store(sources[2], frame(1000))
+
+    assert cache.load(sources[1]) is None
+    assert cache.load(sources[0]) is not None
+    assert cache.load(sources[2]) is not None
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_clear(tmp_path):
+    source = make_source(tmp_path, "a.xlsx")
+    cache = FrameCache(str(tmp_path / "cache"))
+    cache.store(source, frame(5))
+    cache.clear()
+
+    assert cache.load(source) is None
+    assert os.listdir(cache.cache_dir) == ["index.json"]
+
+
+def _store_many(cache_dir, sources):
+    cache = FrameCache(cache_dir)
+    for i, source in enumerate(sources):
+        cache.store(source, frame(50 + i))
+        assert cache.load(source) is not None
+    return len(sources)
+
+
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    workers = 6
+    sources = [[make_source(tmp_path, f"{w}_{i}.xlsx", f"{w}-{i}".encode()) for i in range(4)]
+               for w in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        assert sum(executor.map(_store_many, [cache_dir] * workers, sources)) == workers * 4
+
+    entries = index_entries(cache_dir)
+    files = sorted(name for name in os.listdir(cache_dir) if name.endswith(".parquet"))
+    assert len(entries) == workers * 4
+    assert sorted(entry["file"] for entry in entries.values()) == files
+    assert not [name for name in os.listdir(cache_dir) if name.endswith((".tmp", ".lock"))]
+    # 다른 프로세스가 저장한 항목도 읽을 수 있음
+    cache = FrameCache(cache_dir)
+    assert all(cache.load(source) is not None for group in sources for source in group)
@@ -0,0 +1,16 @@
+import importlib.util
+
+import pytest
+
+from benchmarks.import_time import DEFERRED_MODULES, ENTRY_POINTS, measure
+
+
+@pytest.mark.parametrize("entry", list(ENTRY_POINTS))
+def test_entry_points_defer_heavy_imports(entry):
+    if entry == "ui" and importlib.util.find_spec("PyQt5") is None:
+        pytest.skip("PyQt5가 설치되어 있지 않습니다")
+
+    imported = {name.split(".")[0] for name, _, _, _ in measure(ENTRY_POINTS[entry])}
+
+    assert imported, "-X importtime 출력이 없습니다"
+    assert [module for module in DEFERRED_MODULES if module in imported] == []
@@ -0,0 +1,77 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from services.incremental import MANIFEST_FILE, SplitManifest, frame_fingerprint
+
+
+def write(folder, name, content):
+    with open(os.path.join(folder, name), "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def test_frame_fingerprint():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+    assert frame_fingerprint(df) != frame_fingerprint(df.iloc[::-1])
+    assert frame_fingerprint(df) != frame_fingerprint(df.astype({"a": float}))
+    assert frame_fingerprint(df) != frame_fingerprint(df.rename(columns={"b": "c"}))
+
+
+def test_plan_and_update(tmp_path):
+    folder = str(tmp_path)
+    manifest = SplitManifest(folder)
+    groups = {"f_a.xlsx": "1", "f_b.xlsx": "2"}
+
+    # 처음에는 모든 그룹을 저장
+    changed, removed = manifest.plan("f.xlsx|1", groups)
+    assert changed == set(groups) and removed == []
+    for name in groups:
+        write(folder, name, name)
+    manifest.update("f.xlsx|1", groups, {"f_a.xlsx": 3, "f_b.xlsx": 4}, groups)
+
+    # 다시 읽은 매니페스트: 같은 지문은 건너뛰고, 바뀐 그룹/손댄 파일/새 그룹은 저장, 사라진 그룹은 삭제
+    manifest = SplitManifest(folder)
+    assert manifest.plan("f.xlsx|1", groups) == (set(), [])
+    write(folder, "f_b.xlsx", "edited")
+    changed, removed = manifest.plan("f.xlsx|1", {"f_a.xlsx": "changed", "f_b.xlsx": "2", "f_c.xlsx": "3"})
+    assert changed == {"f_a.xlsx", "f_b.xlsx", "f_c.xlsx"} and removed == []
+    assert manifest.plan("f.xlsx|1", {"f_a.xlsx": "1"}) == (set(), ["f_b.xlsx"])
+    # 다른 기준 열은 별도 항목
+    assert manifest.plan("f.xlsx|2", groups)[0] == set(groups)
+
+
+def test_update_keeps_unwritten_entries(tmp_path):
+    folder = str(tmp_path)
+    groups = {"f_a.xlsx": "1", "f_b.xlsx": "2"}
+    for name in groups:
+        write(folder, name, name)
+    SplitManifest(folder).update("k", groups, {"f_a.xlsx": 1, "f_b.xlsx": 2}, groups)
+
+    write(folder, "f_a.xlsx", "new")
+    SplitManifest(folder).update("k", {"f_a.xlsx": "9", "f_b.xlsx": "2"}, {"f_a.xlsx": 5}, ["f_a.xlsx"])
+
+    with open(os.path.join(folder, MANIFEST_FILE), encoding="utf-8") as f:
+        entries = json.load(f)["splits"]["k"]
+    assert entries["f_a.xlsx"]["fingerprint"] == "9" and entries["f_a.xlsx"]["rows"] == 5
+    assert entries["f_b.xlsx"]["rows"] == 2
+
+
+def _update(folder, split_key):
+    name = f"{split_key}.xlsx"
+    write(folder, name, split_key)
+    SplitManifest(folder).update(split_key, {name: split_key}, {name: 1}, [name])
+
+
+def test_concurrent_updates_keep_every_split(tmp_path):
+    folder = str(tmp_path)
+    keys = [f"file{i}" for i in range(12)]
+    with ProcessPoolExecutor(max_workers=6) as executor:
+        list(executor.map(_update, [folder] * len(keys), keys))
+
+    with open(os.path.join(folder, MANIFEST_FILE), encoding="utf-8") as f:
+        assert sorted(json.load(f)["splits"]) == sorted(keys)
+    assert [name for name in os.listdir(folder) if name.endswith((".tmp", ".lock"))] == []
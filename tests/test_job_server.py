@@ -0,0 +1,90 @@
+import os
+import time
+
+import pytest
+
+from services import job_server
+from services.job_server import WORKER_CRASHED_ERROR, JobQueue
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "pay.xlsx"
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(["dept", "amount"])
+    for i in range(20):
+        sheet.append([f"D{i % 3}", i])
+    book.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(workers=1, output_folder=str(tmp_path / "out"))
+    yield queue
+    queue.shutdown()
+
+
+def crash_worker(job_id, file_path, column_num, output_folder, options, cancel_event, events, started):
+    """처리 중에 작업 프로세스가 비정상 종료되는 작업 (메모리 부족 강제 종료 등)"""
+    started[job_id] = os.getpid()
+    events.put((job_id, None))
+    time.sleep(0.5)
+    os._exit(1)
+
+
+def crash_at_start(job_id, file_path, column_num, output_folder, options, cancel_event, events, started):
+    """시작하자마자 작업 프로세스가 비정상 종료되는 작업 (서버가 running 이벤트를 받기 전), 실행 횟수를 파일로 기록"""
+    started[job_id] = os.getpid()
+    with open(os.path.join(output_folder, "runs.txt"), "a") as f:
+        f.write("run\n")
+    os._exit(1)
+
+
+def wait(queue, job_id, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job.finished_state:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"작업이 끝나지 않았습니다: {queue.get(job_id)}")
+
+
+def test_job_runs(queue, workbook):
+    job = wait(queue, queue.submit(workbook, 1).id)
+
+    assert job.status == "done", job.error
+    assert sorted(os.path.basename(path) for path in job.output_files) == ["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"]
+
+
+def test_worker_crash_fails_only_that_job(queue, workbook, monkeypatch):
+    monkeypatch.setattr(job_server, "run_job", crash_worker)
+    crashed = queue.submit(workbook, 1)
+    monkeypatch.undo()
+    waiting = queue.submit(workbook, 1)
+
+    crashed = wait(queue, crashed.id)
+    assert crashed.status == "error"
+    assert crashed.error == WORKER_CRASHED_ERROR
+    # 풀이 깨질 때 대기 중이던 작업은 새 풀에서 처리
+    assert wait(queue, waiting.id).status == "done"
+    # 이후 작업도 새 풀에서 처리
+    assert wait(queue, queue.submit(workbook, 1).id).status == "done"
+
+
+def test_job_crashing_before_running_event_is_not_resubmitted(queue, workbook, monkeypatch, tmp_path):
+    output = tmp_path / "crash"
+    output.mkdir()
+    monkeypatch.setattr(job_server, "run_job", crash_at_start)
+    crashed = queue.submit(workbook, 1, output_folder=str(output))
+    monkeypatch.undo()
+
+    crashed = wait(queue, crashed.id)
+
+    assert (crashed.status, crashed.error) == ("error", WORKER_CRASHED_ERROR)
+    assert (output / "runs.txt").read_text().splitlines() == ["run"]
+    assert wait(queue, queue.submit(workbook, 1).id).status == "done"
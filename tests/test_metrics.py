@@ -0,0 +1,94 @@
+import json
+import os
+import time
+
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+from services.metrics import JobMetrics, QueueMetrics
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def load_trace(path):
+    """닫는 괄호를 생략한 trace 파일을 JSON 배열로 읽음"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read().rstrip().rstrip(",")
+    return json.loads(text + "]")
+
+
+def test_stage_accumulates_calls(tmp_path):
+    metrics = JobMetrics("job", trace_file=str(tmp_path / "trace.json"))
+
+    with metrics.stage("write", rows=10, file="a.xlsx") as current:
+        current.bytes_written += 100
+        time.sleep(0.01)
+    with metrics.stage("write", rows=30):
+        pass
+    metrics.record("write", wall_seconds=0.5, rows=60, bytes_written=50)
+    metrics.close()
+
+    write = metrics.stages["write"]
+    assert (write.calls, write.rows, write.bytes_written) == (3, 100, 150)
+    assert write.wall_seconds >= 0.51 and write.peak_bytes is None
+    assert write.rows_per_second == pytest.approx(write.rows / write.wall_seconds)
+    events = load_trace(tmp_path / "trace.json")
+    assert [event["name"] for event in events] == ["write"] * 3
+    assert events[0]["ph"] == "X" and events[0]["cat"] == "job"
+    assert events[0]["args"]["file"] == "a.xlsx" and events[0]["args"]["bytes_written"] == 100
+
+
+def test_trace_memory_records_peak():
+    metrics = JobMetrics(trace_memory=True)
+
+    with metrics.stage("read"):
+        data = bytearray(2 * 1024 ** 2)
+    metrics.close()
+
+    assert len(data) and metrics.stages["read"].peak_bytes >= 2 * 1024 ** 2
+
+
+def test_summary_and_dict():
+    metrics = JobMetrics("pay.xlsx")
+    with metrics.stage("read", rows=5):
+        pass
+    queue = metrics.queue("write", capacity=4, workers=2)
+    queue.enqueued(1)
+    queue.enqueued(3)
+    metrics.close()
+
+    data = json.loads(json.dumps(metrics.to_dict()))
+    assert data["job"] == "pay.xlsx" and data["total_seconds"] == metrics.total_seconds
+    assert data["stages"]["read"]["rows"] == 5
+    assert data["queues"]["write"]["mean_depth"] == 2.0 and data["queues"]["write"]["max_depth"] == 3
+    assert metrics.queue("write", capacity=8) is queue
+    lines = metrics.summary().splitlines()
+    assert lines[1].startswith("read") and any(line.startswith("total") for line in lines)
+    assert lines[-1].startswith("write")
+
+
+def test_queue_utilization():
+    stats = QueueMetrics("write", workers=2, busy_seconds=3.0, elapsed_seconds=2.0)
+
+    assert stats.utilization == 0.75
+    assert QueueMetrics("idle").utilization == 0.0
+
+
+def test_parse_data_returns_metrics_and_trace(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(20):
+        book.active.append([f"D{i % 4}", i])
+    book.save(folder / "pay.xlsx")
+    service = ExcelParseService(str(folder), str(tmp_path / "output"))
+    trace_file = str(tmp_path / "trace.json")
+
+    output_files = service.parse_data("pay.xlsx", 1, trace_file=trace_file)
+
+    stages = output_files.metrics.stages
+    assert {"read", "key_extraction", "partition", "filenames", "write"} <= set(stages)
+    assert stages["read"].rows == 20 and stages["write"].calls == 4
+    assert stages["write"].bytes_written == sum(os.path.getsize(path) for path in output_files)
+    assert {event["name"] for event in load_trace(trace_file)} >= {"read", "partition", "write"}
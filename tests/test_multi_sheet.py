@@ -0,0 +1,93 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.title = "1월"
+    for name, rows in (("1월", [("D0", 1), ("D1", 2)]), ("2월", [("D1", 3), ("D0", 4), ("D1", 5)]),
+                       ("3월", [("D2", 6)])):
+        sheet = book[name] if name in book.sheetnames else book.create_sheet(name)
+        sheet.append(["dept", "amount"])
+        for row in rows:
+            sheet.append(list(row))
+    book.save(folder / "pay.xlsx")
+    return str(folder)
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """pandas가 워크북을 연 횟수"""
+    count = []
+    excel_file = pd.ExcelFile
+
+    class CountingExcelFile(excel_file):
+        def __init__(self, *args, **kwargs):
+            count.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "ExcelFile", CountingExcelFile)
+    return count
+
+
+def amounts(path):
+    return pd.read_excel(path)["amount"].tolist()
+
+
+def test_first_sheet_only_by_default(input_folder, tmp_path):
+    output_files = ExcelParseService(input_folder, str(tmp_path / "output")).parse_data("pay.xlsx", 1)
+
+    assert [amounts(path) for path in output_files] == [[1], [2]]
+
+
+def test_merge_all_sheets_opens_workbook_once(input_folder, tmp_path, opened):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", 1, sheets="all")
+
+    assert len(opened) == 1
+    assert [os.path.basename(path) for path in output_files] == ["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"]
+    assert [amounts(path) for path in output_files] == [[1, 4], [2, 3, 5], [6]]
+    assert output_files.metrics.stages["read"].rows == 6
+
+
+def test_separate_selected_sheets(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", 1, sheets=["3월", "2월"], sheet_mode="separate")
+
+    # 요청한 시트 순서대로, 출력 파일 이름은 <파일명>_<시트>_<값>
+    assert [os.path.basename(path) for path in output_files] == [
+        "pay_3월_D2.xlsx", "pay_2월_D1.xlsx", "pay_2월_D0.xlsx"]
+    assert [amounts(path) for path in output_files] == [[6], [3, 5], [4]]
+
+
+def test_separate_sheets_in_one_workbook(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"), output_mode="sheets")
+
+    output_files = service.parse_data("pay.xlsx", 1, sheets="all", sheet_mode="separate")
+
+    assert len(output_files) == 1
+    assert pd.ExcelFile(output_files[0]).sheet_names == ["1월_D0", "1월_D1", "2월_D1", "2월_D0", "3월_D2"]
+
+
+@pytest.mark.parametrize("options", [
+    {"sheets": []},
+    {"sheets": ["없는 시트"]},
+    {"sheets": "all", "sheet_mode": "zip"},
+    {"sheets": "all", "streaming": True},
+])
+def test_invalid_sheet_options(input_folder, tmp_path, options):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    with pytest.raises(ValueError):
+        service.parse_data("pay.xlsx", 1, **options)
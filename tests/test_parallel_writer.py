@@ -0,0 +1,140 @@
+import datetime
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.errors import PartitionWriteError
+from services.excel_parse_service import ExcelParseService
+from services.parallel_writer import (WORKER_CRASHED_ERROR, PackedPartition, pack_partition,
+                                      write_partitions_parallel)
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+class Crash:
+    """작업 프로세스에서 역직렬화되는 순간 프로세스를 종료시키는 값 (메모리 부족 강제 종료 등)"""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def frame(label, rows=5):
+    return pd.DataFrame({"dept": [label] * rows, "amount": range(rows)})
+
+
+def mixed_frame(rows):
+    df = pd.DataFrame({
+        "text": [f"직원{i}" if i % 7 else None for i in range(rows)],
+        "int": np.arange(rows),
+        "float": [np.nan if i % 5 == 0 else i / 3 for i in range(rows)],
+        "flag": np.arange(rows) % 2 == 0,
+        "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows) % 30, unit="D"),
+        "mixed": [i if i % 2 else f"x{i}" for i in range(rows)],
+        "time": [datetime.time(i % 24) for i in range(rows)],
+        "category": pd.Categorical(["a", "b"] * (rows // 2)),
+    }, index=np.arange(rows) * 3)
+    df.columns = ["text", "int", "float", "flag", "date", "mixed", "time", "text"]
+    return df
+
+
+def cells(df):
+    return df.astype(object).where(df.notna(), None).values.tolist()
+
+
+def test_pack_partition_round_trip():
+    pytest.importorskip("pyarrow")
+    df = mixed_frame(40)
+
+    packed = pickle.loads(pickle.dumps(pack_partition(df, min_rows=0)))
+
+    assert isinstance(packed, PackedPartition)
+    # 값 종류가 섞인 열, 시간, 범주형 열은 그대로 직렬화
+    assert packed.arrow_positions == [0, 1, 2, 3, 4]
+    restored = packed.to_frame()
+    assert list(restored.columns) == list(df.columns)
+    assert cells(restored) == cells(df)
+    assert restored.iloc[:, 7].dtype == "category"
+
+
+def test_small_partitions_are_sent_as_is():
+    df = mixed_frame(10)
+    assert pack_partition(df) is df
+
+
+def test_packed_partitions_write_same_files(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = mixed_frame(12000)
+    jobs = [(df, str(tmp_path / "packed.csv")), (df.iloc[:100], str(tmp_path / "plain.csv"))]
+
+    results = list(write_partitions_parallel(iter(jobs), workers=2))
+
+    assert [error for _, _, error, _ in results] == [None, None]
+    df.to_csv(tmp_path / "expected.csv", index=False, encoding="utf-8-sig")
+    assert (tmp_path / "packed.csv").read_bytes() == (tmp_path / "expected.csv").read_bytes()
+
+
+def test_results_in_input_order(tmp_path):
+    jobs = [(frame(f"D{i}"), str(tmp_path / f"D{i}.csv")) for i in range(7)]
+
+    results = list(write_partitions_parallel(iter(jobs), workers=2))
+
+    assert [path for path, *_ in results] == [path for _, path in jobs]
+    assert all(error is None and size > 0 for _, size, error, _ in results)
+    assert pd.read_csv(jobs[3][1], encoding="utf-8-sig").equals(jobs[3][0].reset_index(drop=True))
+
+
+def test_failing_group_does_not_stop_others(tmp_path):
+    jobs = [(frame(f"D{i}"), str(tmp_path / f"D{i}.xlsx")) for i in range(4)]
+    jobs[1] = (frame("D1"), str(tmp_path / "missing" / "D1.xlsx"))
+
+    results = list(write_partitions_parallel(iter(jobs), workers=2))
+
+    errors = [error for _, _, error, _ in results]
+    assert errors[1] and errors[0] is None and errors[2] is None and errors[3] is None
+    assert os.path.exists(jobs[3][1])
+
+
+def test_worker_crash_fails_only_that_group(tmp_path):
+    jobs = [(frame(f"D{i}"), str(tmp_path / f"D{i}.csv")) for i in range(6)]
+    jobs[2] = (pd.DataFrame({"dept": ["D2"], "amount": [Crash()]}), str(tmp_path / "D2.csv"))
+
+    results = list(write_partitions_parallel(iter(jobs), workers=2))
+
+    assert [path for path, *_ in results] == [path for _, path in jobs]
+    assert results[2][2] == WORKER_CRASHED_ERROR
+    # 풀이 깨질 때 작업 중이던 파티션과 뒤의 파티션은 모두 저장됨
+    assert [error for i, (_, _, error, _) in enumerate(results) if i != 2] == [None] * 5
+    assert all(os.path.exists(path) for i, (_, path) in enumerate(jobs) if i != 2)
+
+
+def test_closing_early_cancels_pending(tmp_path):
+    jobs = ((frame(f"D{i}"), str(tmp_path / f"D{i}.csv")) for i in range(20))
+
+    results = write_partitions_parallel(jobs, workers=1)
+    next(results)
+    results.close()
+
+    assert len(os.listdir(tmp_path)) < 20
+
+
+def test_service_reports_failed_groups(tmp_path):
+    path = tmp_path / "input" / "pay.xlsx"
+    path.parent.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(12):
+        book.active.append([f"D{i % 3}", i])
+    book.save(path)
+    output = tmp_path / "output"
+    service = ExcelParseService(str(path.parent), str(output), workers=2)
+    # 같은 이름의 폴더가 있으면 그 그룹의 파일은 저장할 수 없음
+    (output / "pay_D1.xlsx").mkdir(parents=True)
+
+    with pytest.raises(PartitionWriteError) as error:
+        service.parse_data("pay.xlsx", 1)
+
+    assert list(error.value.errors) == ["pay_D1.xlsx"]
+    assert sorted(os.path.basename(f) for f in error.value.output_files) == ["pay_D0.xlsx", "pay_D2.xlsx"]
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from services.partitioner import GroupIndex, factorize_keys, partition_frame, partition_indices
+
+
+def frame():
+    return pd.DataFrame({
+        "dept": ["B", "A", None, "B", "A", np.nan, "C"],
+        "region": ["x", "y", "x", "x", "x", "x", None],
+        "value": range(7),
+    })
+
+
+def test_partition_by_one_column_matches_groupby():
+    df = frame()
+    parts = list(partition_frame(df, 0))
+
+    assert [value for value, _ in parts][:2] == ["B", "A"]
+    assert pd.isna(parts[2][0]) and parts[3][0] == "C"
+    # NaN/None은 하나의 그룹, 그룹 안에서는 원래 행 순서
+    assert [list(part["value"]) for _, part in parts] == [[0, 3], [1, 4], [2, 5], [6]]
+    assert sum(len(part) for _, part in parts) == len(df)
+
+
+def test_partition_by_column_combination():
+    df = frame()
+    parts = list(partition_frame(df, [0, 1]))
+
+    values = [value for value, _ in parts]
+    assert values[:2] == [("B", "x"), ("A", "y")]
+    assert pd.isna(values[2][0]) and values[2][1] == "x"
+    assert [list(part["value"]) for _, part in parts] == [[0, 3], [1], [2, 5], [4], [6]]
+
+
+def test_factorize_keys_orders_by_first_appearance():
+    codes, uniques = factorize_keys(pd.Series(["b", "a", "b", None]))
+
+    assert list(codes) == [0, 1, 0, 2]
+    assert list(uniques[:2]) == ["b", "a"]
+
+    codes, uniques = factorize_keys(frame()[["dept", "region"]])
+    assert codes.max() + 1 == len(uniques) == 5
+    assert isinstance(uniques, pd.MultiIndex)
+
+
+def test_partition_indices_bounds():
+    uniques, order, bounds = partition_indices(pd.Series([3, 1, 3, 3, 2]))
+
+    assert list(uniques) == [3, 1, 2]
+    assert list(order) == [0, 2, 3, 1, 4]
+    assert list(bounds) == [0, 3, 4, 5]
+
+
+def test_output_width_keeps_leading_columns():
+    df = frame()[["value", "dept"]]
+    parts = list(partition_frame(df, 1, output_width=1))
+
+    assert all(list(part.columns) == ["value"] for _, part in parts)
+    assert [list(part["value"]) for _, part in parts] == [[0, 3], [1, 4], [2, 5], [6]]
+
+
+def test_group_index_reuse_and_summary():
+    df = frame()
+    groups = GroupIndex(df["dept"])
+
+    assert len(groups) == 4 and groups.row_count == 7
+    assert list(groups.counts) == [2, 2, 2, 1]
+    assert groups.matches(df["dept"].copy())
+    assert not groups.matches(df["dept"].iloc[:-1])
+    assert not groups.matches(df[["dept"]])
+
+    reused = [list(part["value"]) for _, part in partition_frame(df, 0, groups)]
+    assert reused == [list(part["value"]) for _, part in partition_frame(df, 0)]
+
+    summary = groups.summary()
+    assert list(summary.columns) == ["dept", "행 수"]
+    assert summary["dept"].tolist() == ["B", "A", "NA", "C"]
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+from services.metrics import QueueMetrics
+from services.pipeline import map_bounded, prefetch
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def test_prefetch_keeps_order_and_bounds_queue():
+    stats = QueueMetrics("read", capacity=2)
+    produced = []
+
+    def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    items = prefetch(source(), stats, depth=2)
+    assert next(items) == 0
+    time.sleep(0.05)
+    # 꺼내지 않은 항목은 큐 크기(+ 넣으려고 기다리는 1개)까지만 미리 읽음
+    assert len(produced) <= 4
+
+    assert list(items) == list(range(1, 10))
+    assert stats.items == 10 and stats.max_depth <= 2
+    assert stats.elapsed_seconds > 0
+
+
+def test_prefetch_reraises_source_error():
+    def source():
+        yield 1
+        raise KeyError("읽기 실패")
+
+    items = prefetch(source(), QueueMetrics("read"))
+
+    assert next(items) == 1
+    with pytest.raises(KeyError):
+        next(items)
+
+
+def test_prefetch_close_stops_reader_thread():
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    items = prefetch(source(), QueueMetrics("read"), depth=1)
+    assert next(items) == 0
+    items.close()
+
+    # 제너레이터는 읽기 스레드에서 닫힘
+    assert closed.is_set()
+    assert not any(thread.name == "pipeline-read" for thread in threading.enumerate())
+
+
+def test_map_bounded_returns_results_in_order():
+    stats = QueueMetrics("write", capacity=3, workers=2)
+
+    def work(i):
+        time.sleep(0.01 * (5 - i))
+        if i == 3:
+            raise ValueError("저장 실패")
+        return i * 10
+
+    results = list(map_bounded(work, range(5), threads=2, stats=stats, max_pending=3))
+
+    assert [(item, result) for item, result, _, _ in results] == [(0, 0), (1, 10), (2, 20), (3, None), (4, 40)]
+    assert isinstance(results[3][2], ValueError)
+    assert all(seconds > 0 for _, _, _, seconds in results)
+    assert stats.items == 5 and stats.max_depth == 3
+
+
+def test_map_bounded_limits_items_taken_ahead():
+    taken = []
+
+    def items():
+        for i in range(20):
+            taken.append(i)
+            yield i
+
+    results = map_bounded(lambda i: i, items(), threads=1, stats=QueueMetrics("write"), max_pending=2)
+    next(results)
+
+    assert len(taken) == 2
+    results.close()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_io_threads_output_matches_sequential(tmp_path, streaming):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(40):
+        book.active.append([f"D{i % 5}", i])
+    book.save(folder / "pay.xlsx")
+
+    expected = ExcelParseService(str(folder), str(tmp_path / "sequential")).parse_data(
+        "pay.xlsx", 1, streaming=streaming, batch_size=7)
+    output_files = ExcelParseService(str(folder), str(tmp_path / "pipelined"), io_threads=2).parse_data(
+        "pay.xlsx", 1, streaming=streaming, batch_size=7)
+
+    assert [os.path.basename(path) for path in output_files] == [os.path.basename(path) for path in expected]
+    for path, expected_path in zip(output_files, expected):
+        pd.testing.assert_frame_equal(pd.read_excel(path), pd.read_excel(expected_path))
+    assert output_files.metrics.queues
@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+from services.readers import READERS, get_reader
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def service(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(["name", "dept", "region"] + [f"c{i}" for i in range(20)])
+    for i in range(30):
+        sheet.append([f"n{i}", f"D{i % 3}", "서울" if i % 2 else "부산"] + list(range(i, i + 20)))
+    book.save(folder / "pay.xlsx")
+    return ExcelParseService(str(folder), str(tmp_path / "output"))
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """pandas가 워크북을 연 횟수 (read_excel도 내부에서 ExcelFile로 염)"""
+    count = []
+    excel_file = pd.ExcelFile
+
+    class CountingExcelFile(excel_file):
+        def __init__(self, *args, **kwargs):
+            count.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "ExcelFile", CountingExcelFile)
+    return count
+
+
+def test_preview_reads_only_key_column_once(service, opened):
+    groups = service.preview_groups("pay.xlsx", 2)
+
+    assert len(opened) == 1
+    assert groups.column_name == "dept"
+    assert groups.row_count == 30
+    assert dict(zip(groups.uniques, groups.counts.tolist())) == {"D0": 10, "D1": 10, "D2": 10}
+
+
+def test_preview_composite_key(service):
+    groups = service.preview_groups("pay.xlsx", [3, 2])
+
+    assert groups.column_name == ["region", "dept"]
+    assert len(groups) == 6 and sum(groups.counts) == 30
+
+
+@pytest.mark.parametrize("column_num", [0, 24, [2, 2]])
+def test_preview_checks_column_numbers(service, column_num):
+    with pytest.raises(ValueError):
+        service.preview_groups("pay.xlsx", column_num)
+
+
+def test_two_phase_split_matches_single_phase(service, tmp_path):
+    expected = service.parse_data("pay.xlsx", 2)
+    expected_frames = [pd.read_excel(path) for path in expected]
+
+    groups = service.preview_groups("pay.xlsx", 2)
+    output_files = service.parse_data("pay.xlsx", 2, groups=groups)
+
+    assert [os.path.basename(path) for path in output_files] == ["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"]
+    for path, frame in zip(output_files, expected_frames):
+        pd.testing.assert_frame_equal(pd.read_excel(path), frame)
+
+
+def test_aggregate_reads_selected_columns_once(service, opened):
+    result = service.aggregate("pay.xlsx", 2, value_columns=[4])
+
+    assert len(opened) == 1
+    assert result.summary.iloc[:, 1].tolist() == [10, 10, 10]
+
+
+@pytest.mark.parametrize("name", ["openpyxl", "calamine", "arrow"])
+def test_read_selected_keeps_requested_order(service, name):
+    if not READERS[name].is_available():
+        pytest.skip(f"{name} 엔진에 필요한 패키지가 없습니다")
+    counts = []
+
+    def select(column_count):
+        counts.append(column_count)
+        return [2, 0]
+
+    df = get_reader(name).read_selected(os.path.join(service.input_folder, "pay.xlsx"), select)
+
+    assert counts == [23]
+    assert list(df.columns) == ["region", "name"]
+    assert df.iloc[0].tolist() == ["부산", "n0"]
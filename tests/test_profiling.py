@@ -0,0 +1,61 @@
+import os
+import pstats
+import threading
+
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+from services.profiling import profile_job
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def busy_in_thread():
+    total = 0
+    for i in range(20000):
+        total += i
+    return total
+
+
+def profiled_functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+def run_in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+
+
+def test_cprofile_includes_threads_started_during_job(tmp_path):
+    with profile_job("cprofile", str(tmp_path / "job")) as profile_files:
+        run_in_thread(busy_in_thread)
+
+    assert [os.path.basename(path) for path in profile_files] == ["job_profile.prof", "job_profile.txt"]
+    assert "busy_in_thread" in profiled_functions(profile_files[0])
+    assert threading.getprofile() is None
+
+
+def test_profile_is_saved_when_job_fails(tmp_path):
+    with pytest.raises(RuntimeError):
+        with profile_job("sampling", str(tmp_path / "job")) as profile_files:
+            raise RuntimeError("실패")
+
+    assert all(os.path.exists(path) for path in profile_files)
+    assert profile_files[0].endswith("job_profile.folded")
+
+
+def test_service_profile_includes_writer_threads(tmp_path):
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(30):
+        book.active.append([f"D{i % 3}", i])
+    book.save(input_folder / "pay.xlsx")
+    service = ExcelParseService(str(input_folder), str(tmp_path / "output"), io_threads=2)
+
+    result = service.parse_data("pay.xlsx", 1, profile="cprofile")
+
+    # 저장은 저장 스레드 풀에서만 실행됨
+    assert "save_frame" in profiled_functions(result.profile_files[0])
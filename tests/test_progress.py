@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+from services.errors import JobCancelledError
+from services.excel_parse_service import ExcelParseService
+from services.progress import PARTITION_DONE_PERCENT, CancellationToken, ProgressTracker
+
+openpyxl = pytest.importorskip("openpyxl")
+
+GROUPS = 6
+
+
+@pytest.fixture
+def service(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for i in range(60):
+        book.active.append([f"D{i % GROUPS}", i])
+    book.save(folder / "pay.xlsx")
+    return ExcelParseService(str(folder), str(tmp_path / "output"))
+
+
+def test_tracker_reports_write_progress():
+    events = []
+    tracker = ProgressTracker(events.append)
+    tracker.total_files = 4
+
+    tracker.file_written(100)
+    tracker.file_written(50)
+
+    assert [event.files_written for event in events] == [1, 2]
+    assert events[-1].bytes_written == 150
+    expected = PARTITION_DONE_PERCENT + (100 - PARTITION_DONE_PERCENT) / 2
+    assert events[-1].percent == int(expected) and events[-1].stage == "write"
+    assert events[-1].eta is not None and events[-1].eta >= 0
+
+
+def test_tracker_clamps_percent_and_sets_eta_at_end():
+    events = []
+    tracker = ProgressTracker(events.append)
+
+    tracker.emit("done", 120)
+    tracker.emit("read", -5)
+
+    assert [(event.percent, event.eta) for event in events] == [(100, 0.0), (0, None)]
+
+
+def test_cancellation_token():
+    token = CancellationToken()
+    token.raise_if_cancelled()
+
+    token.cancel()
+
+    assert token.cancelled
+    with pytest.raises(JobCancelledError):
+        ProgressTracker(cancel_token=token).check_cancelled()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_split_reports_progress_until_done(service, streaming):
+    events = []
+
+    output_files = service.parse_data("pay.xlsx", 1, streaming=streaming, batch_size=20,
+                                      progress_callback=events.append)
+
+    percents = [event.percent for event in events]
+    assert percents == sorted(percents) and percents[-1] == 100
+    assert events[-1].stage == "done"
+    assert {"read", "write"} <= {event.stage for event in events}
+    last = events[-1]
+    assert (last.rows_read, last.groups_discovered) == (60, GROUPS)
+    assert (last.files_written, last.total_files) == (GROUPS, GROUPS)
+    assert last.bytes_written == sum(os.path.getsize(path) for path in output_files)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_cancel_during_write_stops_job(service, streaming):
+    token = CancellationToken()
+
+    def cancel_after_first_file(event):
+        if event.files_written == 1:
+            token.cancel()
+
+    with pytest.raises(JobCancelledError):
+        service.parse_data("pay.xlsx", 1, streaming=streaming, progress_callback=cancel_after_first_file,
+                           cancel_token=token)
+
+    written = os.listdir(service.output_folder)
+    assert 1 <= len(written) < GROUPS
+    # 중단된 작업의 임시 파일은 남기지 않음
+    assert all(name.endswith(".xlsx") for name in written)
+
+
+def test_cancelled_before_start_writes_nothing(service):
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(JobCancelledError):
+        service.parse_data("pay.xlsx", 1, cancel_token=token)
+
+    assert not os.path.exists(service.output_folder) or os.listdir(service.output_folder) == []
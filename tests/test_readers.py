@@ -0,0 +1,76 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from services.readers import READERS, get_reader
+
+openpyxl = pytest.importorskip("openpyxl")
+
+HEADER = ["mixed", "text", "number", "date", "flag", "sparse"]
+ROWS = [
+    [1, "a", 1.5, datetime.datetime(2024, 1, 1), True, None],
+    [2, "b", 2, datetime.datetime(2024, 1, 2), False, "x"],
+    [3, None, None, None, None, None],
+    [True, "한글", 4, datetime.datetime(2024, 1, 3, 12, 30), True, 5],
+]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "mixed.xlsx"
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = "data"
+    sheet.append(HEADER)
+    for row in ROWS:
+        sheet.append(row)
+    other = book.create_sheet("other")
+    other.append(["name", "value"])
+    other.append(["x", 1])
+    book.save(path)
+    return str(path)
+
+
+def values(df):
+    """엔진마다 다른 빈 값 표현(NaN, NA, NaT)을 None으로 맞춘 셀 값"""
+    return [[None if pd.isna(cell) else cell for cell in row] for row in df.astype(object).itertuples(index=False)]
+
+
+def available(name):
+    if not READERS[name].is_available():
+        pytest.skip(f"{name} 엔진에 필요한 패키지가 없습니다")
+    return get_reader(name)
+
+
+@pytest.mark.parametrize("name", ["calamine", "arrow"])
+def test_engine_matches_openpyxl(workbook, name):
+    expected = get_reader("openpyxl").read(workbook)
+    df = available(name).read(workbook)
+
+    assert list(df.columns) == HEADER
+    assert values(df) == values(expected)
+    # 숫자와 문자열이 섞인 열은 값을 바꾸지 않음
+    assert values(df)[1][5] == "x" and values(df)[3][5] == 5
+
+
+def test_arrow_engine_keeps_strings_in_arrow_buffers(workbook):
+    df = available("arrow").read(workbook)
+
+    assert df["text"].dtype == "string[pyarrow]"
+    assert df["sparse"].dtype == object
+    assert df["number"].dtype == get_reader("openpyxl").read(workbook)["number"].dtype
+
+
+@pytest.mark.parametrize("name", ["openpyxl", "calamine", "arrow"])
+def test_iter_sheets_matches_read(workbook, name):
+    reader = available(name)
+    sheets = list(reader.iter_sheets(workbook, usecols=[0, 1]))
+
+    assert [sheet_name for sheet_name, _, _ in sheets] == ["data", "other"]
+    assert values(sheets[0][1]) == values(reader.read(workbook, usecols=[0, 1]))
+
+
+def test_unknown_reader():
+    with pytest.raises(ValueError):
+        get_reader("nope")
@@ -0,0 +1,140 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.excel_stream_reader import ExcelStreamReader
+from services.readers import READERS, get_reader
+from services.selection import ColumnSelection, Condition, RowFilter, parse_condition, parse_value
+
+openpyxl = pytest.importorskip("openpyxl")
+
+HEADER = ["id", "text", "mixed", "flag", "sparse", "date"]
+ROWS = [
+    [1, "서울", True, True, 1, datetime.datetime(2024, 1, 1)],
+    [2, "부산", 3, False, None, datetime.datetime(2024, 1, 2)],
+    [3, "abc", False, True, "x", None],
+    [4, None, 1, None, 10, datetime.datetime(2024, 2, 1)],
+    [5, "TRUE", "abc", False, 0.5, datetime.datetime(2024, 3, 1, 12)],
+    [6, "팀장", None, True, True, datetime.datetime(2024, 1, 1)],
+    [7, "1", 0, False, "TRUE", datetime.datetime(2023, 12, 31)],
+]
+
+# 숫자와 TRUE/FALSE가 섞인 열("mixed", "sparse")을 포함한 조건
+FILTERS = [
+    "3==1", "3==0", "3==TRUE", "3==true", "3==FALSE", "3!=1", "3 in 1,abc", "3 in 3,false", "3 contains 1",
+    "3>=1", "3<1", "3==", "3!=", "3==abc", "3 contains ab",
+    "4==TRUE", "4==1", "4!=0", "4 contains 1", "4>0", "4==",
+    "5==1", "5==TRUE", "5 in x,10", "5 contains 1", "5>=1", "5==",
+    "2==TRUE", "2==1", "2 in 서울,부산", "2 contains 장", "2>=b", "2==",
+    "6>=2024-01-02", "6==2024-01-01", "6 contains 2024-01", "6==",
+]
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory):
+    path = tmp_path_factory.mktemp("selection") / "mixed.xlsx"
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(HEADER)
+    for row in ROWS:
+        sheet.append(row)
+    book.save(path)
+    return str(path)
+
+
+def frame_ids(df, condition):
+    """DataFrame 경로 (Condition.mask)로 고른 행의 id"""
+    return list(df["id"][RowFilter([condition]).mask(df)])
+
+
+def stream_ids(path, condition):
+    """스트리밍 경로 (Condition.matches)로 고른 행의 id"""
+    matches = RowFilter([condition]).matcher()
+    with ExcelStreamReader(path) as reader:
+        return [row[0] for batch in reader.iter_batches() for row in batch if matches(row)]
+
+
+@pytest.mark.parametrize("name", ["openpyxl", "calamine", "arrow"])
+def test_frame_and_streaming_select_same_rows(workbook, name):
+    if not READERS[name].is_available():
+        pytest.skip(f"{name} 엔진에 필요한 패키지가 없습니다")
+    df = get_reader(name).read(workbook)
+
+    for condition in FILTERS:
+        assert frame_ids(df, condition) == stream_ids(workbook, condition), condition
+
+
+def test_bool_cells_compare_as_numbers(workbook):
+    assert stream_ids(workbook, "3==1") == [1, 4]
+    assert stream_ids(workbook, "3==TRUE") == [1, 4]
+    assert stream_ids(workbook, "3 in 1,abc") == [1, 4, 5]
+    assert stream_ids(workbook, "3 contains 1") == [1, 4]
+    # 문자열 셀은 입력한 글자와 비교
+    assert stream_ids(workbook, "2==TRUE") == [5]
+    assert stream_ids(workbook, "2==1") == [7]
+
+
+def test_mask_matches_cells_for_every_dtype():
+    columns = [
+        pd.Series([1, 2, None, 4], dtype="float64"),
+        pd.Series([True, False, True, False]),
+        pd.Series([True, None, False, True], dtype="boolean"),
+        pd.Series([True, 1.0, "1", None], dtype=object),
+        pd.Series(["a", "ab", None, "1"], dtype="string"),
+        pd.Series(pd.to_datetime(["2024-01-01", None, "2024-01-02", "2023-12-31"])),
+    ]
+    for text in ["1==1", "1!=1", "1==TRUE", "1 in 0,a", "1 contains 1", "1 contains a", "1>0", "1<=2024-01-01",
+                 "1==", "1!=", "1>=a"]:
+        condition = parse_condition(text)
+        for column in columns:
+            expected = [condition.matches(cell) for cell in column.astype(object)]
+            assert condition.mask(column).tolist() == expected, (text, column.dtype)
+
+
+def test_parse_condition():
+    condition = parse_condition("3 in 서울, 부산,'1'")
+    assert (condition.column, condition.op) == (3, "in")
+    assert condition.value == ["서울", "부산", "1"]
+
+    assert parse_condition("2=100").op == "=="
+    assert parse_condition("4 contains 팀").value == "팀"
+    assert str(parse_condition("5 >= 2024-01-01")) == "5>=2024-01-01"
+    with pytest.raises(ValueError):
+        parse_condition("재직")
+    with pytest.raises(ValueError):
+        parse_condition("0==1")
+    with pytest.raises(ValueError):
+        parse_condition("3>")
+    with pytest.raises(ValueError):
+        Condition(3, "~", 1)
+
+
+def test_parse_value():
+    assert parse_value("12") == 12 and isinstance(parse_value("12"), int)
+    assert parse_value("1.5e3") == 1500.0
+    assert parse_value("TRUE") == 1 and parse_value("false") == 0
+    assert parse_value("2024-01-02") == pd.Timestamp("2024-01-02")
+    assert parse_value("") is None
+    assert parse_value("'12'") == "12"
+    assert parse_value(" 재직 ") == "재직"
+
+
+def test_column_selection_reads_only_needed_columns():
+    df = pd.DataFrame({"a": [1, 2, 3], "c": ["x", "y", "x"], "e": [10, 20, 30]})
+    selection = ColumnSelection(3, output_columns=[5], row_filter=RowFilter(["1>=2"]))
+
+    assert selection.usecols == [0, 2, 4]
+    assert selection.output_width == 1 and selection.key_index == 1
+    result = selection.apply(df)
+    assert result.values.tolist() == [[20, "y"], [30, "x"]]
+
+    project, header = selection.row_projection(["A", "B", "C", "D", "E"])
+    assert header == ["E"] and project((1, 2, 3, 4, 5)) == (5,)
+
+
+def test_column_selection_checks_filter_columns():
+    selection = ColumnSelection(1, row_filter=RowFilter(["4==1"]))
+    with pytest.raises(ValueError):
+        selection.apply(pd.DataFrame({"a": [1], "b": [np.nan]}))
@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("pyarrow")
+
+
+def save_workbook(path, rows, second_sheet=False):
+    book = openpyxl.Workbook()
+    book.active.title = "data"
+    book.active.append(["dept", "region", "amount"])
+    for row in rows:
+        book.active.append(list(row))
+    if second_sheet:
+        other = book.create_sheet("other")
+        other.append(["dept", "region", "amount"])
+        other.append(["D9", "x", 9])
+    book.save(path)
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    save_workbook(folder / "pay.xlsx", [("D0", "x", 1), ("D1", "y", 2), ("D0", "y", 3)], second_sheet=True)
+    return folder
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """pandas가 워크북을 연 횟수 (read_excel과 ExcelFile)"""
+    count = []
+    excel_file = pd.ExcelFile
+    read_excel = pd.read_excel
+
+    class CountingExcelFile(excel_file):
+        def __init__(self, *args, **kwargs):
+            count.append(1)
+            super().__init__(*args, **kwargs)
+
+    def counting_read_excel(*args, **kwargs):
+        count.append(1)
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "ExcelFile", CountingExcelFile)
+    monkeypatch.setattr(pd, "read_excel", counting_read_excel)
+    return count
+
+
+def service(input_folder, tmp_path, output="output"):
+    return ExcelParseService(str(input_folder), str(tmp_path / output), cache_dir=str(tmp_path / "cache"))
+
+
+def contents(output_files):
+    return {os.path.basename(path): pd.read_excel(path)["amount"].tolist() for path in output_files}
+
+
+def test_second_run_reads_from_cache(input_folder, tmp_path, opened):
+    first = service(input_folder, tmp_path, "first").parse_data("pay.xlsx", 1)
+    assert len(opened) == 1
+
+    # 다른 기준 열, 새 서비스 객체여도 같은 캐시 폴더면 엑셀을 다시 읽지 않음
+    by_region = service(input_folder, tmp_path, "second").parse_data("pay.xlsx", 2)
+    again = service(input_folder, tmp_path, "third").parse_data("pay.xlsx", 1)
+
+    assert len(opened) == 1
+    assert contents(by_region) == {"pay_x.xlsx": [1], "pay_y.xlsx": [2, 3]}
+    assert contents(again) == contents(first)
+
+
+def test_changed_source_is_read_again(input_folder, tmp_path, opened):
+    service(input_folder, tmp_path).parse_data("pay.xlsx", 1)
+    save_workbook(input_folder / "pay.xlsx", [("D0", "x", 10), ("D2", "x", 20)])
+
+    output_files = service(input_folder, tmp_path, "changed").parse_data("pay.xlsx", 1)
+
+    assert len(opened) == 2
+    assert contents(output_files) == {"pay_D0.xlsx": [10], "pay_D2.xlsx": [20]}
+
+
+def test_sheets_are_cached_by_name(input_folder, tmp_path, opened):
+    service(input_folder, tmp_path).parse_data("pay.xlsx", 1, sheets=["data"])
+    assert len(opened) == 1
+
+    output_files = service(input_folder, tmp_path, "both").parse_data("pay.xlsx", 1, sheets=["other", "data"])
+
+    # 캐시에 없는 시트만 엑셀에서 읽음
+    assert len(opened) == 2
+    service(input_folder, tmp_path, "cached").parse_data("pay.xlsx", 1, sheets=["data", "other"])
+    assert len(opened) == 2
+    assert contents(output_files) == {"pay_D9.xlsx": [9], "pay_D0.xlsx": [1, 3], "pay_D1.xlsx": [2]}
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.excel_parse_service import ExcelParseService
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def save_workbook(path, rows):
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "amount"])
+    for row in rows:
+        book.active.append(list(row))
+    book.save(path)
+
+
+ROWS = [("D0", 1), ("D1", 2), ("D2", 3), ("D0", 4)]
+
+
+@pytest.fixture
+def service(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    save_workbook(folder / "pay.xlsx", ROWS)
+    return ExcelParseService(str(folder), str(tmp_path / "output"))
+
+
+def split(service):
+    """증분 분할 후 (출력 파일 이름 목록, 이번에 저장한 파일 수)"""
+    output_files = service.parse_data("pay.xlsx", 1, incremental=True)
+    written = output_files.metrics.stages.get("write")
+    return [os.path.basename(path) for path in output_files], written.calls if written else 0
+
+
+def test_unchanged_groups_are_not_rewritten(service):
+    assert split(service) == (["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"], 3)
+    modified = {name: os.stat(os.path.join(service.output_folder, name)).st_mtime_ns
+                for name in os.listdir(service.output_folder) if name.endswith(".xlsx")}
+
+    assert split(service) == (["pay_D0.xlsx", "pay_D1.xlsx", "pay_D2.xlsx"], 0)
+    assert {name: os.stat(os.path.join(service.output_folder, name)).st_mtime_ns
+            for name in modified} == modified
+
+
+def test_changed_group_is_rewritten_and_removed_group_deleted(service):
+    split(service)
+    save_workbook(os.path.join(service.input_folder, "pay.xlsx"), [("D0", 1), ("D1", 20), ("D0", 4)])
+
+    assert split(service) == (["pay_D0.xlsx", "pay_D1.xlsx"], 1)
+    assert not os.path.exists(os.path.join(service.output_folder, "pay_D2.xlsx"))
+    assert pd.read_excel(os.path.join(service.output_folder, "pay_D1.xlsx"))["amount"].tolist() == [20]
+
+
+def test_edited_or_missing_output_is_rewritten(service):
+    split(service)
+    os.remove(os.path.join(service.output_folder, "pay_D1.xlsx"))
+    with open(os.path.join(service.output_folder, "pay_D2.xlsx"), "ab") as f:
+        f.write(b"edited")
+
+    assert split(service)[1] == 2
+    assert pd.read_excel(os.path.join(service.output_folder, "pay_D2.xlsx"))["amount"].tolist() == [3]
+
+
+def test_other_key_column_has_its_own_manifest_entry(service):
+    split(service)
+
+    output_files = service.parse_data("pay.xlsx", 2, incremental=True)
+
+    assert len(output_files) == 4
+    # 다른 기준 열로 분할해도 기존 분할의 출력 파일은 삭제하지 않음
+    assert split(service)[1] == 0
+
+
+@pytest.mark.parametrize("options", [{"output_mode": "sheets"}, {"output_format": "parquet"}])
+def test_incremental_requires_file_output(tmp_path, options):
+    service = ExcelParseService(str(tmp_path), str(tmp_path / "output"), **options)
+
+    with pytest.raises(ValueError):
+        service.parse_data("pay.xlsx", 1, incremental=True)
+
+
+def test_incremental_is_not_supported_when_streaming(service):
+    with pytest.raises(ValueError):
+        service.parse_data("pay.xlsx", 1, incremental=True, streaming=True)
@@ -0,0 +1,102 @@
+import datetime
+import os
+
+import pandas as pd
+import pytest
+
+from services import excel_parse_service
+from services.excel_parse_service import ExcelParseService
+from services.spill import ArrowSpillWriter, CsvSpillWriter
+
+openpyxl = pytest.importorskip("openpyxl")
+
+ROWS = 600
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["dept", "int", "amount", "text", "date", "time", "flag", "sparse", "late"])
+    for i in range(ROWS):
+        book.active.append([
+            f"D{i % 3}", i, i / 4, f"t,{i}" if i % 5 else None, datetime.datetime(2024, 1, 1 + i % 28),
+            datetime.datetime(2024, 1, 1, i % 24, 30), bool(i % 2), i if i % 7 == 0 else None,
+            i if i < ROWS // 2 else f"x{i}",
+        ])
+    book.save(folder / "pay.xlsx")
+    return str(folder)
+
+
+@pytest.fixture
+def flushes(monkeypatch):
+    """CSV 작성기가 flush할 때 버퍼에 있던 행 수 (빈 flush 제외)"""
+    pending = []
+    flush = CsvSpillWriter.flush
+
+    def recording_flush(self):
+        if self.pending_rows:
+            pending.append(self.pending_rows)
+        flush(self)
+
+    monkeypatch.setattr(CsvSpillWriter, "flush", recording_flush)
+    return pending
+
+
+@pytest.mark.parametrize("options", [{"batch_size": 7}, {"batch_size": 1000, "memory_budget": 20000}])
+def test_streaming_csv_matches_in_memory(input_folder, tmp_path, options):
+    expected = ExcelParseService(input_folder, str(tmp_path / "memory"), output_format="csv")
+    streaming = ExcelParseService(input_folder, str(tmp_path / "streaming"), output_format="csv")
+
+    expected_files = expected.parse_data("pay.xlsx", 1)
+    output_files = streaming.parse_data("pay.xlsx", 1, streaming=True, **options)
+
+    assert [os.path.basename(path) for path in output_files] == [os.path.basename(path) for path in expected_files]
+    for path, expected_path in zip(output_files, expected_files):
+        with open(path, "rb") as f, open(expected_path, "rb") as expected_file:
+            assert f.read() == expected_file.read()
+    assert sorted(os.listdir(tmp_path / "streaming")) == ["pay_D0.csv", "pay_D1.csv", "pay_D2.csv"]
+
+
+def test_memory_budget_limits_buffered_rows(input_folder, tmp_path, monkeypatch, flushes):
+    # 행당 100 bytes로 보면 예산 20000 bytes -> 그룹 버퍼 최대 100행
+    monkeypatch.setattr(excel_parse_service, "estimate_row_bytes", lambda rows: 100)
+    service = ExcelParseService(input_folder, str(tmp_path / "output"), output_format="csv")
+
+    service.parse_data("pay.xlsx", 1, streaming=True, batch_size=50, memory_budget=20000)
+
+    # 버퍼가 예산을 넘을 때만 (3묶음 = 150행마다) 모든 그룹을 내보냄
+    assert sum(flushes) == ROWS
+    assert len(flushes) == 12
+    assert sum(flushes[:3]) == 150
+
+
+def test_streaming_without_budget_spills_every_batch(input_folder, tmp_path, flushes):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"), output_format="csv")
+
+    service.parse_data("pay.xlsx", 1, streaming=True, batch_size=50)
+
+    assert len(flushes) == 36 and sum(flushes) == ROWS
+
+
+def test_arrow_spill_keeps_written_batches(tmp_path):
+    pytest.importorskip("pyarrow")
+    writer = ArrowSpillWriter(str(tmp_path / "part-0.parquet"), ["id", "value", "amount"], "parquet")
+    writer.append((1, 10, None))
+    writer.append((2, 20, 1))
+    writer.flush()
+    with open(writer._spill_path, "rb") as f:
+        spilled = f.read()
+
+    # 정수 열에 문자열/실수가 나와도 이미 쓴 spill 내용은 다시 쓰지 않음
+    writer.append((3, "x", 1.5))
+    writer.flush()
+    with open(writer._spill_path, "rb") as f:
+        assert f.read().startswith(spilled)
+    writer.close()
+
+    df = pd.read_parquet(tmp_path / "part-0.parquet")
+    assert df["value"].tolist() == ["10", "20", "x"]
+    assert df["amount"].tolist()[1:] == [1.0, 1.5] and df["amount"].dtype == "float64"
+    assert df["id"].tolist() == [1, 2, 3]
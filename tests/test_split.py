@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_partition import legacy_partition, make_frame
+from services.excel_parse_service import ExcelParseService
+from services.partitioner import partition_frame
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def test_single_pass_matches_mask_per_group():
+    df = make_frame(3000, 400)
+
+    parts = list(partition_frame(df, 0))
+    expected = list(legacy_partition(df, 0))
+
+    assert [value for value, _ in parts] == [value for value, _ in expected]
+    for (_, part), (_, expected_part) in zip(parts, expected):
+        pd.testing.assert_frame_equal(part, expected_part)
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    folder = tmp_path / "input"
+    folder.mkdir()
+    book = openpyxl.Workbook()
+    book.active.append(["name", "dept", "code"])
+    for i, (dept, code) in enumerate([("A", 1), (None, 2), ("B", 1), ("A", None), (None, 3), ("B", 2)]):
+        book.active.append([f"n{i}", dept, code])
+    book.save(folder / "pay.xlsx")
+    return str(folder)
+
+
+def test_parse_data_writes_one_file_per_value(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", 2)
+
+    # 처음 등장한 순서, 빈 값은 NA 파일 하나로 모으고 그룹 안에서는 원래 행 순서
+    assert [os.path.basename(path) for path in output_files] == ["pay_A.xlsx", "pay_NA.xlsx", "pay_B.xlsx"]
+    assert [pd.read_excel(path)["name"].tolist() for path in output_files] == [
+        ["n0", "n3"], ["n1", "n4"], ["n2", "n5"]]
+    assert output_files.metrics.stages["partition"].rows == 6
+
+
+def test_parse_data_numeric_keys(input_folder, tmp_path):
+    service = ExcelParseService(input_folder, str(tmp_path / "output"))
+
+    output_files = service.parse_data("pay.xlsx", 3)
+
+    assert [os.path.basename(path) for path in output_files] == [
+        "pay_1.0.xlsx", "pay_2.0.xlsx", "pay_NA.xlsx", "pay_3.0.xlsx"]
+    assert sum(len(pd.read_excel(path)) for path in output_files) == 6
+    assert np.isnan(pd.read_excel(output_files[2])["code"][0])
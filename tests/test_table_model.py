@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QModelIndex, Qt  # noqa: E402
+
+from ui.table_model import DataFrameTableModel  # noqa: E402
+
+
+def big_frame(rows):
+    return pd.DataFrame({"dept": [f"D{i % 7}" for i in range(rows)], "amount": np.arange(rows, dtype="int64")})
+
+
+def test_rows_are_fetched_in_blocks():
+    df = big_frame(2500)
+    model = DataFrameTableModel(df)
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    assert model.frame is df
+    assert (model.rowCount(), model.columnCount()) == (1000, 2)
+    while model.canFetchMore():
+        model.fetchMore()
+
+    assert inserted == [(1000, 1999), (2000, 2499)]
+    assert model.rowCount() == 2500 and not model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 2500
+
+
+def test_data_reads_cells_on_demand():
+    df = pd.DataFrame({"dept": ["A", None, "C"], "amount": [1.5, np.nan, 3.0], "when": [pd.NaT] * 3})
+    model = DataFrameTableModel(df, formatters={0: lambda value: f"<{value}>"})
+
+    def cell(row, column, role=Qt.DisplayRole):
+        return model.data(model.index(row, column), role)
+
+    assert [cell(0, 0), cell(0, 1), cell(1, 1), cell(2, 2)] == ["<A>", "1.5", "", ""]
+    assert cell(0, 1, Qt.TextAlignmentRole) == int(Qt.AlignRight | Qt.AlignVCenter)
+    assert cell(0, 0, Qt.TextAlignmentRole) == int(Qt.AlignLeft | Qt.AlignVCenter)
+    # 데이터프레임 값을 바꾸면 다시 읽을 때 바로 반영 (복사하지 않음)
+    df.iat[2, 1] = 9.0
+    assert cell(2, 1) == "9.0"
+    assert model.headerData(1, Qt.Horizontal) == "amount" and model.headerData(0, Qt.Vertical) == "1"
+    assert model.data(QModelIndex()) is None
+
+
+def test_set_frame_resets_model():
+    model = DataFrameTableModel()
+    assert (model.rowCount(), model.columnCount(), model.canFetchMore()) == (0, 0, False)
+
+    model.set_frame(big_frame(10))
+
+    assert (model.rowCount(), model.columnCount()) == (10, 2)
+    assert not model.canFetchMore()